@@ -17,17 +17,24 @@ setup(
 
     packages=find_packages(exclude=["tests", "tests.*"]),
     package_data={
-        'vigilio_client': ['*.proto'],
+        'vigilio_client': ['*.proto', '*.pyi'],
     },
 
 
     install_requires=[
-        "grpcio>=1.50.0",
-        "protobuf>=4.0.0",
+        # vigilio_pb2*.py check these runtime versions at import
+        "grpcio>=1.76.0",
+        "protobuf>=6.31.1",
         'djangorestframework>=3.15.0',
         'pandas>=2.3.0',
         'openpyxl>=3.1.0',
     ],
+    extras_require={
+        'fast': ['python-calamine>=0.2.0', 'pyarrow>=14.0.0', 'orjson>=3.9.0'],
+        # Async cache_page needs Django 5.0, cache.aget/aset 4.0
+        'async': ['adrf>=0.1.6', 'Django>=5.0'],
+        'metrics': ['prometheus_client>=0.16.0'],
+    },
 
 
     python_requires=">=3.10",
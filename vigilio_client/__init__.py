@@ -1 +1,22 @@
-from .client import VigilioClient
\ No newline at end of file
+import importlib.util
+import os
+import warnings
+
+# Parse messages with the compiled upb backend rather than pure Python; must
+# be set before the first generated *_pb2 module is imported
+if importlib.util.find_spec('google._upb') is not None:
+    os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
+from google.protobuf.internal import api_implementation
+
+if api_implementation.Type() == 'python':
+    warnings.warn(
+        "vigilio_client is running on the pure-Python protobuf implementation, "
+        "which decodes large responses many times slower. Install a protobuf "
+        ">= 4.21 wheel (ships the upb backend) for your platform.",
+        RuntimeWarning,
+    )
+
+from .client import VigilioClient
+from .aio import AsyncVigilioClient
+from .conf import get_default_client
\ No newline at end of file
@@ -0,0 +1,388 @@
+"""
+Vigilio asyncio gRPC Client Class
+
+Coroutine counterpart of the core VigilioClient methods, built on
+grpc.aio. All RPCs share a single HTTP/2 connection, so independent calls
+can be awaited concurrently.
+
+Usage:
+    import asyncio
+    from vigilio_client.aio import AsyncVigilioClient
+
+    async def main():
+        async with AsyncVigilioClient('127.0.0.1:50051') as client:
+            fund_types, shareholders = await asyncio.gather(
+                client.get_fund_types(),
+                client.list_shareholders(),
+            )
+
+    asyncio.run(main())
+"""
+
+import asyncio
+from collections.abc import Mapping
+
+import grpc
+from . import vigilio_pb2
+from . import vigilio_pb2_grpc
+from .client import (
+    DEFAULT_CHANNEL_OPTIONS,
+    _FUND_TYPES_REQUEST,
+    _RequestBuilder,
+    _load_credentials,
+    _Row,
+    _rows_to_dicts,
+    _shareholder_for_date_to_dict,
+    _summary_columns_to_dicts,
+    _shareholder_detail_to_dict,
+    _nav_trend_to_dict,
+)
+from typing import Optional, List, Dict, Any, AsyncIterator, Union
+
+
+class AsyncVigilioClient(_RequestBuilder):
+    """
+    asyncio client class for Vigilio gRPC service
+
+    Covers a subset of VigilioClient; the methods it has take the same
+    arguments and return the same values, but are coroutines (the
+    iter_*_excel ones resolve to async iterators). Supported:
+    get_fund_types, list_shareholders, get_shareholders_summary,
+    get_shareholders_summaries, export_shareholders_summary_excel,
+    iter_shareholders_summary_excel, get_shareholder_for_date,
+    get_shareholder_detail, export_shareholder_excel,
+    iter_shareholder_excel, list_cash_flows, get_cash_flow_detail,
+    list_total_returns, list_etf_returns, get_nav_trend, get_splits,
+    get_profits, get_prices and ping.
+
+    Not available here: the iter_* list streams, iter_shareholder_detail,
+    get_shareholder_details_batch, get_fund_bundle, the prefetch_*,
+    save_*_excel, read_shareholder_excel and *_df helpers, the client-side
+    lookup cache (there is no cache_ttl/ttl=), the channel pool and retries.
+
+    Attributes:
+        host (str): gRPC server host and port (e.g., '127.0.0.1:50051')
+        timeout (float): Default deadline in seconds for RPCs
+        channel: grpc.aio channel connection
+        stub: gRPC service stub
+    """
+
+    def __init__(self, host: str = '127.0.0.1:50051', secure: bool = False,
+                 credentials_path: Optional[str] = None,
+                 timeout: Optional[float] = 30.0):
+        """
+        Initialize the Vigilio asyncio gRPC client
+
+        Args:
+            host: Server host and port (default: '127.0.0.1:50051')
+            secure: Use secure connection (SSL/TLS) (default: False)
+            credentials_path: Path to SSL credentials if secure=True
+            timeout: Default deadline in seconds for RPCs; None waits
+                forever. Every RPC method also accepts timeout= to override
+                it per call (default: 30)
+        """
+        self.host = host
+        self.secure = secure
+        self.timeout = timeout
+
+        if secure and credentials_path:
+            credentials = _load_credentials(credentials_path)
+            self.channel = grpc.aio.secure_channel(
+                host, credentials, options=DEFAULT_CHANNEL_OPTIONS,
+                compression=grpc.Compression.Gzip
+            )
+        else:
+            self.channel = grpc.aio.insecure_channel(
+                host, options=DEFAULT_CHANNEL_OPTIONS,
+                compression=grpc.Compression.Gzip
+            )
+
+        self.stub = vigilio_pb2_grpc.VigilioServiceStub(self.channel)
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close channel"""
+        await self.close()
+
+    async def close(self):
+        """Close the gRPC channel"""
+        if self.channel:
+            await self.channel.close()
+
+    def _deadline(self, timeout: Optional[float]) -> Optional[float]:
+        """Per-call timeout, or the client's default when none was given"""
+        return self.timeout if timeout is None else timeout
+
+    @staticmethod
+    def _reusable_request(message_class):
+        # grpc.aio serializes a request only after the calling coroutine
+        # yields, so instances can't be recycled between calls here
+        return message_class()
+
+    @staticmethod
+    async def _iter_excel_stream(call) -> Optional[AsyncIterator[bytes]]:
+        """
+        Async counterpart of VigilioClient._iter_excel_stream
+
+        Awaits the first chunk before returning, so a failed RPC raises
+        here; returns None when the streaming RPC is not implemented or
+        sends no chunks.
+        """
+        chunks = call.__aiter__()
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            return None
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return None
+            raise
+
+        async def relay():
+            yield first.chunk
+            async for msg in chunks:
+                yield msg.chunk
+        return relay()
+
+    @staticmethod
+    async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+        yield data
+
+
+    async def get_fund_types(self, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
+        """Get all fund types"""
+        request = _FUND_TYPES_REQUEST
+        response = await self.stub.GetFundTypes(request, timeout=self._deadline(timeout))
+
+        return list(map(_Row, response.fund_types))
+
+
+    async def list_shareholders(self, fund_type: Optional[str] = None,
+                                limit: Optional[int] = None,
+                                offset: int = 0,
+                                timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
+        """Get list of all shareholders (names and IDs only)"""
+        request = self._shareholder_list_request(fund_type, limit, offset)
+        response = await self.stub.ListShareHolders(request, timeout=self._deadline(timeout))
+
+        return list(map(_Row, response.shareholders))
+
+    async def get_shareholders_summary(self, date: Optional[str] = None,
+                                       fund_type: Optional[str] = None,
+                                       search: Optional[str] = None,
+                                       ordering: Optional[str] = None,
+                                       limit: Optional[int] = None,
+                                       offset: int = 0, raw: bool = False,
+                                       columnar: bool = False,
+                                       timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ShareHolderSummaryListResponse]:
+        """Get shareholders summary with aggregated data"""
+        request = self._summary_list_request(date, fund_type, search, ordering, limit, offset)
+        if columnar and not raw:
+            try:
+                return _summary_columns_to_dicts(await self.stub.ShareHoldersSummaryColumns(request, timeout=self._deadline(timeout)))
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+        response = await self.stub.ShareHoldersSummary(request, timeout=self._deadline(timeout))
+
+        if raw:
+            return response
+        if columnar:
+            return _rows_to_dicts(list(map(_Row, response.shareholders)))
+        return list(map(_Row, response.shareholders))
+
+    async def get_shareholders_summaries(self, fund_types: List[str],
+                                         date: Optional[str] = None,
+                                         search: Optional[str] = None,
+                                         ordering: Optional[str] = None,
+                                         timeout: Optional[float] = None) -> Dict[str, List[Mapping[str, Any]]]:
+        """Get shareholders summaries for several fund types concurrently"""
+        summaries = await asyncio.gather(*(
+            self.get_shareholders_summary(date=date, fund_type=fund_type,
+                                          search=search, ordering=ordering,
+                                          timeout=timeout)
+            for fund_type in fund_types
+        ))
+
+        return dict(zip(fund_types, summaries))
+
+    async def export_shareholders_summary_excel(self, fund_type: str,
+                                                date: Optional[str] = None,
+                                                timeout: Optional[float] = None) -> bytes:
+        """Export shareholders summary to Excel"""
+        request = self._summary_export_request(fund_type, date)
+        chunks = await self._iter_excel_stream(self.stub.StreamExportShareHoldersSummaryExcel(request, timeout=self._deadline(timeout)))
+        if chunks is not None:
+            return b''.join([chunk async for chunk in chunks])
+
+        response = await self.stub.ExportShareHoldersSummaryExcel(request, timeout=self._deadline(timeout))
+
+        return response.excel_data
+
+    async def iter_shareholders_summary_excel(self, fund_type: str,
+                                              date: Optional[str] = None,
+                                              timeout: Optional[float] = None) -> AsyncIterator[bytes]:
+        """Export shareholders summary to Excel as an async stream of byte chunks"""
+        request = self._summary_export_request(fund_type, date)
+        chunks = await self._iter_excel_stream(self.stub.StreamExportShareHoldersSummaryExcel(request, timeout=self._deadline(timeout)))
+        if chunks is not None:
+            return chunks
+
+        response = await self.stub.ExportShareHoldersSummaryExcel(request, timeout=self._deadline(timeout))
+
+        return self._single_chunk(response.excel_data)
+
+
+    async def get_shareholder_for_date(self, shareholder_id: int,
+                                       date: Optional[str] = None,
+                                       fund_type: Optional[str] = None,
+                                       raw: bool = False,
+                                       timeout: Optional[float] = None) -> Union[Dict[str, Any], vigilio_pb2.ShareHolderForDateResponse]:
+        """Get shareholder details for a specific date"""
+        request = self._for_date_request(shareholder_id, date, fund_type)
+        response = await self.stub.GetShareHolderForDate(request, timeout=self._deadline(timeout))
+
+        if raw:
+            return response
+        return _shareholder_for_date_to_dict(response)
+
+    async def get_shareholder_detail(self, shareholder_id: int,
+                                     fund: Optional[str] = None,
+                                     as_numpy: bool = False, raw: bool = False,
+                                     timeout: Optional[float] = None) -> Union[Dict[str, Any], vigilio_pb2.GetShareHolderDetailResponse]:
+        """Get detailed shareholder information with fund filtering and chart data"""
+        request = self._detail_request(shareholder_id, fund)
+        response = await self.stub.GetShareHolderDetail(request, timeout=self._deadline(timeout))
+
+        if raw:
+            return response
+        return _shareholder_detail_to_dict(response, as_numpy=as_numpy)
+
+    async def export_shareholder_excel(self, shareholder_id: int,
+                                       fund: Optional[str] = None,
+                                       timeout: Optional[float] = None) -> bytes:
+        """Export specific shareholder data to Excel"""
+        request = self._export_request(shareholder_id, fund)
+        chunks = await self._iter_excel_stream(self.stub.StreamExportShareHolderExcel(request, timeout=self._deadline(timeout)))
+        if chunks is not None:
+            return b''.join([chunk async for chunk in chunks])
+
+        response = await self.stub.ExportShareHolderExcel(request, timeout=self._deadline(timeout))
+
+        return response.excel_file
+
+    async def iter_shareholder_excel(self, shareholder_id: int,
+                                     fund: Optional[str] = None,
+                                     timeout: Optional[float] = None) -> AsyncIterator[bytes]:
+        """Export specific shareholder data to Excel as an async stream of byte chunks"""
+        request = self._export_request(shareholder_id, fund)
+        chunks = await self._iter_excel_stream(self.stub.StreamExportShareHolderExcel(request, timeout=self._deadline(timeout)))
+        if chunks is not None:
+            return chunks
+
+        response = await self.stub.ExportShareHolderExcel(request, timeout=self._deadline(timeout))
+
+        return self._single_chunk(response.excel_file)
+
+
+    async def list_cash_flows(self, start_date: str, end_date: str,
+                              institute_kind: Optional[str] = None,
+                              limit: Optional[int] = None, offset: int = 0,
+                              raw: bool = False,
+                              timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ListCashFlowsResponse]:
+        """Get cash flow summary for multiple funds"""
+        request = self._cash_flows_request(start_date, end_date, institute_kind, limit, offset)
+        response = await self.stub.ListCashFlows(request, timeout=self._deadline(timeout))
+
+        if raw:
+            return response
+        return list(map(_Row, response.cash_flows))
+
+    async def get_cash_flow_detail(self, fund_id: int, start_date: str, end_date: str,
+                                   fund_type: str, institute_kind: Optional[str] = None,
+                                   timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
+        """Get detailed cash flow for a specific fund"""
+        request = self._cash_flow_detail_request(fund_id, start_date, end_date, fund_type, institute_kind)
+        response = await self.stub.GetCashFlowDetail(request, timeout=self._deadline(timeout))
+
+        return list(map(_Row, response.cash_flows))
+
+    async def list_total_returns(self, fund_type: Optional[str] = None,
+                                 fund_id: Optional[int] = None,
+                                 institute_kind: Optional[str] = None,
+                                 date: Optional[str] = None,
+                                 limit: Optional[int] = None, offset: int = 0,
+                                 raw: bool = False,
+                                 timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ListTotalReturnsResponse]:
+        """Get total returns for all funds"""
+        request = self._total_returns_request(fund_type, fund_id, institute_kind, date, limit, offset)
+        response = await self.stub.ListTotalReturns(request, timeout=self._deadline(timeout))
+
+        if raw:
+            return response
+        return list(map(_Row, response.returns))
+
+    async def list_etf_returns(self, fund_id: Optional[int] = None,
+                               institute_kind: Optional[str] = None,
+                               date: Optional[str] = None,
+                               limit: Optional[int] = None, offset: int = 0,
+                               raw: bool = False,
+                               timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ListEtfReturnsResponse]:
+        """Get ETF returns"""
+        request = self._etf_returns_request(fund_id, institute_kind, date, limit, offset)
+        response = await self.stub.ListEtfReturns(request, timeout=self._deadline(timeout))
+
+        if raw:
+            return response
+        return list(map(_Row, response.returns))
+
+    async def get_nav_trend(self, fund_id: int, as_numpy: bool = False, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Get NAV trend data for a specific fund"""
+        request = self._fund_request(vigilio_pb2.GetNavTrendRequest, fund_id)
+        response = await self.stub.GetNavTrend(request, timeout=self._deadline(timeout))
+
+        return _nav_trend_to_dict(response, as_numpy=as_numpy)
+
+    async def get_splits(self, fund_id: int, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
+        """Get fund splits for a specific fund"""
+        request = self._fund_request(vigilio_pb2.GetSplitsRequest, fund_id)
+        response = await self.stub.GetSplits(request, timeout=self._deadline(timeout))
+
+        return list(map(_Row, response.splits))
+
+    async def get_profits(self, fund_id: int, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
+        """Get fund profits/dividends for a specific fund"""
+        request = self._fund_request(vigilio_pb2.GetProfitsRequest, fund_id)
+        response = await self.stub.GetProfits(request, timeout=self._deadline(timeout))
+
+        return list(map(_Row, response.profits))
+
+    async def get_prices(self, fund_id: int, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
+        """Get ETF close prices for a specific fund"""
+        request = self._fund_request(vigilio_pb2.GetPricesRequest, fund_id)
+        response = await self.stub.GetPrices(request, timeout=self._deadline(timeout))
+
+        return list(map(_Row, response.prices))
+
+
+    async def ping(self, timeout: Optional[float] = 1.0) -> bool:
+        """
+        Test connection to server
+
+        Args:
+            timeout: Seconds to wait for the server (default: 1)
+
+        Returns:
+            True if connection successful, False otherwise
+        """
+        try:
+            await self.get_fund_types(timeout=timeout)
+            return True
+        except Exception:
+            return False
+
+    def __repr__(self):
+        return f"AsyncVigilioClient(host='{self.host}', secure={self.secure})"
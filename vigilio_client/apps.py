@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class VigilioClientConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'vigilio_client'
-    verbose_name = 'Vigilio Client'
\ No newline at end of file
+    verbose_name = 'Vigilio Client'
+
+    def ready(self):
+        from .serializers import warm_up_serializers
+        warm_up_serializers()
@@ -0,0 +1,27 @@
+from django.urls import path, include
+from rest_framework.routers import DefaultRouter
+from .views import (
+    FundDetailViewSet
+)
+from .async_views import (
+    FundTypeViewSet,
+    ShareHolderViewSet,
+    CashFlowViewSet,
+    TotalReturnViewSet,
+    EtfReturnViewSet
+)
+
+app_name = 'vigilio_client'
+
+# Path converters hand viewsets typed lookups (e.g. an int pk)
+router = DefaultRouter(use_regex_path=False)
+router.register(r'fund-types', FundTypeViewSet, basename='fund-type')
+router.register(r'shareholders', ShareHolderViewSet, basename='shareholder')
+router.register(r'cashflow', CashFlowViewSet, basename='cash-flow')
+router.register(r'total_return', TotalReturnViewSet, basename='total-return')
+router.register(r'etf_return', EtfReturnViewSet, basename='etf-return')
+router.register(r'watchlist', FundDetailViewSet, basename='watchlist')
+
+urlpatterns = [
+    path('', include(router.urls)),
+]
@@ -0,0 +1,395 @@
+"""
+Async versions of the Vigilio REST views, for ASGI deployments
+
+While a view awaits its gRPC call the worker's event loop keeps serving
+other requests, so one worker handles many slow RPCs at once. Requires
+adrf (pip install vigilio_client[async]); route them with
+vigilio_client.async_urls.
+"""
+
+from django.core.cache import cache
+from rest_framework import status, permissions
+from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.response import Response
+
+try:
+    from adrf import viewsets as adrf_viewsets
+except ImportError:
+    raise ImportError("adrf is required for the async views. Install with: pip install adrf")
+
+from .conf import get_default_async_client
+from .renderers import ORJSONRenderer
+from .pagination import RPCLimitOffsetPagination
+from .serializers import (
+    ShareHolderForDateSerializer,
+    ShareHolderDetailSerializer,
+    ShareHolderSummaryQuerySerializer,
+    FundIdQuerySerializer,
+)
+from .views import (
+    EXCEL_CACHE_MAX_BYTES,
+    EXCEL_CACHE_TIMEOUT,
+    FUND_TYPES_CACHE_TIMEOUT,
+    SUMMARY_CACHE_TIMEOUT,
+    _as_dicts,
+    _cached_excel_response,
+    _excel_cache_key,
+    _invalid_query_response,
+    _list_response,
+    _streaming_excel_response,
+    conditional_get,
+    grpc_error_handler,
+    private_cache_page,
+)
+
+
+async def _caching_excel_stream(chunks, cache_key):
+    """Async counterpart of views._caching_excel_stream"""
+    parts, size = [], 0
+    async for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size <= EXCEL_CACHE_MAX_BYTES:
+                parts.append(chunk)
+            else:
+                parts = None
+        yield chunk
+    if parts is not None:
+        await cache.aset(cache_key, b''.join(parts), EXCEL_CACHE_TIMEOUT)
+
+
+class FundTypeViewSet(adrf_viewsets.ViewSet):
+    """
+    ViewSet for Fund Types
+
+    list: GET /vigilio/fund-types/
+    """
+    http_method_names = ['get']
+    permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+
+    @conditional_get
+    @private_cache_page(FUND_TYPES_CACHE_TIMEOUT)
+    @grpc_error_handler
+    async def list(self, request):
+        """Get all fund types"""
+        client = get_default_async_client()
+        fund_types = await client.get_fund_types()
+        return Response(_as_dicts(fund_types))
+
+
+class ShareHolderViewSet(adrf_viewsets.ViewSet):
+    """
+    ViewSet for ShareHolders
+
+    list: GET /vigilio/shareholders/?fund_type=<fund_type>
+    retrieve: GET /vigilio/shareholders/<id>/?fund=<fund>
+    summary: GET /vigilio/shareholders/summary/?date=<date>&fund_type=<fund_type>&search=<search>&ordering=<ordering>
+    summary_multi: GET /vigilio/shareholders/summary_multi/?fund_types=<fund_type>,<fund_type>&date=<date>&search=<search>&ordering=<ordering>
+    summary_excel: GET /vigilio/shareholders/summary_excel/?fund_type=<fund_type>&date=<date>
+    for_date: GET /vigilio/shareholders/<id>/for_date/?date=<date>&fund_type=<fund_type>
+    excel: GET /vigilio/shareholders/<id>/excel/?fund=<fund>
+    """
+    http_method_names = ['get']
+    permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    lookup_value_converter = 'int'
+
+    @conditional_get
+    @grpc_error_handler
+    async def list(self, request):
+        """
+        List all shareholders
+        Query params: fund_type (optional)
+        """
+        fund_type = request.query_params.get('fund_type', None)
+
+        client = get_default_async_client()
+        shareholders = await client.list_shareholders(fund_type=fund_type)
+        return Response(_as_dicts(shareholders))
+
+    @conditional_get
+    @grpc_error_handler
+    async def retrieve(self, request, pk=None):
+        """
+        Get detailed shareholder information with chart data
+        Query params: fund (optional)
+        """
+        fund = request.query_params.get('fund', None)
+
+        client = get_default_async_client()
+        detail = await client.get_shareholder_detail(
+            shareholder_id=pk,
+            fund=fund
+        )
+        serializer = ShareHolderDetailSerializer(detail)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'])
+    @conditional_get
+    @private_cache_page(SUMMARY_CACHE_TIMEOUT)
+    @grpc_error_handler
+    async def summary(self, request):
+        """
+        Get shareholders summary with aggregated data
+        Query params: date, fund_type, search, ordering (all optional)
+        """
+        query = ShareHolderSummaryQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+
+        client = get_default_async_client()
+        summary = await client.get_shareholders_summary(**query.validated_data, columnar=True)
+        return Response(summary)
+
+    @action(detail=False, methods=['get'], url_path='summary_multi')
+    @conditional_get
+    @private_cache_page(SUMMARY_CACHE_TIMEOUT)
+    @grpc_error_handler
+    async def summary_multi(self, request):
+        """
+        Get shareholders summaries for several fund types in one request
+        Query params: fund_types (required, comma-separated), date, search, ordering (optional)
+        """
+        fund_types = [ft for ft in request.query_params.get('fund_types', '').split(',') if ft]
+        if not fund_types:
+            return Response(
+                {'error': 'fund_types query parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        query = ShareHolderSummaryQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+        params = dict(query.validated_data)
+        params.pop('fund_type', None)
+
+        client = get_default_async_client()
+        summaries = await client.get_shareholders_summaries(fund_types, **params)
+        return Response({fund_type: _as_dicts(rows) for fund_type, rows in summaries.items()})
+
+    @action(detail=False, methods=['get'], url_path='summary_excel')
+    @grpc_error_handler
+    async def summary_excel(self, request):
+        """
+        Export shareholders summary to Excel
+        Query params: fund_type (required), date (optional)
+        """
+        fund_type = request.query_params.get('fund_type')
+        date = request.query_params.get('date', None)
+
+        if not fund_type:
+            return Response(
+                {'error': 'fund_type query parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        filename = f'shareholders_summary_{fund_type}.xlsx'
+        cache_key = _excel_cache_key('summary', fund_type, date)
+        excel_data = await cache.aget(cache_key)
+        if excel_data is not None:
+            return _cached_excel_response(request, excel_data, filename)
+
+        client = get_default_async_client()
+        excel_chunks = await client.iter_shareholders_summary_excel(
+            fund_type=fund_type,
+            date=date
+        )
+        return _streaming_excel_response(_caching_excel_stream(excel_chunks, cache_key), filename)
+
+    @action(detail=True, methods=['get'], url_path='for_date')
+    @conditional_get
+    @grpc_error_handler
+    async def for_date(self, request, pk=None):
+        """
+        Get shareholder details for a specific date
+        Query params: date, fund_type (both optional)
+        """
+        date = request.query_params.get('date', None)
+        fund_type = request.query_params.get('fund_type', None)
+
+        client = get_default_async_client()
+        shareholder = await client.get_shareholder_for_date(
+            shareholder_id=pk,
+            date=date,
+            fund_type=fund_type
+        )
+        serializer = ShareHolderForDateSerializer(shareholder)
+        return Response(serializer.data)
+
+    @action(detail=True, methods=['get'])
+    @grpc_error_handler
+    async def excel(self, request, pk=None):
+        """
+        Export specific shareholder data to Excel
+        Query params: fund (optional)
+        """
+        fund = request.query_params.get('fund', None)
+
+        filename = f'shareholder_{pk}.xlsx'
+        cache_key = _excel_cache_key('shareholder', pk, fund)
+        excel_data = await cache.aget(cache_key)
+        if excel_data is not None:
+            return _cached_excel_response(request, excel_data, filename)
+
+        client = get_default_async_client()
+        excel_chunks = await client.iter_shareholder_excel(
+            shareholder_id=pk,
+            fund=fund
+        )
+        return _streaming_excel_response(_caching_excel_stream(excel_chunks, cache_key), filename)
+
+
+class CashFlowViewSet(adrf_viewsets.GenericViewSet):
+    """
+    ViewSet for Cash Flows
+
+    list: GET /vigilio/cash-flows/?start_date=<start_date>&end_date=<end_date>&institute_kind=<institute_kind>
+    detail: GET /vigilio/cash-flows/<fund_id>/detail/?start_date=<start_date>&end_date=<end_date>&fund_type=<fund_type>&institute_kind=<institute_kind>
+    """
+    http_method_names = ['get']
+    permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    pagination_class = RPCLimitOffsetPagination
+    lookup_value_converter = 'int'
+
+    def get_queryset(self):
+        return []
+
+    @grpc_error_handler
+    async def list(self, request):
+        """
+        List cash flows summary for all funds
+        Query params: start_date (required), end_date (required), institute_kind (optional)
+        """
+        start_date = request.query_params.get('start_date')
+        end_date = request.query_params.get('end_date')
+        institute_kind = request.query_params.get('institute_kind', None)
+
+        if not start_date or not end_date:
+            return Response(
+                {'error': 'start_date and end_date query parameters are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        limit, offset = self.paginator.rpc_limit_offset(request)
+        client = get_default_async_client()
+        response = await client.list_cash_flows(
+            start_date=start_date,
+            end_date=end_date,
+            institute_kind=institute_kind,
+            limit=limit,
+            offset=offset,
+            raw=True
+        )
+        return _list_response(self, request, response.cash_flows, response)
+
+    @grpc_error_handler
+    async def retrieve(self, request, pk=None):
+        """
+        Get detailed cash flow for a specific fund
+        Query params: start_date (required), end_date (required), fund_type (required), institute_kind (optional)
+        """
+        start_date = request.query_params.get('start_date')
+        end_date = request.query_params.get('end_date')
+        fund_type = request.query_params.get('fund_type')
+        institute_kind = request.query_params.get('institute_kind', None)
+
+        if not start_date or not end_date or not fund_type:
+            return Response(
+                {'error': 'start_date, end_date, and fund_type query parameters are required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        client = get_default_async_client()
+        cash_flow_detail = await client.get_cash_flow_detail(
+            fund_id=pk,
+            start_date=start_date,
+            end_date=end_date,
+            fund_type=fund_type,
+            institute_kind=institute_kind
+        )
+        return Response(_as_dicts(cash_flow_detail))
+
+
+class TotalReturnViewSet(adrf_viewsets.GenericViewSet):
+    """
+    ViewSet for Total Returns
+
+    list: GET /vigilio/total-returns/?fund_type=<fund_type>&fund_id=<fund_id>&institute_kind=<institute_kind>&date=<date>
+    """
+    http_method_names = ['get']
+    permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    pagination_class = RPCLimitOffsetPagination
+
+    def get_queryset(self):
+        return []
+
+    @grpc_error_handler
+    async def list(self, request):
+        """
+        List total returns for all funds
+        Query params: fund_type, fund_id, institute_kind, date (all optional)
+        """
+        fund_type = request.query_params.get('fund_type', None)
+        institute_kind = request.query_params.get('institute_kind', None)
+        date = request.query_params.get('date', None)
+
+        query = FundIdQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+
+        limit, offset = self.paginator.rpc_limit_offset(request)
+        client = get_default_async_client()
+        response = await client.list_total_returns(
+            fund_type=fund_type,
+            fund_id=query.validated_data.get('fund_id'),
+            institute_kind=institute_kind,
+            date=date,
+            limit=limit,
+            offset=offset,
+            raw=True
+        )
+        return _list_response(self, request, response.returns, response)
+
+
+class EtfReturnViewSet(adrf_viewsets.GenericViewSet):
+    """
+    ViewSet for ETF Returns
+
+    list: GET /vigilio/etf-returns/?fund_id=<fund_id>&institute_kind=<institute_kind>&date=<date>
+    """
+    http_method_names = ['get']
+    permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    pagination_class = RPCLimitOffsetPagination
+
+    def get_queryset(self):
+        return []
+
+    @grpc_error_handler
+    async def list(self, request):
+        """
+        List ETF returns
+        Query params: fund_id, institute_kind, date (all optional)
+        """
+        institute_kind = request.query_params.get('institute_kind', None)
+        date = request.query_params.get('date', None)
+
+        query = FundIdQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+
+        limit, offset = self.paginator.rpc_limit_offset(request)
+        client = get_default_async_client()
+        response = await client.list_etf_returns(
+            fund_id=query.validated_data.get('fund_id'),
+            institute_kind=institute_kind,
+            date=date,
+            limit=limit,
+            offset=offset,
+            raw=True
+        )
+        return _list_response(self, request, response.returns, response)
@@ -17,25 +17,597 @@ Usage:
     excel_bytes = client.export_shareholder_excel(5040, fund="ضمان")
 """
 
+import atexit
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
+import inspect
+import itertools
+import operator
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
 import grpc
+from google.protobuf.descriptor import FieldDescriptor
 from . import vigilio_pb2
 from . import vigilio_pb2_grpc
-from typing import Optional, List, Dict, Any
+from .interceptors import RetryInterceptor
+from typing import Optional, List, Dict, Any, Iterator, Union
 from io import BytesIO
 
 
-class VigilioClient:
+# Excel exports and long list RPCs can exceed gRPC's 4MB default
+MAX_RECEIVE_MESSAGE_LENGTH = 64 * 1024 * 1024
+
+# Options shared by every channel the clients open. Keepalive pings keep idle
+# connections warm and detect ones silently dropped by NATs/load balancers;
+# the server must permit pings without calls at this interval. round_robin
+# spreads calls over every address the host resolves to instead of pinning
+# to the first one.
+DEFAULT_CHANNEL_OPTIONS = [
+    ('grpc.lb_policy_name', 'round_robin'),
+    ('grpc.default_compression_algorithm', grpc.Compression.Gzip.value),
+    ('grpc.max_receive_message_length', MAX_RECEIVE_MESSAGE_LENGTH),
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+]
+
+# Upper bound on concurrent unary calls when batching detail lookups against
+# servers without BatchGetShareHolderDetail
+MAX_BATCH_WORKERS = 16
+
+# File buffer used when writing streamed Excel chunks to disk
+EXCEL_WRITE_BUFFER_SIZE = 1 << 20
+
+
+# GetFundTypesRequest has no fields, so one instance serves every call
+_FUND_TYPES_REQUEST = vigilio_pb2.GetFundTypesRequest()
+
+
+# Channel pools shared by every VigilioClient in the process, keyed by
+# (host, root certificates, pool size). Clients are cheap to create (e.g. one
+# per Django request) without paying a TCP/TLS/HTTP2 handshake each time.
+_CHANNEL_CACHE: Dict[tuple, List[grpc.Channel]] = {}
+# Intercepted stubs over those pools, keyed by channel key plus the retry
+# interceptor's settings
+_STUB_CACHE: Dict[tuple, list] = {}
+# Guards both caches and serializes starting warmup calls with closing
+# channels, which can crash grpc when the two race
+_CHANNEL_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8)
+def _read_root_certificates(credentials_path: str) -> bytes:
+    """Read a root certificates file once per path"""
+    with open(credentials_path, 'rb') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_credentials(credentials_path: str) -> grpc.ChannelCredentials:
+    """Build SSL channel credentials once per root certificates file"""
+    return grpc.ssl_channel_credentials(_read_root_certificates(credentials_path))
+
+
+def _create_channel(host: str, root_certificates: Optional[bytes], channel_id: int):
+    """
+    Create one channel of a pool
+
+    A local subchannel pool and a distinct channel_id keep gRPC from
+    collapsing the pool back onto a single shared TCP connection.
+    Messages are gzip-compressed on the wire.
+    """
+    options = [
+        ('grpc.use_local_subchannel_pool', 1),
+        ('grpc.channel_id', channel_id),
+        *DEFAULT_CHANNEL_OPTIONS,
+    ]
+    if root_certificates is not None:
+        credentials = grpc.ssl_channel_credentials(root_certificates)
+        return grpc.secure_channel(host, credentials, options=options,
+                                   compression=grpc.Compression.Gzip)
+    return grpc.insecure_channel(host, options=options,
+                                 compression=grpc.Compression.Gzip)
+
+
+def _get_channels(host: str, root_certificates: Optional[bytes], pool_size: int,
+                  max_retries: int, timeout: Optional[float]):
+    """
+    Return the shared channel pool for host and its stubs
+
+    Both are created on first use and reused by every later client with
+    the same connection and retry settings.
+    """
+    key = (host, root_certificates, pool_size)
+    stub_key = key + (max_retries, timeout)
+    with _CHANNEL_LOCK:
+        channels = _CHANNEL_CACHE.get(key)
+        if channels is None:
+            channels = _CHANNEL_CACHE[key] = [
+                _create_channel(host, root_certificates, channel_id)
+                for channel_id in range(pool_size)
+            ]
+        stubs = _STUB_CACHE.get(stub_key)
+        if stubs is None:
+            interceptor = RetryInterceptor(max_retries=max_retries, default_timeout=timeout)
+            stubs = _STUB_CACHE[stub_key] = [
+                vigilio_pb2_grpc.VigilioServiceStub(grpc.intercept_channel(channel, interceptor))
+                for channel in channels
+            ]
+        return channels, stubs
+
+
+@atexit.register
+def close_channels():
+    """
+    Close every shared channel pool
+
+    Runs automatically at interpreter exit. Clients created afterwards open
+    fresh channels; clients created before can no longer make calls.
+    """
+    with _CHANNEL_LOCK:
+        for channels in _CHANNEL_CACHE.values():
+            for channel in channels:
+                channel.close()
+        _CHANNEL_CACHE.clear()
+        _STUB_CACHE.clear()
+
+
+class _TTLCache:
+    """
+    Thread-safe LRU cache of timestamped entries
+
+    Freshness is decided by the reader: get() treats entries older than the
+    ttl it is given as misses, so clients with different TTLs can share one
+    cache.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, ttl: float):
+        """Return (hit, value) for key if it was stored less than ttl seconds ago"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return False, None
+            stored_at, value = item
+            if stored_at + ttl <= time.monotonic():
+                return False, None
+            self._data.move_to_end(key)
+            return True, value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Lookup caches shared by every client talking to the same server
+_RESPONSE_CACHES: Dict[tuple, _TTLCache] = {}
+
+
+def _get_response_cache(host: str, root_certificates: Optional[bytes]) -> _TTLCache:
+    with _CHANNEL_LOCK:
+        cache = _RESPONSE_CACHES.get((host, root_certificates))
+        if cache is None:
+            cache = _RESPONSE_CACHES[(host, root_certificates)] = _TTLCache()
+        return cache
+
+
+def _cached(method):
+    """
+    Cache a read-only lookup method's decoded result for the client's cache_ttl
+
+    The cache is shared by all clients of the same server, so callers must
+    not mutate results. Pass ttl= to override the client's cache_ttl for one
+    call; ttl=0 skips the cache and fetches a fresh result. A timeout
+    keyword is passed through but is not part of the cache key.
+
+    Arguments are bound to the method's signature before building the key,
+    so get_splits(3) and get_splits(fund_id=3) share one entry.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, ttl: Optional[float] = None, **kwargs):
+        if ttl is None:
+            ttl = self.cache_ttl
+        if ttl <= 0:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (method.__name__,
+               tuple(item for item in bound.arguments.items()
+                     if item[0] not in ('self', 'timeout')))
+        hit, value = self._cache.get(key, ttl)
+        if hit:
+            return value
+
+        value = method(self, *args, **kwargs)
+        self._cache.set(key, value)
+        return value
+
+    return wrapper
+
+
+class _Row(Mapping):
+    """
+    Read-only, dict-like view over a protobuf row message
+
+    Fields are read from the message on access instead of being copied into
+    a dict up front, so callers only pay for the fields they touch. Supports
+    both row['field'] and row.field. Rows are immutable and not JSON
+    serializable as-is; use dict(row) for a plain, mutable copy. Copying or
+    pickling a row produces such a dict.
+    """
+    __slots__ = ('_m',)
+
+    def __init__(self, message):
+        self._m = message
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+    def __getitem__(self, key):
+        if key not in self._m.DESCRIPTOR.fields_by_name:
+            raise KeyError(key)
+        return getattr(self._m, key)
+
+    def __getattr__(self, key):
+        # _m is unset while copy/pickle probe a bare instance for hooks
+        if key == '_m' or key.startswith('__'):
+            raise AttributeError(key)
+        return getattr(self._m, key)
+
+    def __iter__(self):
+        return (field.name for field in self._m.DESCRIPTOR.fields)
+
+    def __len__(self):
+        return len(self._m.DESCRIPTOR.fields)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _rows_to_dicts(rows) -> List[Dict[str, Any]]:
+    """
+    Copy a list of _Row views over one message type into plain dicts
+
+    Reads every field straight off each message with a single attrgetter
+    call, which is several times faster than dict(row).
+    """
+    if not rows:
+        return []
+    names = tuple(field.name for field in rows[0]._m.DESCRIPTOR.fields)
+    if len(names) == 1:
+        name = names[0]
+        return [{name: getattr(row._m, name)} for row in rows]
+    get = operator.attrgetter(*names)
+    return [dict(zip(names, get(row._m))) for row in rows]
+
+
+_SUMMARY_COLUMNS = ('id', 'name', 'num_funds', 'total_value')
+
+
+def _summary_columns_to_dicts(response) -> List[Dict[str, Any]]:
+    """Convert a ShareHolderSummaryColumnsResponse into summary row dicts"""
+    return [dict(zip(_SUMMARY_COLUMNS, row))
+            for row in zip(response.ids, response.names,
+                           response.num_funds, response.total_values)]
+
+
+def _shareholder_for_date_to_dict(response) -> Dict[str, Any]:
+    """Convert a ShareHolderForDateResponse"""
+    return {
+        'id': response.id,
+        'shareholder_name': response.shareholder_name,
+        'share_holder_histories': [
+            {
+                'fund_id': fh.fund_id,
+                'fund': fh.fund,
+                'share_count': fh.share_count,
+                'value': fh.value,
+                'date': fh.date,
+                'fund_type': fh.fund_type,
+                'pct_of_shares': fh.pct_of_shares
+            }
+            for fh in response.share_holder_histories
+        ]
+    }
+
+
+def _chart_to_arrays(chart) -> Dict[str, Any]:
+    """Copy a ShareHolderFundChart straight into numpy arrays"""
+    _, np = _import_pandas()
+    return {
+        'dates': np.asarray(chart.dates, dtype=object),
+        'share_counts': np.fromiter(chart.share_counts, dtype=np.int64,
+                                    count=len(chart.share_counts))
+    }
+
+
+def _shareholder_detail_to_dict(response, as_numpy: bool = False) -> Dict[str, Any]:
+    """Convert a GetShareHolderDetailResponse"""
+    if as_numpy:
+        chart_data = [_chart_to_arrays(chart) for chart in response.chart_data]
+    else:
+        chart_data = [
+            {
+                'dates': list(chart.dates),
+                'share_counts': list(chart.share_counts)
+            }
+            for chart in response.chart_data
+        ]
+
+    return {
+        'shareholder_name': response.shareholder_name,
+        'share_holder_histories': [
+            {
+                'fund_id': fh.fund_id,
+                'fund': fh.fund,
+                'fund_type': fh.fund_type,
+                'share_count': fh.share_count,
+                'value': fh.value,
+                'pct_of_shares': fh.pct_of_shares,
+                'date': fh.date
+            }
+            for fh in response.share_holder_histories
+        ],
+        'chart_data': chart_data
+    }
+
+
+# Optional NavDataItem fields; unset ones are reported as None
+_NAV_FIELDS = ('purchase', 'redemption', 'statistical',
+               'preferred_purchase', 'preferred_redemption', 'common')
+
+
+def _nav_data_to_dict(nav_data) -> Dict[str, Any]:
+    has_field = nav_data.HasField
+    return {
+        field: getattr(nav_data, field) if has_field(field) else None
+        for field in _NAV_FIELDS
+    }
+
+
+def _nav_chart_to_arrays(chart) -> Dict[str, Any]:
+    """Copy a NavTrendChartData straight into numpy arrays"""
+    _, np = _import_pandas()
+    return {
+        'dates': np.asarray(chart.dates, dtype=object),
+        'statisticals': np.fromiter(chart.statisticals, dtype=np.float64,
+                                    count=len(chart.statisticals)),
+        'purchases': np.fromiter(chart.purchases, dtype=np.float64,
+                                 count=len(chart.purchases)),
+        'redemptions': np.fromiter(chart.redemptions, dtype=np.float64,
+                                   count=len(chart.redemptions))
+    }
+
+
+def _nav_trend_to_dict(response, as_numpy: bool = False) -> Dict[str, Any]:
+    """Convert a GetNavTrendResponse"""
+    if as_numpy:
+        chart_data = _nav_chart_to_arrays(response.chart_data)
+    else:
+        chart_data = {
+            'dates': list(response.chart_data.dates),
+            'statisticals': list(response.chart_data.statisticals),
+            'purchases': list(response.chart_data.purchases),
+            'redemptions': list(response.chart_data.redemptions)
+        }
+
+    return {
+        'nav_trend': [
+            {
+                'net_asset_value': item.net_asset_value,
+                'date': item.date,
+                'nav_data': _nav_data_to_dict(item.nav_data)
+            }
+            for item in response.nav_trend
+        ],
+        'chart_data': chart_data
+    }
+
+
+def _import_pandas():
+    """Import pandas and numpy lazily for the DataFrame / array helpers"""
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        raise ImportError("pandas is required for this method. Install with: pip install pandas")
+    return pd, np
+
+
+def _dtype_backend_kwargs(dtype_backend: Optional[str]) -> Dict[str, Any]:
+    """pandas reader kwargs for an optional dtype_backend"""
+    return {'dtype_backend': dtype_backend} if dtype_backend else {}
+
+
+# numpy dtypes for protobuf scalar field types; anything else is stored as object
+_NUMPY_DTYPES = {
+    FieldDescriptor.CPPTYPE_DOUBLE: 'float64',
+    FieldDescriptor.CPPTYPE_FLOAT: 'float64',
+    FieldDescriptor.CPPTYPE_INT32: 'int64',
+    FieldDescriptor.CPPTYPE_INT64: 'int64',
+    FieldDescriptor.CPPTYPE_UINT32: 'int64',
+    FieldDescriptor.CPPTYPE_UINT64: 'uint64',
+    FieldDescriptor.CPPTYPE_BOOL: 'bool',
+}
+
+
+def _messages_to_frame(messages, descriptor):
+    """
+    Build a DataFrame column by column (struct-of-arrays) from protobuf rows
+
+    Each field is read straight into a typed numpy array, skipping the
+    list-of-dicts intermediate and pandas' per-cell type inference.
+    """
+    pd, np = _import_pandas()
+    count = len(messages)
+    columns = {
+        field.name: np.fromiter(
+            (getattr(m, field.name) for m in messages),
+            dtype=_NUMPY_DTYPES.get(field.cpp_type, object),
+            count=count
+        )
+        for field in descriptor.fields
+    }
+    return pd.DataFrame(columns, copy=False)
+
+
+class _RequestBuilder:
+    """
+    Build request messages, setting only the fields that were provided
+
+    Unset proto3 fields are left off the wire. Subclasses supply
+    _reusable_request(message_class), which returns an empty instance.
+    """
+
+    def _shareholder_list_request(self, fund_type, limit, offset):
+        request = self._reusable_request(vigilio_pb2.ShareHolderListRequest)
+        if fund_type:
+            request.fund_type = fund_type
+        if limit:
+            request.limit = limit
+        if offset:
+            request.offset = offset
+        return request
+
+    def _summary_list_request(self, date, fund_type, search, ordering, limit, offset):
+        request = self._reusable_request(vigilio_pb2.ShareHolderSummaryListRequest)
+        if date:
+            request.date = date
+        if fund_type:
+            request.fund_type = fund_type
+        if search:
+            request.search = search
+        if ordering:
+            request.ordering = ordering
+        if limit:
+            request.limit = limit
+        if offset:
+            request.offset = offset
+        return request
+
+    def _summary_export_request(self, fund_type, date):
+        request = self._reusable_request(vigilio_pb2.ShareHolderSummaryExportRequest)
+        request.fund_type = fund_type
+        if date:
+            request.date = date
+        return request
+
+    def _for_date_request(self, shareholder_id, date, fund_type):
+        request = self._reusable_request(vigilio_pb2.ShareHolderForDateRequest)
+        request.shareholder_id = shareholder_id
+        if date:
+            request.date = date
+        if fund_type:
+            request.fund_type = fund_type
+        return request
+
+    def _detail_request(self, shareholder_id, fund):
+        request = self._reusable_request(vigilio_pb2.GetShareHolderDetailRequest)
+        request.shareholder_id = shareholder_id
+        if fund:
+            request.fund = fund
+        return request
+
+    def _export_request(self, shareholder_id, fund):
+        request = self._reusable_request(vigilio_pb2.ExportShareHolderExcelRequest)
+        request.shareholder_id = shareholder_id
+        if fund:
+            request.fund = fund
+        return request
+
+    def _cash_flows_request(self, start_date, end_date, institute_kind, limit=None, offset=0):
+        request = self._reusable_request(vigilio_pb2.ListCashFlowsRequest)
+        request.start_date = start_date
+        request.end_date = end_date
+        if institute_kind:
+            request.institute_kind = institute_kind
+        if limit:
+            request.limit = limit
+        if offset:
+            request.offset = offset
+        return request
+
+    def _cash_flow_detail_request(self, fund_id, start_date, end_date, fund_type, institute_kind):
+        request = self._reusable_request(vigilio_pb2.GetCashFlowDetailRequest)
+        request.fund_id = fund_id
+        request.start_date = start_date
+        request.end_date = end_date
+        request.fund_type = fund_type
+        if institute_kind:
+            request.institute_kind = institute_kind
+        return request
+
+    def _total_returns_request(self, fund_type, fund_id, institute_kind, date, limit=None, offset=0):
+        request = self._reusable_request(vigilio_pb2.ListTotalReturnsRequest)
+        if fund_type:
+            request.fund_type = fund_type
+        if fund_id:
+            request.fund_id = fund_id
+        if institute_kind:
+            request.institute_kind = institute_kind
+        if date:
+            request.date = date
+        if limit:
+            request.limit = limit
+        if offset:
+            request.offset = offset
+        return request
+
+    def _etf_returns_request(self, fund_id, institute_kind, date, limit=None, offset=0):
+        request = self._reusable_request(vigilio_pb2.ListEtfReturnsRequest)
+        if fund_id:
+            request.fund_id = fund_id
+        if institute_kind:
+            request.institute_kind = institute_kind
+        if date:
+            request.date = date
+        if limit:
+            request.limit = limit
+        if offset:
+            request.offset = offset
+        return request
+
+    def _fund_request(self, message_class, fund_id):
+        request = self._reusable_request(message_class)
+        request.fund_id = fund_id
+        return request
+
+
+class VigilioClient(_RequestBuilder):
     """
     Client class for Vigilio gRPC service
 
     Attributes:
         host (str): gRPC server host and port (e.g., '127.0.0.1:50051')
-        channel: gRPC channel connection
-        stub: gRPC service stub
+        pool_size (int): Number of gRPC channels RPCs are spread over
+        channel: First gRPC channel of the pool
+        stub: gRPC service stub (round-robins over the channel pool)
     """
 
     def __init__(self, host: str = '127.0.0.1:50051', secure: bool = False,
-                 credentials_path: Optional[str] = None):
+                 credentials_path: Optional[str] = None, pool_size: int = 4,
+                 cache_ttl: float = 300.0, timeout: Optional[float] = 30.0,
+                 max_retries: int = 3, warmup: bool = False):
         """
         Initialize the Vigilio gRPC client
 
@@ -43,75 +615,311 @@ class VigilioClient:
             host: Server host and port (default: '127.0.0.1:50051')
             secure: Use secure connection (SSL/TLS) (default: False)
             credentials_path: Path to SSL credentials if secure=True
+            pool_size: Number of channels (TCP connections) to round-robin
+                RPCs over (default: 4)
+            cache_ttl: Seconds to cache fund types, shareholder list, splits,
+                profits and prices lookups; 0 disables caching. Cached
+                methods also accept ttl= to override it per call (default: 300)
+            timeout: Default deadline in seconds for RPCs, covering the
+                whole stream for streaming ones; None waits forever. Every
+                RPC method also accepts timeout= to override it per call
+                (default: 30)
+            max_retries: Retries with exponential backoff on UNAVAILABLE /
+                RESOURCE_EXHAUSTED, for blocking unary RPCs only; streaming
+                RPCs and the methods that pipeline calls with .future() are
+                not retried (default: 3)
+            warmup: Connect the channel pool in a background thread so the
+                handshake overlaps with the caller's own startup (default: False)
         """
         self.host = host
         self.secure = secure
+        self.pool_size = max(1, pool_size)
 
+        root_certificates = None
         if secure and credentials_path:
-            with open(credentials_path, 'rb') as f:
-                credentials = grpc.ssl_channel_credentials(f.read())
-            self.channel = grpc.secure_channel(host, credentials)
-        else:
-            self.channel = grpc.insecure_channel(host)
+            root_certificates = _read_root_certificates(credentials_path)
+
+        self._channels, self._stubs = _get_channels(
+            host, root_certificates, self.pool_size, max_retries, timeout
+        )
+        self._next_stub = itertools.cycle(self._stubs).__next__
+
+        self.channel = self._channels[0]
 
-        self.stub = vigilio_pb2_grpc.VigilioServiceStub(self.channel)
+        self.cache_ttl = cache_ttl
+        self._cache = _get_response_cache(host, root_certificates)
+        self._request_pool = threading.local()
+
+        self._closed = False
+        if warmup:
+            threading.Thread(target=self._warmup, daemon=True).start()
+
+    @property
+    def stub(self):
+        """Next stub of the channel pool in round-robin order"""
+        return self._next_stub()
 
     def __enter__(self):
         """Context manager entry"""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close channel"""
+        """Context manager exit - release the client"""
         self.close()
 
     def close(self):
-        """Close the gRPC channel"""
-        if self.channel:
-            self.channel.close()
+        """
+        Release the client
+
+        The channel pool is shared with other clients for the same host and
+        stays open; see close_channels().
+        """
+        self._closed = True
+
+    def wait_ready(self, timeout: Optional[float] = 5.0):
+        """
+        Block until every channel of the pool is connected
+
+        Lets short-lived callers pay the connection handshake up front (or in
+        parallel with other startup work) instead of on their first RPC. Each
+        channel sends one GetFundTypes call with wait_for_ready, which, unlike
+        grpc.channel_ready_future, is cancelled cleanly if the channels are
+        closed while waiting.
+
+        Args:
+            timeout: Seconds to wait; None waits forever (default: 5)
+
+        Raises:
+            grpc.RpcError: DEADLINE_EXCEEDED if the pool is not ready within
+                timeout
+        """
+        request = _FUND_TYPES_REQUEST
+        with _CHANNEL_LOCK:
+            if self._closed:
+                return
+            calls = [
+                vigilio_pb2_grpc.VigilioServiceStub(channel).GetFundTypes.future(
+                    request, timeout=timeout, wait_for_ready=True)
+                for channel in self._channels
+            ]
+        for call in calls:
+            call.result()
+
+    def _warmup(self):
+        try:
+            self.wait_ready()
+        except (grpc.RpcError, ValueError):
+            # Timed out, or the channels were closed before the pool connected
+            pass
+
+    def _reusable_request(self, message_class):
+        """
+        Return this thread's instance of message_class, cleared for reuse
+
+        Request messages are recycled per thread instead of being built per
+        call; the blocking stub serializes them before returning, so reuse
+        within a thread is safe.
+        """
+        pool = self._request_pool.__dict__
+        request = pool.get(message_class)
+        if request is None:
+            request = pool[message_class] = message_class()
+        else:
+            request.Clear()
+        return request
+
+    @staticmethod
+    def _save_excel_stream(chunks, output_path: Optional[str] = None) -> Optional[str]:
+        """
+        Write a streamed Excel export to disk chunk by chunk
+
+        Only one chunk is held in memory at a time. Returns None, without
+        writing anything, when the server does not implement the streaming
+        RPC or sends no chunks, so callers can fall back to the unary export.
+        """
+        f = None
+        try:
+            for msg in chunks:
+                if f is None:
+                    if not output_path:
+                        output_path = f"/tmp/{msg.file_name}"
+                    f = open(output_path, 'wb', buffering=EXCEL_WRITE_BUFFER_SIZE)
+                f.write(msg.chunk)
+        except grpc.RpcError as e:
+            if f is None and e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return None
+            raise
+        finally:
+            if f is not None:
+                f.close()
+
+        return output_path if f is not None else None
+
+    @staticmethod
+    def _join_excel_stream(chunks) -> Optional[bytes]:
+        """
+        Collect a streamed Excel export into bytes
+
+        Streamed exports are not bound by the per-message size limit. Returns
+        None when the server does not implement the streaming RPC or sends
+        no chunks, so callers can fall back to the unary export.
+        """
+        parts = []
+        try:
+            for msg in chunks:
+                parts.append(msg.chunk)
+        except grpc.RpcError as e:
+            if not parts and e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return None
+            raise
+
+        return b''.join(parts) if parts else None
+
+    @staticmethod
+    def _iter_excel_stream(chunks) -> Optional[Iterator[bytes]]:
+        """
+        Pass a streamed Excel export through chunk by chunk
+
+        The first chunk is read before returning, so a failed or missing RPC
+        raises here rather than partway through the caller's loop. Returns
+        None when the server does not implement the streaming RPC or sends
+        no chunks, so callers can fall back to the unary export.
+        """
+        chunks = iter(chunks)
+        try:
+            first = next(chunks, None)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+                return None
+            raise
+
+        if first is None:
+            return None
+        return itertools.chain((first.chunk,), (msg.chunk for msg in chunks))
+
+    @staticmethod
+    def _iter_list_stream(stream, unary, request, field: str,
+                          timeout: Optional[float]) -> Iterator[Mapping[str, Any]]:
+        """
+        Yield the rows of a streamed list RPC batch by batch
+
+        Falls back to the matching unary RPC, which takes the same request
+        and returns the same message, when the server does not implement
+        the stream.
+        """
+        started = False
+        try:
+            for chunk in stream(request, timeout=timeout):
+                started = True
+                yield from map(_Row, getattr(chunk, field))
+            return
+        except grpc.RpcError as e:
+            if started or e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+
+        yield from map(_Row, getattr(unary(request, timeout=timeout), field))
 
+    def invalidate_cache(self):
+        """Drop all cached lookup results, for every client of this server"""
+        self._cache.clear()
 
-    def get_fund_types(self) -> List[Dict[str, Any]]:
+
+    @_cached
+    def get_fund_types(self, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
         """
         Get all fund types
 
+        Args:
+            timeout: Optional deadline in seconds, overriding the client's
+                default timeout
+
         Returns:
             List of fund types with id and name
             Example: [{'id': 1, 'name': 'ETF'}, {'id': 2, 'name': 'اهرمی'}]
         """
-        request = vigilio_pb2.GetFundTypesRequest()
-        response = self.stub.GetFundTypes(request)
+        request = _FUND_TYPES_REQUEST
+        response = self.stub.GetFundTypes(request, timeout=timeout)
 
-        return [
-            {'id': ft.id, 'name': ft.name}
-            for ft in response.fund_types
-        ]
+        return list(map(_Row, response.fund_types))
 
 
-    def list_shareholders(self, fund_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def prefetch_fund_types_and_shareholders(self, fund_type: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Get fund types and the shareholder list with both RPCs in flight at once
+
+        Both calls are started before either is waited on, so they share one
+        round trip instead of two. Bypasses the lookup cache, and the calls
+        are not retried on transient failures.
+
+        Args:
+            fund_type: Optional fund type ID to filter shareholders by
+
+        Returns:
+            Tuple of (fund types, shareholders), as returned by
+            get_fund_types and list_shareholders
+        """
+        fund_types_call = self.stub.GetFundTypes.future(_FUND_TYPES_REQUEST, timeout=timeout)
+        shareholders_call = self.stub.ListShareHolders.future(
+            self._shareholder_list_request(fund_type, None, 0), timeout=timeout
+        )
+
+        return (list(map(_Row, fund_types_call.result().fund_types)),
+                list(map(_Row, shareholders_call.result().shareholders)))
+
+    @_cached
+    def list_shareholders(self, fund_type: Optional[str] = None,
+                          limit: Optional[int] = None,
+                          offset: int = 0,
+                          timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
         """
         Get list of all shareholders (names and IDs only)
 
         Args:
             fund_type: Optional fund type ID to filter by
+            limit: Optional page size, applied by the server
+            offset: Rows to skip before the page starts (default: 0)
 
         Returns:
             List of shareholders with id and name
             Example: [{'id': 5040, 'name': 'شرکت سرمایه گذاری...'}]
         """
-        request = vigilio_pb2.ShareHolderListRequest(
-            fund_type=fund_type if fund_type else ""
-        )
-        response = self.stub.ListShareHolders(request)
+        request = self._shareholder_list_request(fund_type, limit, offset)
+        response = self.stub.ListShareHolders(request, timeout=timeout)
 
-        return [
-            {'id': sh.id, 'name': sh.name}
-            for sh in response.shareholders
-        ]
+        return list(map(_Row, response.shareholders))
+
+    def iter_shareholders(self, fund_type: Optional[str] = None,
+                          limit: Optional[int] = None,
+                          offset: int = 0,
+                          timeout: Optional[float] = None) -> Iterator[Mapping[str, Any]]:
+        """
+        Stream all shareholders (names and IDs only) batch by batch
+
+        Same data as list_shareholders, but rows are yielded as each batch
+        arrives, so memory stays bounded by the batch size. Older servers
+        fall back to ListShareHolders.
+
+        Args:
+            fund_type: Optional fund type ID to filter by
+            limit: Optional page size, applied by the server
+            offset: Rows to skip before the page starts (default: 0)
+
+        Yields:
+            Shareholders with id and name
+        """
+        request = self._shareholder_list_request(fund_type, limit, offset)
+        stub = self.stub
+        yield from self._iter_list_stream(stub.StreamListShareHolders, stub.ListShareHolders,
+                                          request, 'shareholders', timeout)
 
     def get_shareholders_summary(self, date: Optional[str] = None,
                                  fund_type: Optional[str] = None,
                                  search: Optional[str] = None,
-                                 ordering: Optional[str] = None) -> List[Dict[str, Any]]:
+                                 ordering: Optional[str] = None,
+                                 limit: Optional[int] = None,
+                                 offset: int = 0, raw: bool = False,
+                                 columnar: bool = False,
+                                 timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ShareHolderSummaryListResponse]:
         """
         Get shareholders summary with aggregated data
 
@@ -120,9 +928,18 @@ class VigilioClient:
             fund_type: Optional fund type ID to filter by
             search: Optional search term for shareholder name
             ordering: Optional ordering field (e.g., '-num_funds', 'total_value')
+            limit: Optional page size, applied by the server
+            offset: Rows to skip before the page starts (default: 0)
+            raw: Return the protobuf response message itself, so only the
+                fields actually read are converted to Python objects
+            columnar: Fetch the rows through ShareHoldersSummaryColumns,
+                which sends them as parallel arrays, and return plain dicts;
+                falls back to ShareHoldersSummary on servers without it.
+                Ignored when raw=True
 
         Returns:
-            List of shareholders with summary data
+            List of shareholders with summary data, or the
+            ShareHolderSummaryListResponse message if raw=True
             Example: [
                 {
                     'id': 5040,
@@ -132,26 +949,85 @@ class VigilioClient:
                 }
             ]
         """
-        request = vigilio_pb2.ShareHolderSummaryListRequest(
-            date=date if date else "",
-            fund_type=fund_type if fund_type else "",
-            search=search if search else "",
-            ordering=ordering if ordering else ""
-        )
-        response = self.stub.ShareHoldersSummary(request)
+        request = self._summary_list_request(date, fund_type, search, ordering, limit, offset)
+        if columnar and not raw:
+            try:
+                return _summary_columns_to_dicts(self.stub.ShareHoldersSummaryColumns(request, timeout=timeout))
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+        response = self.stub.ShareHoldersSummary(request, timeout=timeout)
+
+        if raw:
+            return response
+        if columnar:
+            return _rows_to_dicts(list(map(_Row, response.shareholders)))
+        return list(map(_Row, response.shareholders))
+
+    def iter_shareholders_summary(self, date: Optional[str] = None,
+                                  fund_type: Optional[str] = None,
+                                  search: Optional[str] = None,
+                                  ordering: Optional[str] = None,
+                                  limit: Optional[int] = None,
+                                  offset: int = 0,
+                                  timeout: Optional[float] = None) -> Iterator[Mapping[str, Any]]:
+        """
+        Stream shareholders summary batch by batch
 
-        return [
-            {
-                'id': sh.id,
-                'name': sh.name,
-                'num_funds': sh.num_funds,
-                'total_value': sh.total_value
-            }
-            for sh in response.shareholders
+        Older servers fall back to ShareHoldersSummary.
+
+        Args:
+            date: Optional date in Jalali format (e.g., '1403/08/15')
+            fund_type: Optional fund type ID to filter by
+            search: Optional search term for shareholder name
+            ordering: Optional ordering field (e.g., '-num_funds', 'total_value')
+            limit: Optional page size, applied by the server
+            offset: Rows to skip before the page starts (default: 0)
+
+        Yields:
+            Shareholders with summary data (see get_shareholders_summary)
+        """
+        request = self._summary_list_request(date, fund_type, search, ordering, limit, offset)
+        stub = self.stub
+        yield from self._iter_list_stream(stub.StreamShareHoldersSummary, stub.ShareHoldersSummary,
+                                          request, 'shareholders', timeout)
+
+    def get_shareholders_summaries(self, fund_types: List[str],
+                                   date: Optional[str] = None,
+                                   search: Optional[str] = None,
+                                   ordering: Optional[str] = None,
+                                   timeout: Optional[float] = None) -> Dict[str, List[Mapping[str, Any]]]:
+        """
+        Get shareholders summaries for several fund types at once
+
+        All calls are started before any is waited on, so they share one
+        round trip over the HTTP/2 connection instead of one each. The calls
+        are not retried on transient failures.
+
+        Args:
+            fund_types: Fund type IDs
+            date: Optional date in Jalali format (e.g., '1403/08/15')
+            search: Optional search term for shareholder name
+            ordering: Optional ordering field (e.g., '-num_funds', 'total_value')
+
+        Returns:
+            Dict mapping each fund type to its summary rows, in the same
+            shape as get_shareholders_summary
+        """
+        calls = [
+            self.stub.ShareHoldersSummary.future(
+                self._summary_list_request(date, fund_type, search, ordering, None, 0),
+                timeout=timeout
+            )
+            for fund_type in fund_types
         ]
 
+        return {fund_type: list(map(_Row, call.result().shareholders))
+                for fund_type, call in zip(fund_types, calls)}
+
     def export_shareholders_summary_excel(self, fund_type: str,
-                                         date: Optional[str] = None) -> bytes:
+                                         date: Optional[str] = None,
+                                          timeout: Optional[float] = None) -> bytes:
         """
         Export shareholders summary to Excel
 
@@ -162,17 +1038,19 @@ class VigilioClient:
         Returns:
             Excel file as bytes
         """
-        request = vigilio_pb2.ShareHolderSummaryExportRequest(
-            fund_type=fund_type,
-            date=date if date else ""
-        )
-        response = self.stub.ExportShareHoldersSummaryExcel(request)
+        request = self._summary_export_request(fund_type, date)
+        excel_data = self._join_excel_stream(self.stub.StreamExportShareHoldersSummaryExcel(request, timeout=timeout))
+        if excel_data is not None:
+            return excel_data
+
+        response = self.stub.ExportShareHoldersSummaryExcel(request, timeout=timeout)
 
         return response.excel_data
 
     def save_shareholders_summary_excel(self, fund_type: str,
                                        date: Optional[str] = None,
-                                       output_path: Optional[str] = None) -> str:
+                                       output_path: Optional[str] = None,
+                                        timeout: Optional[float] = None) -> str:
         """
         Export shareholders summary to Excel and save to file
 
@@ -184,11 +1062,15 @@ class VigilioClient:
         Returns:
             Path to saved file
         """
-        request = vigilio_pb2.ShareHolderSummaryExportRequest(
-            fund_type=fund_type,
-            date=date if date else ""
+        request = self._summary_export_request(fund_type, date)
+        saved_path = self._save_excel_stream(
+            self.stub.StreamExportShareHoldersSummaryExcel(request, timeout=timeout),
+            output_path
         )
-        response = self.stub.ExportShareHoldersSummaryExcel(request)
+        if saved_path:
+            return saved_path
+
+        response = self.stub.ExportShareHoldersSummaryExcel(request, timeout=timeout)
 
         if not output_path:
             output_path = f"/tmp/{response.filename}"
@@ -198,10 +1080,38 @@ class VigilioClient:
 
         return output_path
 
+    def iter_shareholders_summary_excel(self, fund_type: str,
+                                        date: Optional[str] = None,
+                                        timeout: Optional[float] = None) -> Iterator[bytes]:
+        """
+        Export shareholders summary to Excel as a stream of byte chunks
+
+        Only one chunk is held in memory at a time, so the file can be
+        relayed (e.g. to an HTTP response) while the server is still
+        sending it. Older servers fall back to a single unary chunk.
+
+        Args:
+            fund_type: Fund type ID (required)
+            date: Optional date in Jalali format
+
+        Returns:
+            Iterator over the Excel file's bytes
+        """
+        request = self._summary_export_request(fund_type, date)
+        chunks = self._iter_excel_stream(self.stub.StreamExportShareHoldersSummaryExcel(request, timeout=timeout))
+        if chunks is not None:
+            return chunks
+
+        response = self.stub.ExportShareHoldersSummaryExcel(request, timeout=timeout)
+
+        return iter((response.excel_data,))
+
 
     def get_shareholder_for_date(self, shareholder_id: int,
                                  date: Optional[str] = None,
-                                 fund_type: Optional[str] = None) -> Dict[str, Any]:
+                                 fund_type: Optional[str] = None,
+                                 raw: bool = False,
+                                 timeout: Optional[float] = None) -> Union[Dict[str, Any], vigilio_pb2.ShareHolderForDateResponse]:
         """
         Get shareholder details for a specific date
 
@@ -209,37 +1119,25 @@ class VigilioClient:
             shareholder_id: Shareholder ID
             date: Optional date in Jalali format
             fund_type: Optional fund type ID to filter by
+            raw: Return the protobuf response message itself, so only the
+                fields actually read are converted to Python objects
 
         Returns:
-            Shareholder details with fund histories
+            Shareholder details with fund histories, or the
+            ShareHolderForDateResponse message if raw=True
         """
-        request = vigilio_pb2.ShareHolderForDateRequest(
-            shareholder_id=shareholder_id,
-            date=date if date else "",
-            fund_type=fund_type if fund_type else ""
-        )
-        response = self.stub.GetShareHolderForDate(request)
+        request = self._for_date_request(shareholder_id, date, fund_type)
+        response = self.stub.GetShareHolderForDate(request, timeout=timeout)
 
-        return {
-            'id': response.id,
-            'shareholder_name': response.shareholder_name,
-            'share_holder_histories': [
-                {
-                    'fund_id': fh.fund_id,
-                    'fund': fh.fund,
-                    'share_count': fh.share_count,
-                    'value': fh.value,
-                    'date': fh.date,
-                    'fund_type': fh.fund_type,
-                    'pct_of_shares': fh.pct_of_shares
-                }
-                for fh in response.share_holder_histories
-            ]
-        }
+        if raw:
+            return response
+        return _shareholder_for_date_to_dict(response)
 
 
     def get_shareholder_detail(self, shareholder_id: int,
-                               fund: Optional[str] = None) -> Dict[str, Any]:
+                               fund: Optional[str] = None,
+                               as_numpy: bool = False, raw: bool = False,
+                               timeout: Optional[float] = None) -> Union[Dict[str, Any], vigilio_pb2.GetShareHolderDetailResponse]:
         """
         Get detailed shareholder information with fund filtering and chart data
         Corresponds to: api/v1/vigilio/etf_funds/shareholders/{id}/?fund=...
@@ -247,46 +1145,125 @@ class VigilioClient:
         Args:
             shareholder_id: Shareholder ID
             fund: Optional fund ticker to filter by (e.g., 'ضمان')
+            as_numpy: Return chart_data series as numpy arrays instead of
+                lists, skipping the per-element Python copy (requires numpy)
+            raw: Return the protobuf response message itself, so only the
+                fields actually read are converted to Python objects
 
         Returns:
-            Shareholder details with histories and chart data
+            Shareholder details with histories and chart data, or the
+            GetShareHolderDetailResponse message if raw=True
             Example: {
                 'shareholder_name': 'شرکت سرمایه گذاری...',
                 'share_holder_histories': [...],
                 'chart_data': [{'dates': [...], 'share_counts': [...]}]
             }
         """
-        request = vigilio_pb2.GetShareHolderDetailRequest(
-            shareholder_id=shareholder_id,
-            fund=fund if fund else ""
-        )
-        response = self.stub.GetShareHolderDetail(request)
+        request = self._detail_request(shareholder_id, fund)
+        response = self.stub.GetShareHolderDetail(request, timeout=timeout)
 
-        return {
-            'shareholder_name': response.shareholder_name,
-            'share_holder_histories': [
-                {
-                    'fund_id': fh.fund_id,
-                    'fund': fh.fund,
-                    'fund_type': fh.fund_type,
-                    'share_count': fh.share_count,
-                    'value': fh.value,
-                    'pct_of_shares': fh.pct_of_shares,
-                    'date': fh.date
-                }
-                for fh in response.share_holder_histories
-            ],
-            'chart_data': [
-                {
-                    'dates': list(chart.dates),
-                    'share_counts': list(chart.share_counts)
-                }
-                for chart in response.chart_data
-            ]
-        }
+        if raw:
+            return response
+        return _shareholder_detail_to_dict(response, as_numpy=as_numpy)
+
+    def iter_shareholder_detail(self, shareholder_id: int,
+                                fund: Optional[str] = None,
+                                timeout: Optional[float] = None) -> Iterator[tuple]:
+        """
+        Stream shareholder detail item by item
+
+        Same data as get_shareholder_detail, but each history row is decoded
+        and yielded as it arrives instead of after the whole response has
+        been parsed. Falls back to the unary RPC when the server does not
+        implement StreamShareHolderDetail.
+
+        Args:
+            shareholder_id: Shareholder ID
+            fund: Optional fund ticker to filter by (e.g., 'ضمان')
+
+        Yields:
+            (kind, value) pairs, kind being one of:
+                'header': {'shareholder_name': ...}, sent first
+                'history': one fund history row
+                'chart': {'dates': [...], 'share_counts': [...]}
+        """
+        request = self._detail_request(shareholder_id, fund)
+        started = False
+        try:
+            for chunk in self.stub.StreamShareHolderDetail(request, timeout=timeout):
+                started = True
+                kind = chunk.WhichOneof('item')
+                if kind == 'history':
+                    yield kind, _Row(chunk.history)
+                elif kind == 'chart':
+                    yield kind, {'dates': list(chunk.chart.dates),
+                                 'share_counts': list(chunk.chart.share_counts)}
+                elif kind == 'header':
+                    yield kind, {'shareholder_name': chunk.header.shareholder_name}
+            return
+        except grpc.RpcError as e:
+            if started or e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+
+        response = self.stub.GetShareHolderDetail(self._detail_request(shareholder_id, fund), timeout=timeout)
+        yield 'header', {'shareholder_name': response.shareholder_name}
+        for history in response.share_holder_histories:
+            yield 'history', _Row(history)
+        for chart in response.chart_data:
+            yield 'chart', {'dates': list(chart.dates),
+                            'share_counts': list(chart.share_counts)}
+
+    def get_shareholder_details_batch(self, shareholder_ids: List[int],
+                                      fund: Optional[str] = None,
+                                      as_numpy: bool = False,
+                                      timeout: Optional[float] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get detailed information for many shareholders at once
+
+        Uses the BatchGetShareHolderDetail streaming RPC, so the whole batch
+        costs one round trip. Against servers without it, the unary calls are
+        issued concurrently over the channel pool instead of one by one.
+
+        Args:
+            shareholder_ids: Shareholder IDs
+            fund: Optional fund ticker to filter by (e.g., 'ضمان')
+            as_numpy: Return chart_data series as numpy arrays (see
+                get_shareholder_detail)
+
+        Returns:
+            Dict mapping each shareholder ID to its details, in the same
+            shape as get_shareholder_detail
+        """
+        if not shareholder_ids:
+            return {}
+
+        request = self._reusable_request(vigilio_pb2.BatchGetShareHolderDetailRequest)
+        request.shareholder_ids.extend(shareholder_ids)
+        if fund:
+            request.fund = fund
+
+        details = {}
+        try:
+            for item in self.stub.BatchGetShareHolderDetail(request, timeout=timeout):
+                details[item.shareholder_id] = _shareholder_detail_to_dict(item.detail, as_numpy=as_numpy)
+        except grpc.RpcError as e:
+            if details or e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+        else:
+            return details
+
+        workers = min(len(shareholder_ids), MAX_BATCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda shareholder_id: self.get_shareholder_detail(shareholder_id, fund, as_numpy,
+                                                                   timeout=timeout),
+                shareholder_ids
+            )
+            return dict(zip(shareholder_ids, results))
 
     def export_shareholder_excel(self, shareholder_id: int,
-                                 fund: Optional[str] = None) -> bytes:
+                                 fund: Optional[str] = None,
+                                 timeout: Optional[float] = None) -> bytes:
         """
         Export specific shareholder data to Excel
         Corresponds to: api/v1/vigilio/etf_funds/shareholders/{id}/export_excel/?fund=...
@@ -298,17 +1275,19 @@ class VigilioClient:
         Returns:
             Excel file as bytes
         """
-        request = vigilio_pb2.ExportShareHolderExcelRequest(
-            shareholder_id=shareholder_id,
-            fund=fund if fund else ""
-        )
-        response = self.stub.ExportShareHolderExcel(request)
+        request = self._export_request(shareholder_id, fund)
+        excel_file = self._join_excel_stream(self.stub.StreamExportShareHolderExcel(request, timeout=timeout))
+        if excel_file is not None:
+            return excel_file
+
+        response = self.stub.ExportShareHolderExcel(request, timeout=timeout)
 
         return response.excel_file
 
     def save_shareholder_excel(self, shareholder_id: int,
                                fund: Optional[str] = None,
-                               output_path: Optional[str] = None) -> str:
+                               output_path: Optional[str] = None,
+                               timeout: Optional[float] = None) -> str:
         """
         Export specific shareholder data to Excel and save to file
 
@@ -320,11 +1299,14 @@ class VigilioClient:
         Returns:
             Path to saved file
         """
-        request = vigilio_pb2.ExportShareHolderExcelRequest(
-            shareholder_id=shareholder_id,
-            fund=fund if fund else ""
+        request = self._export_request(shareholder_id, fund)
+        saved_path = self._save_excel_stream(
+            self.stub.StreamExportShareHolderExcel(request, timeout=timeout), output_path
         )
-        response = self.stub.ExportShareHolderExcel(request)
+        if saved_path:
+            return saved_path
+
+        response = self.stub.ExportShareHolderExcel(request, timeout=timeout)
 
         if not output_path:
             output_path = f"/tmp/{response.file_name}"
@@ -334,32 +1316,115 @@ class VigilioClient:
 
         return output_path
 
+    def iter_shareholder_excel(self, shareholder_id: int,
+                               fund: Optional[str] = None,
+                               timeout: Optional[float] = None) -> Iterator[bytes]:
+        """
+        Export specific shareholder data to Excel as a stream of byte chunks
+
+        Only one chunk is held in memory at a time, so the file can be
+        relayed (e.g. to an HTTP response) while the server is still
+        sending it. Older servers fall back to a single unary chunk.
+
+        Args:
+            shareholder_id: Shareholder ID
+            fund: Optional fund ticker to filter by
+
+        Returns:
+            Iterator over the Excel file's bytes
+        """
+        request = self._export_request(shareholder_id, fund)
+        chunks = self._iter_excel_stream(self.stub.StreamExportShareHolderExcel(request, timeout=timeout))
+        if chunks is not None:
+            return chunks
+
+        response = self.stub.ExportShareHolderExcel(request, timeout=timeout)
+
+        return iter((response.excel_file,))
+
     def read_shareholder_excel(self, shareholder_id: int,
-                               fund: Optional[str] = None):
+                               fund: Optional[str] = None,
+                               dtype_backend: Optional[str] = None,
+                               timeout: Optional[float] = None):
         """
-        Export shareholder data to Excel and read it with pandas
+        Export shareholder data and read it with pandas
+
+        Prefers GetShareHolderRecords, which sends the rows as columns so the
+        DataFrame is built straight from the repeated fields with no file
+        format in between; its columns are named after ShareHolderFundHistory
+        fields. Older servers fall back to the Parquet export (needs pyarrow),
+        then to the Excel export, parsed with the Rust-backed calamine engine
+        when python-calamine is installed and openpyxl otherwise.
+        GetShareHolderRecords is started with .future() so it overlaps the
+        pandas import, and is not retried on transient failures.
 
         Args:
             shareholder_id: Shareholder ID
             fund: Optional fund ticker to filter by
+            dtype_backend: Optional pandas dtype backend ('pyarrow' or
+                'numpy_nullable'); the Parquet and Excel readers produce it
+                directly instead of converting NumPy columns afterwards
 
         Returns:
             pandas DataFrame (requires pandas to be installed)
         """
+        request = self._export_request(shareholder_id, fund)
+        # Start the RPC before importing pandas so the two overlap
+        records_call = self.stub.GetShareHolderRecords.future(request, timeout=timeout)
         try:
-            import pandas as pd
+            pd, np = _import_pandas()
         except ImportError:
-            raise ImportError("pandas is required for this method. Install with: pip install pandas openpyxl")
+            records_call.cancel()
+            raise
 
-        excel_bytes = self.export_shareholder_excel(shareholder_id, fund)
+        try:
+            response = records_call.result()
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+        else:
+            df = pd.DataFrame({
+                'fund_id': list(response.fund_ids),
+                'fund': list(response.funds),
+                'fund_type': list(response.fund_types),
+                'share_count': np.fromiter(response.share_counts, dtype=np.int64,
+                                           count=len(response.share_counts)),
+                'value': np.fromiter(response.values, dtype=np.float64,
+                                     count=len(response.values)),
+                'pct_of_shares': np.fromiter(response.pct_of_shares, dtype=np.float64,
+                                             count=len(response.pct_of_shares)),
+                'date': list(response.dates),
+            })
+            return df.convert_dtypes(dtype_backend=dtype_backend) if dtype_backend else df
+
+        if importlib.util.find_spec('pyarrow') is not None:
+            request = self._export_request(shareholder_id, fund)
+            try:
+                response = self.stub.ExportShareHolderParquet(request, timeout=timeout)
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+            else:
+                # Reading the field copies the file out of the message; drop
+                # the message so only that copy is alive during the parse
+                parquet_file = response.parquet_file
+                del response
+                return pd.read_parquet(BytesIO(parquet_file),
+                                       **_dtype_backend_kwargs(dtype_backend))
+
+        engine = 'calamine' if importlib.util.find_spec('python_calamine') is not None else 'openpyxl'
+        excel_bytes = self.export_shareholder_excel(shareholder_id, fund, timeout=timeout)
         excel_buffer = BytesIO(excel_bytes)
-        df = pd.read_excel(excel_buffer, engine='openpyxl')
+        df = pd.read_excel(excel_buffer, engine=engine, **_dtype_backend_kwargs(dtype_backend))
 
         return df
 
 
     def list_cash_flows(self, start_date: str, end_date: str,
-                        institute_kind: Optional[str] = None) -> List[Dict[str, Any]]:
+                        institute_kind: Optional[str] = None,
+                        limit: Optional[int] = None, offset: int = 0,
+                        raw: bool = False,
+                        timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ListCashFlowsResponse]:
         """
         Get cash flow summary for multiple funds
 
@@ -367,34 +1432,46 @@ class VigilioClient:
             start_date: Start date (required)
             end_date: End date (required)
             institute_kind: Optional institute kind to filter by
+            limit: Optional page size, applied by the server
+            offset: Rows to skip before the page starts (default: 0)
+            raw: Return the protobuf response message itself; its total
+                field holds the unpaged row count when the server pages
 
         Returns:
-            List of cash flows with aggregated data
+            List of cash flows with aggregated data, or the
+            ListCashFlowsResponse message if raw=True
         """
-        request = vigilio_pb2.ListCashFlowsRequest(
-            start_date=start_date,
-            end_date=end_date,
-            institute_kind=institute_kind if institute_kind else ""
-        )
-        response = self.stub.ListCashFlows(request)
+        request = self._cash_flows_request(start_date, end_date, institute_kind, limit, offset)
+        response = self.stub.ListCashFlows(request, timeout=timeout)
 
-        return [
-            {
-                'cash_flow': cf.cash_flow,
-                'in_flow': cf.in_flow,
-                'out_flow': cf.out_flow,
-                'profits': cf.profits,
-                'fund_name': cf.fund_name,
-                'fund_type': cf.fund_type,
-                'fund_id': cf.fund_id,
-                'symbol': cf.symbol,
-                'institute_kind': cf.institute_kind
-            }
-            for cf in response.cash_flows
-        ]
+        if raw:
+            return response
+        return list(map(_Row, response.cash_flows))
+
+    def iter_cash_flows(self, start_date: str, end_date: str,
+                        institute_kind: Optional[str] = None,
+                        timeout: Optional[float] = None) -> Iterator[Mapping[str, Any]]:
+        """
+        Stream cash flow summary for multiple funds batch by batch
+
+        Older servers fall back to ListCashFlows.
+
+        Args:
+            start_date: Start date (required)
+            end_date: End date (required)
+            institute_kind: Optional institute kind to filter by
+
+        Yields:
+            Cash flows with aggregated data (see list_cash_flows)
+        """
+        request = self._cash_flows_request(start_date, end_date, institute_kind)
+        stub = self.stub
+        yield from self._iter_list_stream(stub.StreamListCashFlows, stub.ListCashFlows,
+                                          request, 'cash_flows', timeout)
 
     def get_cash_flow_detail(self, fund_id: int, start_date: str, end_date: str,
-                             fund_type: str, institute_kind: Optional[str] = None) -> List[Dict[str, Any]]:
+                             fund_type: str, institute_kind: Optional[str] = None,
+                             timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
         """
         Get detailed cash flow for a specific fund
 
@@ -408,38 +1485,18 @@ class VigilioClient:
         Returns:
             List of detailed cash flows by date
         """
-        request = vigilio_pb2.GetCashFlowDetailRequest(
-            fund_id=fund_id,
-            start_date=start_date,
-            end_date=end_date,
-            fund_type=fund_type,
-            institute_kind=institute_kind if institute_kind else ""
-        )
-        response = self.stub.GetCashFlowDetail(request)
+        request = self._cash_flow_detail_request(fund_id, start_date, end_date, fund_type, institute_kind)
+        response = self.stub.GetCashFlowDetail(request, timeout=timeout)
 
-        return [
-            {
-                'cash_flow': cf.cash_flow,
-                'in_flow': cf.in_flow,
-                'out_flow': cf.out_flow,
-                'total_units': cf.total_units,
-                'purchase': cf.purchase,
-                'redemption': cf.redemption,
-                'issued_units': cf.issued_units,
-                'revoked_units': cf.revoked_units,
-                'fund_name': cf.fund_name,
-                'fund_type': cf.fund_type,
-                'fund_id': cf.fund_id,
-                'symbol': cf.symbol,
-                'date': cf.date
-            }
-            for cf in response.cash_flows
-        ]
+        return list(map(_Row, response.cash_flows))
 
     def list_total_returns(self, fund_type: Optional[str] = None,
                           fund_id: Optional[int] = None,
                           institute_kind: Optional[str] = None,
-                          date: Optional[str] = None) -> List[Dict[str, Any]]:
+                          date: Optional[str] = None,
+                          limit: Optional[int] = None, offset: int = 0,
+                          raw: bool = False,
+                           timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ListTotalReturnsResponse]:
         """
         Get total returns for all funds
 
@@ -448,45 +1505,74 @@ class VigilioClient:
             fund_id: Optional fund ID to filter by
             institute_kind: Optional institute kind to filter by
             date: Optional date in Jalali format
+            limit: Optional page size, applied by the server
+            offset: Rows to skip before the page starts (default: 0)
+            raw: Return the protobuf response message itself; its total
+                field holds the unpaged row count when the server pages
 
         Returns:
-            List of total returns with NAV, price, and return data
+            List of total returns with NAV, price, and return data, or the
+            ListTotalReturnsResponse message if raw=True
         """
-        request = vigilio_pb2.ListTotalReturnsRequest(
-            fund_type=fund_type if fund_type else "",
-            fund_id=fund_id if fund_id else 0,
-            institute_kind=institute_kind if institute_kind else "",
-            date=date if date else ""
-        )
-        response = self.stub.ListTotalReturns(request)
+        request = self._total_returns_request(fund_type, fund_id, institute_kind, date, limit, offset)
+        response = self.stub.ListTotalReturns(request, timeout=timeout)
+
+        if raw:
+            return response
+        return list(map(_Row, response.returns))
+
+    def list_total_returns_df(self, fund_type: Optional[str] = None,
+                              fund_id: Optional[int] = None,
+                              institute_kind: Optional[str] = None,
+                              date: Optional[str] = None,
+                              timeout: Optional[float] = None):
+        """
+        Get total returns for all funds as a pandas DataFrame
 
-        return [
-            {
-                'id': ret.id,
-                'date': ret.date,
-                'fund_id': ret.fund_id,
-                'fund_name': ret.fund_name,
-                'fund_type': ret.fund_type,
-                'institute_kind': ret.institute_kind,
-                'last_nav': ret.last_nav,
-                'last_nav_date': ret.last_nav_date,
-                'last_price': ret.last_price,
-                'last_price_date': ret.last_price_date,
-                'has_profit': ret.has_profit,
-                'has_split': ret.has_split,
-                'total_units': ret.total_units,
-                'bubble': ret.bubble,
-                'thirty': ret.thirty,
-                'ninety': ret.ninety,
-                'one_eighty': ret.one_eighty,
-                'three_sixty': ret.three_sixty
-            }
-            for ret in response.returns
-        ]
+        Args:
+            fund_type: Optional fund type - "Codal Fund" or "ETF Fund"
+            fund_id: Optional fund ID to filter by
+            institute_kind: Optional institute kind to filter by
+            date: Optional date in Jalali format
+
+        Returns:
+            pandas DataFrame with one column per TotalReturnItem field
+        """
+        request = self._total_returns_request(fund_type, fund_id, institute_kind, date)
+        response = self.stub.ListTotalReturns(request, timeout=timeout)
+
+        return _messages_to_frame(response.returns, vigilio_pb2.TotalReturnItem.DESCRIPTOR)
+
+    def iter_total_returns(self, fund_type: Optional[str] = None,
+                           fund_id: Optional[int] = None,
+                           institute_kind: Optional[str] = None,
+                           date: Optional[str] = None,
+                           timeout: Optional[float] = None) -> Iterator[Mapping[str, Any]]:
+        """
+        Stream total returns for all funds batch by batch
+
+        Older servers fall back to ListTotalReturns.
+
+        Args:
+            fund_type: Optional fund type - "Codal Fund" or "ETF Fund"
+            fund_id: Optional fund ID to filter by
+            institute_kind: Optional institute kind to filter by
+            date: Optional date in Jalali format
+
+        Yields:
+            Total returns with NAV, price, and return data
+        """
+        request = self._total_returns_request(fund_type, fund_id, institute_kind, date)
+        stub = self.stub
+        yield from self._iter_list_stream(stub.StreamListTotalReturns, stub.ListTotalReturns,
+                                          request, 'returns', timeout)
 
     def list_etf_returns(self, fund_id: Optional[int] = None,
                         institute_kind: Optional[str] = None,
-                        date: Optional[str] = None) -> List[Dict[str, Any]]:
+                        date: Optional[str] = None,
+                        limit: Optional[int] = None, offset: int = 0,
+                        raw: bool = False,
+                         timeout: Optional[float] = None) -> Union[List[Mapping[str, Any]], vigilio_pb2.ListEtfReturnsResponse]:
         """
         Get ETF returns
 
@@ -494,47 +1580,72 @@ class VigilioClient:
             fund_id: Optional fund ID to filter by
             institute_kind: Optional institute kind to filter by
             date: Optional date in Jalali format
+            limit: Optional page size, applied by the server
+            offset: Rows to skip before the page starts (default: 0)
+            raw: Return the protobuf response message itself; its total
+                field holds the unpaged row count when the server pages
 
         Returns:
-            List of ETF returns with NAV, price, and return data
+            List of ETF returns with NAV, price, and return data, or the
+            ListEtfReturnsResponse message if raw=True
         """
-        request = vigilio_pb2.ListEtfReturnsRequest(
-            fund_id=fund_id if fund_id else 0,
-            institute_kind=institute_kind if institute_kind else "",
-            date=date if date else ""
-        )
-        response = self.stub.ListEtfReturns(request)
+        request = self._etf_returns_request(fund_id, institute_kind, date, limit, offset)
+        response = self.stub.ListEtfReturns(request, timeout=timeout)
 
-        return [
-            {
-                'id': ret.id,
-                'date': ret.date,
-                'fund_id': ret.fund_id,
-                'fund_name': ret.fund_name,
-                'fund_type': ret.fund_type,
-                'institute_kind': ret.institute_kind,
-                'last_nav': ret.last_nav,
-                'last_nav_date': ret.last_nav_date,
-                'last_price': ret.last_price,
-                'last_price_date': ret.last_price_date,
-                'has_profit': ret.has_profit,
-                'has_split': ret.has_split,
-                'total_units': ret.total_units,
-                'bubble': ret.bubble,
-                'thirty': ret.thirty,
-                'ninety': ret.ninety,
-                'one_eighty': ret.one_eighty,
-                'three_sixty': ret.three_sixty
-            }
-            for ret in response.returns
-        ]
+        if raw:
+            return response
+        return list(map(_Row, response.returns))
+
+    def list_etf_returns_df(self, fund_id: Optional[int] = None,
+                            institute_kind: Optional[str] = None,
+                            date: Optional[str] = None,
+                            timeout: Optional[float] = None):
+        """
+        Get ETF returns as a pandas DataFrame
 
-    def get_nav_trend(self, fund_id: int) -> Dict[str, Any]:
+        Args:
+            fund_id: Optional fund ID to filter by
+            institute_kind: Optional institute kind to filter by
+            date: Optional date in Jalali format
+
+        Returns:
+            pandas DataFrame with one column per EtfReturnItem field
+        """
+        request = self._etf_returns_request(fund_id, institute_kind, date)
+        response = self.stub.ListEtfReturns(request, timeout=timeout)
+
+        return _messages_to_frame(response.returns, vigilio_pb2.EtfReturnItem.DESCRIPTOR)
+
+    def iter_etf_returns(self, fund_id: Optional[int] = None,
+                         institute_kind: Optional[str] = None,
+                         date: Optional[str] = None,
+                         timeout: Optional[float] = None) -> Iterator[Mapping[str, Any]]:
+        """
+        Stream ETF returns batch by batch
+
+        Older servers fall back to ListEtfReturns.
+
+        Args:
+            fund_id: Optional fund ID to filter by
+            institute_kind: Optional institute kind to filter by
+            date: Optional date in Jalali format
+
+        Yields:
+            ETF returns with NAV, price, and return data
+        """
+        request = self._etf_returns_request(fund_id, institute_kind, date)
+        stub = self.stub
+        yield from self._iter_list_stream(stub.StreamListEtfReturns, stub.ListEtfReturns,
+                                          request, 'returns', timeout)
+
+    def get_nav_trend(self, fund_id: int, as_numpy: bool = False, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Get NAV trend data for a specific fund
 
         Args:
             fund_id: Fund ID (LastFundNavAndDividendDate id)
+            as_numpy: Return chart_data series as numpy arrays instead of
+                lists, skipping the per-element Python copy (requires numpy)
 
         Returns:
             NAV trend data with chart data
@@ -548,34 +1659,37 @@ class VigilioClient:
                 }
             }
         """
-        request = vigilio_pb2.GetNavTrendRequest(fund_id=fund_id)
-        response = self.stub.GetNavTrend(request)
+        request = self._fund_request(vigilio_pb2.GetNavTrendRequest, fund_id)
+        response = self.stub.GetNavTrend(request, timeout=timeout)
 
-        return {
-            'nav_trend': [
-                {
-                    'net_asset_value': item.net_asset_value,
-                    'date': item.date,
-                    'nav_data': {
-                        'purchase': item.nav_data.purchase if item.nav_data.HasField('purchase') else None,
-                        'redemption': item.nav_data.redemption if item.nav_data.HasField('redemption') else None,
-                        'statistical': item.nav_data.statistical if item.nav_data.HasField('statistical') else None,
-                        'preferred_purchase': item.nav_data.preferred_purchase if item.nav_data.HasField('preferred_purchase') else None,
-                        'preferred_redemption': item.nav_data.preferred_redemption if item.nav_data.HasField('preferred_redemption') else None,
-                        'common': item.nav_data.common if item.nav_data.HasField('common') else None
-                    }
-                }
-                for item in response.nav_trend
-            ],
-            'chart_data': {
-                'dates': list(response.chart_data.dates),
-                'statisticals': list(response.chart_data.statisticals),
-                'purchases': list(response.chart_data.purchases),
-                'redemptions': list(response.chart_data.redemptions)
-            }
-        }
+        return _nav_trend_to_dict(response, as_numpy=as_numpy)
+
+    def get_nav_trend_chart_df(self, fund_id: int, timeout: Optional[float] = None):
+        """
+        Get NAV trend chart data for a specific fund as a pandas DataFrame
 
-    def get_splits(self, fund_id: int) -> List[Dict[str, Any]]:
+        Args:
+            fund_id: Fund ID (LastFundNavAndDividendDate id)
+
+        Returns:
+            pandas DataFrame with dates, statisticals, purchases and
+            redemptions columns
+        """
+        pd, np = _import_pandas()
+
+        request = self._fund_request(vigilio_pb2.GetNavTrendRequest, fund_id)
+        response = self.stub.GetNavTrend(request, timeout=timeout)
+        chart = response.chart_data
+
+        return pd.DataFrame({
+            'dates': np.asarray(chart.dates, dtype=object),
+            'statisticals': np.asarray(chart.statisticals, dtype='float64'),
+            'purchases': np.asarray(chart.purchases, dtype='float64'),
+            'redemptions': np.asarray(chart.redemptions, dtype='float64')
+        }, copy=False)
+
+    @_cached
+    def get_splits(self, fund_id: int, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
         """
         Get fund splits for a specific fund
 
@@ -585,18 +1699,13 @@ class VigilioClient:
         Returns:
             List of fund splits
         """
-        request = vigilio_pb2.GetSplitsRequest(fund_id=fund_id)
-        response = self.stub.GetSplits(request)
+        request = self._fund_request(vigilio_pb2.GetSplitsRequest, fund_id)
+        response = self.stub.GetSplits(request, timeout=timeout)
 
-        return [
-            {
-                'date': split.date,
-                'units_ratio': split.units_ratio
-            }
-            for split in response.splits
-        ]
+        return list(map(_Row, response.splits))
 
-    def get_profits(self, fund_id: int) -> List[Dict[str, Any]]:
+    @_cached
+    def get_profits(self, fund_id: int, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
         """
         Get fund profits/dividends for a specific fund
 
@@ -606,18 +1715,28 @@ class VigilioClient:
         Returns:
             List of fund profits
         """
-        request = vigilio_pb2.GetProfitsRequest(fund_id=fund_id)
-        response = self.stub.GetProfits(request)
+        request = self._fund_request(vigilio_pb2.GetProfitsRequest, fund_id)
+        response = self.stub.GetProfits(request, timeout=timeout)
 
-        return [
-            {
-                'profit': profit.profit,
-                'date': profit.date
-            }
-            for profit in response.profits
-        ]
+        return list(map(_Row, response.profits))
+
+    def get_profits_df(self, fund_id: int, timeout: Optional[float] = None):
+        """
+        Get fund profits/dividends for a specific fund as a pandas DataFrame
+
+        Args:
+            fund_id: Fund ID (LastFundNavAndDividendDate id)
 
-    def get_prices(self, fund_id: int) -> List[Dict[str, Any]]:
+        Returns:
+            pandas DataFrame with profit and date columns
+        """
+        request = self._fund_request(vigilio_pb2.GetProfitsRequest, fund_id)
+        response = self.stub.GetProfits(request, timeout=timeout)
+
+        return _messages_to_frame(response.profits, vigilio_pb2.ProfitItem.DESCRIPTOR)
+
+    @_cached
+    def get_prices(self, fund_id: int, timeout: Optional[float] = None) -> List[Mapping[str, Any]]:
         """
         Get ETF close prices for a specific fund
 
@@ -627,33 +1746,106 @@ class VigilioClient:
         Returns:
             List of ETF close prices
         """
-        request = vigilio_pb2.GetPricesRequest(fund_id=fund_id)
-        response = self.stub.GetPrices(request)
+        request = self._fund_request(vigilio_pb2.GetPricesRequest, fund_id)
+        response = self.stub.GetPrices(request, timeout=timeout)
 
-        return [
-            {
-                'date': price.date,
-                'price': price.price
-            }
-            for price in response.prices
-        ]
+        return list(map(_Row, response.prices))
 
+    def get_prices_df(self, fund_id: int, timeout: Optional[float] = None):
+        """
+        Get ETF close prices for a specific fund as a pandas DataFrame
 
-    def ping(self) -> bool:
+        Args:
+            fund_id: Fund ID (LastFundNavAndDividendDate id)
+
+        Returns:
+            pandas DataFrame with date and price columns
+        """
+        request = self._fund_request(vigilio_pb2.GetPricesRequest, fund_id)
+        response = self.stub.GetPrices(request, timeout=timeout)
+
+        return _messages_to_frame(response.prices, vigilio_pb2.PriceItem.DESCRIPTOR)
+
+
+    def get_fund_bundle(self, fund_id: int, nav_trend: bool = True,
+                        splits: bool = True, profits: bool = True,
+                        prices: bool = True,
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get NAV trend, splits, profits and prices for a fund in one RPC
+
+        Falls back to the individual RPCs when the server does not
+        implement GetFundBundle.
+
+        Args:
+            fund_id: Fund ID (LastFundNavAndDividendDate id)
+            nav_trend: Include NAV trend data (same shape as get_nav_trend)
+            splits: Include fund splits
+            profits: Include fund profits/dividends
+            prices: Include ETF close prices
+
+        Returns:
+            Dict with one key per requested section
+            Example: {
+                'nav_trend': {'nav_trend': [...], 'chart_data': {...}},
+                'splits': [...],
+                'profits': [...],
+                'prices': [...]
+            }
+        """
+        request = self._reusable_request(vigilio_pb2.GetFundBundleRequest)
+        request.fund_id = fund_id
+        request.skip_nav_trend = not nav_trend
+        request.skip_splits = not splits
+        request.skip_profits = not profits
+        request.skip_prices = not prices
+
+        try:
+            response = self.stub.GetFundBundle(request, timeout=timeout)
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            response = None
+
+        bundle = {}
+        if nav_trend:
+            bundle['nav_trend'] = (_nav_trend_to_dict(response.nav_trend) if response
+                                   else self.get_nav_trend(fund_id, timeout=timeout))
+        if splits:
+            bundle['splits'] = (list(map(_Row, response.splits)) if response
+                                else self.get_splits(fund_id, timeout=timeout))
+        if profits:
+            bundle['profits'] = (list(map(_Row, response.profits)) if response
+                                 else self.get_profits(fund_id, timeout=timeout))
+        if prices:
+            bundle['prices'] = (list(map(_Row, response.prices)) if response
+                                else self.get_prices(fund_id, timeout=timeout))
+
+        return bundle
+
+
+    def ping(self, timeout: Optional[float] = 1.0) -> bool:
         """
         Test connection to server
 
+        Served from the fund types cache after the first successful call.
+
+        Args:
+            timeout: Seconds to wait for the server, so an unreachable
+                server fails fast instead of hanging (default: 1)
+
         Returns:
             True if connection successful, False otherwise
         """
         try:
-            self.get_fund_types()
+            self.get_fund_types(timeout=timeout)
             return True
         except Exception:
             return False
 
     def __repr__(self):
-        return f"VigilioClient(host='{self.host}', secure={self.secure})"
+        return (f"VigilioClient(host='{self.host}', secure={self.secure}, "
+                f"pool_size={self.pool_size})")
 
 
 def example_usage():
@@ -669,15 +1861,13 @@ def example_usage():
 
         print("✓ Connected to Vigilio gRPC Server")
 
-        # Get fund types
+        # Get fund types and list shareholders (both RPCs in flight at once)
         print("\n1. Getting fund types...")
-        fund_types = client.get_fund_types()
+        fund_types, shareholders = client.prefetch_fund_types_and_shareholders()
         for ft in fund_types:
             print(f"  - {ft['name']} (ID: {ft['id']})")
 
-        # List shareholders
         print("\n2. Listing shareholders...")
-        shareholders = client.list_shareholders()
         print(f"  Total shareholders: {len(shareholders)}")
         for sh in shareholders[:3]:
             print(f"  - {sh['name']} (ID: {sh['id']})")
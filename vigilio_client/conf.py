@@ -7,8 +7,17 @@ Add these settings to your Django project's settings.py:
 VIGILIO_GRPC_HOST = '127.0.0.1:50051'  # gRPC server host and port
 VIGILIO_GRPC_SECURE = False  # Use secure connection (SSL/TLS)
 VIGILIO_GRPC_CREDENTIALS_PATH = None  # Path to SSL credentials if secure=True
+VIGILIO_GRPC_POOL_SIZE = 4  # Number of gRPC channels to round-robin RPCs over
+VIGILIO_GRPC_DEFAULT_TIMEOUT = 30.0  # Deadline in seconds for each RPC (None waits forever)
+VIGILIO_FUND_TYPES_CACHE_TIMEOUT = 3600  # Seconds to cache fund-types responses
+VIGILIO_FUND_DATA_CACHE_TIMEOUT = 900  # Seconds to cache splits/profits/prices responses
+VIGILIO_SUMMARY_CACHE_TIMEOUT = 300  # Seconds to cache shareholders summary responses
+VIGILIO_EXCEL_CACHE_TIMEOUT = 3600  # Seconds to cache generated Excel exports
 """
 
+import asyncio
+import threading
+
 from django.conf import settings
 
 
@@ -22,4 +31,72 @@ DEFAULTS = {
     'GRPC_HOST': '127.0.0.1:50051',
     'GRPC_SECURE': False,
     'GRPC_CREDENTIALS_PATH': None,
-}
\ No newline at end of file
+    'GRPC_POOL_SIZE': 4,
+    'GRPC_DEFAULT_TIMEOUT': 30.0,
+    'FUND_TYPES_CACHE_TIMEOUT': 60 * 60,
+    'FUND_DATA_CACHE_TIMEOUT': 60 * 15,
+    'SUMMARY_CACHE_TIMEOUT': 60 * 5,
+    'EXCEL_CACHE_TIMEOUT': 60 * 60,
+}
+
+
+def _setting(name):
+    return get_vigilio_setting(name, DEFAULTS[name])
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+_default_async_clients = {}
+
+
+def get_default_client():
+    """
+    Return the process-wide VigilioClient configured from Django settings
+
+    Built on first use and shared by every thread; VigilioClient is
+    thread-safe, so views should use this instead of creating a client
+    per request.
+    """
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                from .client import VigilioClient
+
+                _default_client = VigilioClient(
+                    host=_setting('GRPC_HOST'),
+                    secure=_setting('GRPC_SECURE'),
+                    credentials_path=_setting('GRPC_CREDENTIALS_PATH'),
+                    pool_size=_setting('GRPC_POOL_SIZE'),
+                    timeout=_setting('GRPC_DEFAULT_TIMEOUT'),
+                )
+    return _default_client
+
+
+def get_default_async_client():
+    """
+    Return the AsyncVigilioClient for the running event loop
+
+    grpc.aio channels belong to the loop they were created on, so one
+    client is kept per loop; under an ASGI server that is one per worker.
+    Clients of loops that have since been closed (e.g. the short-lived loops
+    async_to_sync runs) are dropped on the next call, which releases their
+    channels. Must be called from a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_async_clients.get(loop)
+    if client is None:
+        # A channel references its loop, so entries can't be weak-keyed
+        for closed in [l for l in _default_async_clients if l.is_closed()]:
+            del _default_async_clients[closed]
+        from .aio import AsyncVigilioClient
+
+        client = AsyncVigilioClient(
+            host=_setting('GRPC_HOST'),
+            secure=_setting('GRPC_SECURE'),
+            credentials_path=_setting('GRPC_CREDENTIALS_PATH'),
+            timeout=_setting('GRPC_DEFAULT_TIMEOUT'),
+        )
+        _default_async_clients[loop] = client
+    return client
+
@@ -0,0 +1,77 @@
+"""
+gRPC client interceptors used by VigilioClient
+"""
+
+import collections
+import time
+from typing import Optional
+
+import grpc
+
+
+# Statuses worth retrying: the server was unreachable or shed load
+RETRYABLE_STATUS_CODES = (
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+
+
+class _ClientCallDetails(
+        collections.namedtuple(
+            '_ClientCallDetails',
+            ('method', 'timeout', 'metadata', 'credentials', 'wait_for_ready', 'compression')),
+        grpc.ClientCallDetails):
+    pass
+
+
+class RetryInterceptor(grpc.UnaryUnaryClientInterceptor,
+                       grpc.UnaryStreamClientInterceptor):
+    """
+    Retry unary-unary RPCs on transient failures with exponential backoff
+
+    Calls made without an explicit timeout get default_timeout, so a slow or
+    dead server can't hold the caller forever. Calls started with .future()
+    are handed back still in flight so several can pipeline; they get the
+    default timeout but are not retried. Unary-stream calls get the default
+    timeout too, as a deadline for the whole stream, and are not retried
+    either: part of the stream may already have reached the caller.
+
+    Attributes:
+        max_retries (int): Retries after the first attempt
+        backoff (float): Delay before the first retry, doubled each retry
+        default_timeout (float): Deadline in seconds for calls without one
+    """
+
+    def __init__(self, max_retries: int = 3, backoff: float = 0.05,
+                 default_timeout: Optional[float] = 30.0):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.default_timeout = default_timeout
+
+    def _with_default_timeout(self, details):
+        if details.timeout is not None or self.default_timeout is None:
+            return details
+        return _ClientCallDetails(
+            details.method,
+            self.default_timeout,
+            details.metadata,
+            details.credentials,
+            getattr(details, 'wait_for_ready', None),
+            getattr(details, 'compression', None),
+        )
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        details = self._with_default_timeout(client_call_details)
+
+        for attempt in range(self.max_retries + 1):
+            response = continuation(details, request)
+            if not response.done():
+                return response
+            if response.code() not in RETRYABLE_STATUS_CODES or attempt == self.max_retries:
+                return response
+            time.sleep(self.backoff * (2 ** attempt))
+
+        return response
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return continuation(self._with_default_timeout(client_call_details), request)
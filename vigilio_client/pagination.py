@@ -0,0 +1,40 @@
+"""
+Pagination for the Vigilio REST views
+"""
+
+from rest_framework.pagination import LimitOffsetPagination
+
+
+class RPCLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination applied by the gRPC server
+
+    Views pass rpc_limit_offset() on to the list RPC and hand the rows it
+    returns to paginate_rows(), so only one page crosses the wire. Servers
+    that ignore limit/offset send every row, which is then sliced here.
+    """
+
+    def rpc_limit_offset(self, request):
+        """(limit, offset) to request; limit is None when not paginating"""
+        limit = self.get_limit(request)
+        if limit is None:
+            return None, 0
+        return limit, self.get_offset(request)
+
+    def paginate_rows(self, rows, total, request):
+        """
+        Return the page to render from the rows of a list RPC
+
+        Args:
+            rows: Rows returned for rpc_limit_offset()'s limit/offset
+            total: Server's row count before paging, or None if it
+                didn't page (rows is then the full list)
+        """
+        if total is None:
+            return self.paginate_queryset(rows, request)
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.offset = self.get_offset(request)
+        self.count = total
+        return rows
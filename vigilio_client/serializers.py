@@ -1,17 +1,76 @@
+import copy
+
 from rest_framework import serializers
 
 
-class FundTypeSerializer(serializers.Serializer):
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class instead of per instance
+
+    DRF deep-copies the declared fields every time a serializer is created.
+    These serializers only format output, so the first deep copy is kept on
+    the class and later instances get shallow copies of it.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_fields')
+        if cached is None:
+            cached = super().get_fields()
+            cls._cached_fields = cached
+        return {name: copy.copy(field) for name, field in cached.items()}
+
+
+def warm_up_serializers():
+    """
+    Build and cache the fields of every CachedFieldsMixin serializer now
+
+    Called from AppConfig.ready() so the first request after a restart
+    doesn't pay for it. Nested list fields share their child serializer
+    with the cache, so the child's fields are built here too.
+    """
+    pending = list(CachedFieldsMixin.__subclasses__())
+    while pending:
+        cls = pending.pop()
+        pending.extend(cls.__subclasses__())
+        for field in cls().fields.values():
+            child = getattr(field, 'child', None)
+            if isinstance(child, serializers.BaseSerializer):
+                child.fields
+
+
+class RawListField(serializers.Field):
+    """
+    Read-only list field that outputs trusted values without child fields
+
+    ListField runs its child field once per item; chart columns from the
+    gRPC service hold thousands of plain scalars, so they are copied in one
+    call instead. item_type (e.g. float) converts every item the way the
+    matching child field would.
+    """
+
+    def __init__(self, item_type=None, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+        self.item_type = item_type
+
+    def to_representation(self, value):
+        if self.item_type is None:
+            return list(value)
+        return list(map(self.item_type, value))
+
+
+class FundTypeSerializer(CachedFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField()
     name = serializers.CharField()
 
 
-class ShareHolderListSerializer(serializers.Serializer):
+class ShareHolderListSerializer(CachedFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField()
     name = serializers.CharField()
 
 
-class ShareHolderHistorySerializer(serializers.Serializer):
+class ShareHolderHistorySerializer(CachedFieldsMixin, serializers.Serializer):
     fund_id = serializers.IntegerField()
     fund = serializers.CharField()
     share_count = serializers.FloatField()
@@ -21,25 +80,58 @@ class ShareHolderHistorySerializer(serializers.Serializer):
     pct_of_shares = serializers.FloatField()
 
 
-class ShareHolderSummarySerializer(serializers.Serializer):
+class ShareHolderSummarySerializer(CachedFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField()
     name = serializers.CharField()
     num_funds = serializers.IntegerField()
     total_value = serializers.FloatField()
 
 
-class ShareHolderForDateSerializer(serializers.Serializer):
+SUMMARY_ORDERING_FIELDS = ('id', 'name', 'num_funds', 'total_value')
+
+
+class ShareHolderSummaryQuerySerializer(serializers.Serializer):
+    """
+    Query params of the shareholders summary endpoints
+
+    Checked before any RPC is made, so a malformed date or an unknown
+    ordering is a 400 instead of a round trip to the server. Blank values
+    are accepted and mean "not given", as before.
+    """
+    date = serializers.RegexField(
+        r'^\d{4}/\d{2}/\d{2}$', required=False, allow_blank=True,
+        error_messages={'invalid': "Enter a Jalali date as YYYY/MM/DD (e.g. '1403/08/15')."}
+    )
+    fund_type = serializers.CharField(required=False, allow_blank=True)
+    search = serializers.CharField(required=False, allow_blank=True)
+    ordering = serializers.ChoiceField(
+        choices=[prefix + name for name in SUMMARY_ORDERING_FIELDS for prefix in ('', '-')],
+        required=False, allow_blank=True
+    )
+
+
+class FundIdQuerySerializer(serializers.Serializer):
+    """
+    Optional fund_id query param of the returns endpoints
+
+    A blank value means "not given"; anything else must be a non-negative
+    integer.
+    """
+    fund_id = serializers.IntegerField(required=False, min_value=0)
+
+
+class ShareHolderForDateSerializer(CachedFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField()
     shareholder_name = serializers.CharField()
     share_holder_histories = ShareHolderHistorySerializer(many=True)
 
 
-class ChartDataSerializer(serializers.Serializer):
-    dates = serializers.ListField(child=serializers.CharField())
-    share_counts = serializers.ListField(child=serializers.FloatField())
+class ChartDataSerializer(CachedFieldsMixin, serializers.Serializer):
+    dates = RawListField()
+    share_counts = RawListField(item_type=float)
 
 
-class ShareHolderDetailHistorySerializer(serializers.Serializer):
+class ShareHolderDetailHistorySerializer(CachedFieldsMixin, serializers.Serializer):
     fund_id = serializers.IntegerField()
     fund = serializers.CharField()
     fund_type = serializers.CharField()
@@ -49,14 +141,14 @@ class ShareHolderDetailHistorySerializer(serializers.Serializer):
     date = serializers.CharField()
 
 
-class ShareHolderDetailSerializer(serializers.Serializer):
+class ShareHolderDetailSerializer(CachedFieldsMixin, serializers.Serializer):
     shareholder_name = serializers.CharField()
     share_holder_histories = ShareHolderDetailHistorySerializer(many=True)
     chart_data = ChartDataSerializer(many=True)
 
 
 # Cash Flow Serializers
-class CashFlowSerializer(serializers.Serializer):
+class CashFlowSerializer(CachedFieldsMixin, serializers.Serializer):
     cash_flow = serializers.FloatField()
     in_flow = serializers.FloatField()
     out_flow = serializers.FloatField()
@@ -68,7 +160,7 @@ class CashFlowSerializer(serializers.Serializer):
     institute_kind = serializers.CharField()
 
 
-class CashFlowDetailSerializer(serializers.Serializer):
+class CashFlowDetailSerializer(CachedFieldsMixin, serializers.Serializer):
     cash_flow = serializers.FloatField()
     in_flow = serializers.FloatField()
     out_flow = serializers.FloatField()
@@ -85,7 +177,7 @@ class CashFlowDetailSerializer(serializers.Serializer):
 
 
 # Returns Serializers
-class TotalReturnSerializer(serializers.Serializer):
+class TotalReturnSerializer(CachedFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField()
     date = serializers.CharField()
     fund_id = serializers.IntegerField()
@@ -106,7 +198,7 @@ class TotalReturnSerializer(serializers.Serializer):
     three_sixty = serializers.FloatField()
 
 
-class EtfReturnSerializer(serializers.Serializer):
+class EtfReturnSerializer(CachedFieldsMixin, serializers.Serializer):
     id = serializers.IntegerField()
     date = serializers.CharField()
     fund_id = serializers.IntegerField()
@@ -128,7 +220,7 @@ class EtfReturnSerializer(serializers.Serializer):
 
 
 # NAV Trend Serializers
-class NavDataSerializer(serializers.Serializer):
+class NavDataSerializer(CachedFieldsMixin, serializers.Serializer):
     purchase = serializers.FloatField(allow_null=True)
     redemption = serializers.FloatField(allow_null=True)
     statistical = serializers.FloatField(allow_null=True)
@@ -137,35 +229,35 @@ class NavDataSerializer(serializers.Serializer):
     common = serializers.FloatField(allow_null=True)
 
 
-class NavTrendItemSerializer(serializers.Serializer):
+class NavTrendItemSerializer(CachedFieldsMixin, serializers.Serializer):
     net_asset_value = serializers.FloatField()
     date = serializers.CharField()
     nav_data = NavDataSerializer()
 
 
-class NavTrendChartDataSerializer(serializers.Serializer):
+class NavTrendChartDataSerializer(CachedFieldsMixin, serializers.Serializer):
     dates = serializers.ListField(child=serializers.CharField())
     statisticals = serializers.ListField(child=serializers.FloatField())
     purchases = serializers.ListField(child=serializers.FloatField())
     redemptions = serializers.ListField(child=serializers.FloatField())
 
 
-class NavTrendSerializer(serializers.Serializer):
+class NavTrendSerializer(CachedFieldsMixin, serializers.Serializer):
     nav_trend = NavTrendItemSerializer(many=True)
     chart_data = NavTrendChartDataSerializer()
 
 
 # Splits, Profits, Prices Serializers
-class SplitSerializer(serializers.Serializer):
+class SplitSerializer(CachedFieldsMixin, serializers.Serializer):
     date = serializers.CharField()
     units_ratio = serializers.FloatField()
 
 
-class ProfitSerializer(serializers.Serializer):
+class ProfitSerializer(CachedFieldsMixin, serializers.Serializer):
     profit = serializers.FloatField()
     date = serializers.CharField()
 
 
-class PriceSerializer(serializers.Serializer):
+class PriceSerializer(CachedFieldsMixin, serializers.Serializer):
     date = serializers.CharField()
     price = serializers.FloatField()
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+In-process fake of the Vigilio gRPC service for the tests
+"""
+
+import collections
+from concurrent import futures
+
+import grpc
+from .. import vigilio_pb2
+from .. import vigilio_pb2_grpc
+
+
+EXCEL_FILE = b'PK\x03\x04' + b'x' * 1000
+
+
+class FakeVigilioServicer(vigilio_pb2_grpc.VigilioServiceServicer):
+    """
+    Answers the unary RPCs with small fixed data
+
+    The streaming RPCs, GetFundBundle and BatchGetShareHolderDetail are left
+    to the generated base class, which answers UNIMPLEMENTED like an older
+    server, so the clients' fallbacks run.
+
+    Attributes:
+        calls (Counter): Number of calls received per RPC name
+        requests (dict): Last request received per RPC name
+        failures (dict): Status codes to abort the next calls of an RPC
+            with, per RPC name, used up in order
+    """
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.requests = {}
+        self.failures = {}
+
+    def _received(self, name, request, context):
+        self.calls[name] += 1
+        self.requests[name] = request
+        pending = self.failures.get(name)
+        if pending:
+            context.abort(pending.pop(0), 'injected failure')
+
+    def GetFundTypes(self, request, context):
+        self._received('GetFundTypes', request, context)
+        return vigilio_pb2.GetFundTypesResponse(fund_types=[
+            vigilio_pb2.FundType(id=1, name='ETF'),
+            vigilio_pb2.FundType(id=2, name='اهرمی'),
+        ])
+
+    def ListShareHolders(self, request, context):
+        self._received('ListShareHolders', request, context)
+        return vigilio_pb2.ShareHolderListResponse(shareholders=[
+            vigilio_pb2.ShareHolderByName(id=i, name=f'shareholder {i}') for i in range(5)
+        ])
+
+    def ShareHoldersSummary(self, request, context):
+        self._received('ShareHoldersSummary', request, context)
+        return vigilio_pb2.ShareHolderSummaryListResponse(shareholders=[
+            vigilio_pb2.ShareHolderSummaryItem(id=i, name=f'shareholder {i}',
+                                               num_funds=i, total_value=i * 1.5)
+            for i in range(3)
+        ])
+
+    def GetShareHolderDetail(self, request, context):
+        self._received('GetShareHolderDetail', request, context)
+        return vigilio_pb2.GetShareHolderDetailResponse(
+            shareholder_name=f'shareholder {request.shareholder_id}',
+            share_holder_histories=[vigilio_pb2.ShareHolderFundHistory(
+                fund_id='1', fund='f', fund_type='ETF', share_count=3,
+                value=2.0, pct_of_shares=0.1, date='1403/08/15')],
+            chart_data=[vigilio_pb2.ShareHolderFundChart(dates=['1403/08/15'], share_counts=[3])],
+        )
+
+    def ExportShareHolderExcel(self, request, context):
+        self._received('ExportShareHolderExcel', request, context)
+        return vigilio_pb2.ExportShareHolderExcelResponse(
+            excel_file=EXCEL_FILE, file_name=f'shareholder_{request.shareholder_id}.xlsx')
+
+    def ListTotalReturns(self, request, context):
+        """Pages like a current server: applies limit/offset and sets total"""
+        self._received('ListTotalReturns', request, context)
+        returns = [vigilio_pb2.TotalReturnItem(id=i, fund_id=i, date='1403/08/15', last_nav=1.0)
+                   for i in range(5)]
+        if not request.HasField('limit'):
+            return vigilio_pb2.ListTotalReturnsResponse(returns=returns)
+        page = returns[request.offset:request.offset + request.limit]
+        return vigilio_pb2.ListTotalReturnsResponse(returns=page, total=len(returns))
+
+    def ListEtfReturns(self, request, context):
+        self._received('ListEtfReturns', request, context)
+        return vigilio_pb2.ListEtfReturnsResponse(returns=[
+            vigilio_pb2.EtfReturnItem(id=i, fund_id=i, date='1403/08/15') for i in range(3)
+        ])
+
+    def GetNavTrend(self, request, context):
+        self._received('GetNavTrend', request, context)
+        return vigilio_pb2.GetNavTrendResponse(
+            nav_trend=[vigilio_pb2.NavTrendItem(net_asset_value=1, date='1403/08/15')],
+            chart_data=vigilio_pb2.NavTrendChartData(
+                dates=['1403/08/15'], statisticals=[1.0], purchases=[2.0], redemptions=[3.0]),
+        )
+
+    def GetSplits(self, request, context):
+        self._received('GetSplits', request, context)
+        return vigilio_pb2.GetSplitsResponse(splits=[
+            vigilio_pb2.SplitItem(date='1403/08/15', units_ratio=2.0)])
+
+    def GetProfits(self, request, context):
+        self._received('GetProfits', request, context)
+        return vigilio_pb2.GetProfitsResponse(profits=[
+            vigilio_pb2.ProfitItem(date='1403/08/15', profit=5.0)])
+
+    def GetPrices(self, request, context):
+        self._received('GetPrices', request, context)
+        return vigilio_pb2.GetPricesResponse(prices=[
+            vigilio_pb2.PriceItem(date='1403/08/15', price=9.0)])
+
+
+class StreamingFakeVigilioServicer(FakeVigilioServicer):
+    """FakeVigilioServicer that also implements the streaming RPCs it is asked for"""
+
+    def StreamListShareHolders(self, request, context):
+        self._received('StreamListShareHolders', request, context)
+        rows = list(self.ListShareHolders(request, context).shareholders)
+        for i in range(0, len(rows), 2):
+            yield vigilio_pb2.ShareHolderListResponse(shareholders=rows[i:i + 2])
+
+    def StreamExportShareHolderExcel(self, request, context):
+        self._received('StreamExportShareHolderExcel', request, context)
+        for i in range(0, len(EXCEL_FILE), 256):
+            yield vigilio_pb2.ExportShareHolderExcelChunk(
+                chunk=EXCEL_FILE[i:i + 256], file_name=f'shareholder_{request.shareholder_id}.xlsx',
+                last=i + 256 >= len(EXCEL_FILE))
+
+
+def serve(servicer):
+    """Start servicer on a free local port; returns (server, host)"""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    vigilio_pb2_grpc.add_VigilioServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    return server, f'127.0.0.1:{port}'
@@ -0,0 +1,170 @@
+import copy
+import pickle
+import unittest
+
+import grpc
+from .. import vigilio_pb2
+from ..aio import AsyncVigilioClient
+from ..client import VigilioClient, _Row
+from .servicer import (
+    EXCEL_FILE,
+    FakeVigilioServicer,
+    StreamingFakeVigilioServicer,
+    serve,
+)
+
+
+class RowTests(unittest.TestCase):
+
+    def setUp(self):
+        self.row = _Row(vigilio_pb2.FundType(id=1, name='ETF'))
+
+    def test_mapping_and_attribute_access(self):
+        self.assertEqual(self.row['name'], 'ETF')
+        self.assertEqual(self.row.id, 1)
+        self.assertEqual(len(self.row), 2)
+        self.assertEqual(dict(self.row), {'id': 1, 'name': 'ETF'})
+        self.assertEqual(self.row, {'id': 1, 'name': 'ETF'})
+
+    def test_missing_field(self):
+        with self.assertRaises(KeyError):
+            self.row['missing']
+        with self.assertRaises(AttributeError):
+            self.row.missing
+
+    def test_copy_and_pickle_yield_dicts(self):
+        for clone in (copy.copy(self.row), copy.deepcopy(self.row),
+                      pickle.loads(pickle.dumps(self.row))):
+            self.assertIs(type(clone), dict)
+            self.assertEqual(clone, {'id': 1, 'name': 'ETF'})
+
+
+class ClientTestCase(unittest.TestCase):
+    servicer_class = FakeVigilioServicer
+    client_kwargs = {}
+
+    def setUp(self):
+        self.servicer = self.servicer_class()
+        self.server, host = serve(self.servicer)
+        self.addCleanup(self.server.stop, None)
+        self.client = VigilioClient(host, **self.client_kwargs)
+        self.client.invalidate_cache()
+
+
+class CacheTests(ClientTestCase):
+
+    def test_repeated_lookup_is_served_from_cache(self):
+        first = self.client.get_fund_types()
+        self.assertEqual(self.client.get_fund_types(), first)
+        self.assertEqual(self.servicer.calls['GetFundTypes'], 1)
+
+    def test_key_ignores_how_arguments_are_passed(self):
+        self.client.get_splits(7)
+        self.client.get_splits(fund_id=7)
+        self.client.get_splits(7, timeout=5)
+        self.assertEqual(self.servicer.calls['GetSplits'], 1)
+
+        self.client.get_splits(8)
+        self.assertEqual(self.servicer.calls['GetSplits'], 2)
+
+    def test_ttl_zero_and_invalidate_bypass_cache(self):
+        self.client.get_prices(1)
+        self.client.get_prices(1, ttl=0)
+        self.assertEqual(self.servicer.calls['GetPrices'], 2)
+
+        self.client.invalidate_cache()
+        self.client.get_prices(1)
+        self.assertEqual(self.servicer.calls['GetPrices'], 3)
+
+
+class RetryTests(ClientTestCase):
+    client_kwargs = {'cache_ttl': 0, 'max_retries': 2}
+
+    def test_transient_failures_are_retried(self):
+        self.servicer.failures['GetSplits'] = [grpc.StatusCode.UNAVAILABLE] * 2
+        self.assertEqual(len(self.client.get_splits(1)), 1)
+        self.assertEqual(self.servicer.calls['GetSplits'], 3)
+
+    def test_gives_up_after_max_retries(self):
+        self.servicer.failures['GetSplits'] = [grpc.StatusCode.UNAVAILABLE] * 3
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.client.get_splits(1)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.UNAVAILABLE)
+        self.assertEqual(self.servicer.calls['GetSplits'], 3)
+
+    def test_other_errors_are_not_retried(self):
+        self.servicer.failures['GetSplits'] = [grpc.StatusCode.INVALID_ARGUMENT]
+        with self.assertRaises(grpc.RpcError) as cm:
+            self.client.get_splits(1)
+        self.assertEqual(cm.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        self.assertEqual(self.servicer.calls['GetSplits'], 1)
+
+    def test_streams_get_the_default_deadline(self):
+        client = VigilioClient(self.client.host, cache_ttl=0, timeout=12)
+        call = client.stub.StreamListShareHolders(vigilio_pb2.ShareHolderListRequest())
+        self.assertTrue(10 < call.time_remaining() <= 12)
+        call.cancel()
+
+
+class FallbackTests(ClientTestCase):
+    """Servers without the streaming and batch RPCs"""
+    client_kwargs = {'cache_ttl': 0}
+
+    def test_iter_falls_back_to_list_rpc(self):
+        rows = list(self.client.iter_shareholders(fund_type='1'))
+        self.assertEqual(rows, self.client.list_shareholders(fund_type='1'))
+        self.assertEqual(self.servicer.requests['ListShareHolders'].fund_type, '1')
+
+    def test_excel_export_falls_back_to_unary_rpc(self):
+        self.assertEqual(self.client.export_shareholder_excel(7), EXCEL_FILE)
+        self.assertEqual(b''.join(self.client.iter_shareholder_excel(7)), EXCEL_FILE)
+
+    def test_bundle_falls_back_to_individual_rpcs(self):
+        bundle = self.client.get_fund_bundle(3, nav_trend=False)
+        self.assertEqual(set(bundle), {'splits', 'profits', 'prices'})
+        self.assertEqual(bundle['prices'], [{'date': '1403/08/15', 'price': 9.0}])
+        self.assertEqual(self.servicer.calls['GetNavTrend'], 0)
+
+    def test_details_batch_falls_back_to_unary_calls(self):
+        details = self.client.get_shareholder_details_batch([1, 2, 3])
+        self.assertEqual(sorted(details), [1, 2, 3])
+        self.assertEqual(details[2]['shareholder_name'], 'shareholder 2')
+        self.assertEqual(self.servicer.calls['GetShareHolderDetail'], 3)
+
+
+class StreamTests(ClientTestCase):
+    servicer_class = StreamingFakeVigilioServicer
+    client_kwargs = {'cache_ttl': 0}
+
+    def test_iter_uses_stream(self):
+        rows = list(self.client.iter_shareholders())
+        self.assertEqual([row['id'] for row in rows], list(range(5)))
+        self.assertEqual(self.servicer.calls['StreamListShareHolders'], 1)
+        self.assertEqual(self.servicer.calls['ListShareHolders'], 1)  # the stream's own data source
+
+    def test_excel_export_is_streamed(self):
+        chunks = list(self.client.iter_shareholder_excel(7))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b''.join(chunks), EXCEL_FILE)
+        self.assertEqual(self.servicer.calls['ExportShareHolderExcel'], 0)
+
+
+class AsyncClientTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.servicer = FakeVigilioServicer()
+        self.server, self.host = serve(self.servicer)
+        self.addCleanup(self.server.stop, None)
+
+    async def test_calls_and_fallbacks(self):
+        async with AsyncVigilioClient(self.host, timeout=5) as client:
+            fund_types = await client.get_fund_types()
+            self.assertEqual([row['name'] for row in fund_types], ['ETF', 'اهرمی'])
+            self.assertEqual(await client.export_shareholder_excel(7), EXCEL_FILE)
+            chunks = await client.iter_shareholder_excel(7)
+            self.assertEqual(b''.join([chunk async for chunk in chunks]), EXCEL_FILE)
+
+    async def test_deadline(self):
+        async with AsyncVigilioClient(self.host, timeout=7) as client:
+            self.assertEqual(client._deadline(None), 7)
+            self.assertEqual(client._deadline(2), 2)
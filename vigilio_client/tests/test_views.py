@@ -0,0 +1,131 @@
+from unittest import mock
+
+import grpc
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIClient
+
+from ..client import VigilioClient
+from .servicer import EXCEL_FILE, FakeVigilioServicer, serve
+
+
+@override_settings(ROOT_URLCONF='vigilio_client.tests.urls')
+class ViewTestCase(SimpleTestCase):
+
+    def setUp(self):
+        self.servicer = FakeVigilioServicer()
+        self.server, host = serve(self.servicer)
+        self.addCleanup(self.server.stop, None)
+
+        # cache_ttl=0 so only the views' own caching is under test
+        patcher = mock.patch('vigilio_client.views.get_default_client',
+                             return_value=VigilioClient(host, cache_ttl=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        self.api = APIClient()
+        self.api.force_authenticate(user=User(username='tester'))
+
+
+class AuthenticationTests(ViewTestCase):
+
+    def test_anonymous_requests_are_rejected(self):
+        response = APIClient().get('/vigilio/fund-types/')
+        self.assertIn(response.status_code, (401, 403))
+        self.assertEqual(self.servicer.calls['GetFundTypes'], 0)
+
+
+class CachedViewTests(ViewTestCase):
+
+    def test_response_is_cached_privately(self):
+        first = self.api.get('/vigilio/fund-types/')
+        second = self.api.get('/vigilio/fund-types/')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json(), [{'id': 1, 'name': 'ETF'}, {'id': 2, 'name': 'اهرمی'}])
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(self.servicer.calls['GetFundTypes'], 1)
+        for response in (first, second):
+            cache_control = response['Cache-Control']
+            self.assertIn('private', cache_control)
+            self.assertIn('max-age=', cache_control)
+
+    def test_etag_answers_304(self):
+        etag = self.api.get('/vigilio/fund-types/')['ETag']
+        response = self.api.get('/vigilio/fund-types/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+
+class FundDetailViewTests(ViewTestCase):
+
+    def test_routes_take_fund_id_from_path(self):
+        response = self.api.get('/vigilio/watchlist/3/prices/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{'date': '1403/08/15', 'price': 9.0}])
+        self.assertEqual(self.servicer.requests['GetPrices'].fund_id, 3)
+
+    def test_non_integer_fund_id_is_404(self):
+        self.assertEqual(self.api.get('/vigilio/watchlist/abc/prices/').status_code, 404)
+        self.assertEqual(self.servicer.calls['GetPrices'], 0)
+
+    def test_bundle_falls_back_to_individual_rpcs(self):
+        response = self.api.get('/vigilio/watchlist/3/bundle/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {'nav_trend', 'splits', 'profits', 'prices'})
+
+    def test_grpc_error_is_503(self):
+        self.servicer.failures['GetSplits'] = [grpc.StatusCode.INTERNAL]
+        response = self.api.get('/vigilio/watchlist/3/splits/')
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('INTERNAL', response.json()['error'])
+
+
+class ReturnsViewTests(ViewTestCase):
+
+    def test_limit_offset_are_applied_by_the_server(self):
+        response = self.api.get('/vigilio/total_return/', {'limit': 2, 'offset': 1})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['count'], 5)
+        self.assertEqual([row['id'] for row in body['results']], [1, 2])
+
+        request = self.servicer.requests['ListTotalReturns']
+        self.assertEqual((request.limit, request.offset), (2, 1))
+
+    def test_unpaged_servers_are_sliced_locally(self):
+        response = self.api.get('/vigilio/etf_return/', {'limit': 2, 'offset': 2})
+        body = response.json()
+        self.assertEqual(body['count'], 3)
+        self.assertEqual([row['id'] for row in body['results']], [2])
+
+    def test_fund_id_is_validated(self):
+        response = self.api.get('/vigilio/total_return/', {'fund_id': 'x'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('fund_id', response.json()['error'])
+        self.assertEqual(self.servicer.calls['ListTotalReturns'], 0)
+
+        response = self.api.get('/vigilio/total_return/', {'fund_id': ''})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.servicer.requests['ListTotalReturns'].HasField('fund_id'))
+
+
+class ExcelViewTests(ViewTestCase):
+
+    def test_export_is_streamed_then_served_from_cache(self):
+        response = self.api.get('/vigilio/shareholders/7/excel/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), EXCEL_FILE)
+        self.assertIn('shareholder_7.xlsx', response['Content-Disposition'])
+
+        cached = self.api.get('/vigilio/shareholders/7/excel/')
+        self.assertEqual(cached.content, EXCEL_FILE)
+        self.assertEqual(self.servicer.calls['ExportShareHolderExcel'], 1)
+
+        not_modified = self.api.get('/vigilio/shareholders/7/excel/',
+                                    HTTP_IF_NONE_MATCH=cached['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
@@ -11,7 +11,8 @@ from .views import (
 
 app_name = 'vigilio_client'
 
-router = DefaultRouter()
+# Path converters hand viewsets typed lookups (e.g. an int pk)
+router = DefaultRouter(use_regex_path=False)
 router.register(r'fund-types', FundTypeViewSet, basename='fund-type')
 router.register(r'shareholders', ShareHolderViewSet, basename='shareholder')
 router.register(r'cashflow', CashFlowViewSet, basename='cash-flow')
@@ -1,37 +1,280 @@
-from pickle import FALSE
+import functools
+import hashlib
+import inspect
+import time
 
-from rest_framework import viewsets, status, generics, permissions
+from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
-from django.http import HttpResponse
-from django.conf import settings
+from django.core.cache import cache
+from django.middleware.http import ConditionalGetMiddleware
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_page
 import grpc
 
-from .client import VigilioClient
+try:
+    from prometheus_client import Histogram
+except ImportError:  # optional, installed with the 'metrics' extra
+    Histogram = None
+
+from .client import _Row, _rows_to_dicts
+from .conf import DEFAULTS, get_default_client, get_vigilio_setting
+from .pagination import RPCLimitOffsetPagination
+from .renderers import ORJSONRenderer
 from .serializers import (
-    FundTypeSerializer,
-    ShareHolderListSerializer,
-    ShareHolderSummarySerializer,
     ShareHolderForDateSerializer,
     ShareHolderDetailSerializer,
-    CashFlowSerializer,
-    CashFlowDetailSerializer,
-    TotalReturnSerializer,
-    EtfReturnSerializer,
-    NavTrendSerializer,
-    SplitSerializer,
-    ProfitSerializer,
-    PriceSerializer
+    ShareHolderSummaryQuerySerializer,
+    FundIdQuerySerializer,
 )
 
 
+# Low-churn endpoints whose rendered responses are cached per URL
+FUND_TYPES_CACHE_TIMEOUT = get_vigilio_setting(
+    'FUND_TYPES_CACHE_TIMEOUT', DEFAULTS['FUND_TYPES_CACHE_TIMEOUT'])
+FUND_DATA_CACHE_TIMEOUT = get_vigilio_setting(
+    'FUND_DATA_CACHE_TIMEOUT', DEFAULTS['FUND_DATA_CACHE_TIMEOUT'])
+SUMMARY_CACHE_TIMEOUT = get_vigilio_setting(
+    'SUMMARY_CACHE_TIMEOUT', DEFAULTS['SUMMARY_CACHE_TIMEOUT'])
+EXCEL_CACHE_TIMEOUT = get_vigilio_setting(
+    'EXCEL_CACHE_TIMEOUT', DEFAULTS['EXCEL_CACHE_TIMEOUT'])
+
+# Larger workbooks are streamed through without being kept for the cache
+EXCEL_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Per-view latency, labelled with the outcome: 'ok', the gRPC status code
+# name, or 'error' for any other exception
+VIEW_LATENCY = Histogram(
+    'vigilio_view_duration_seconds', 'Time spent in Vigilio REST view methods',
+    ('view', 'outcome')
+) if Histogram is not None else None
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
 def get_grpc_client():
-    """Helper function to get gRPC client from settings"""
-    grpc_host = getattr(settings, 'VIGILIO_GRPC_HOST', '127.0.0.1:50051')
-    secure = getattr(settings, 'VIGILIO_GRPC_SECURE', False)
-    credentials_path = getattr(settings, 'VIGILIO_GRPC_CREDENTIALS_PATH', None)
+    """
+    Helper function to get the gRPC client configured from settings
+
+    Returns the process-wide shared client, so requests reuse its open
+    connections instead of connecting per request.
+    """
+    return get_default_client()
+
+
+def _as_dicts(rows):
+    """
+    Copy client rows into plain dicts for the response
+
+    Rows come from the gRPC service already typed as the JSON output needs,
+    so running them through a DRF serializer would only copy them again.
+    Shareholder detail and for_date still use their serializers, which
+    coerce fund_id and share_count.
+    """
+    return _rows_to_dicts(rows)
+
+
+def _list_response(view, request, rows, response):
+    """
+    Response for the rows of a list RPC called with the view paginator's
+    rpc_limit_offset(); paginated only when the request asked for a limit
+    """
+    rows = list(map(_Row, rows))
+    paginator = view.paginator
+    if paginator.get_limit(request) is None:
+        return Response(_as_dicts(rows))
+
+    total = response.total if response.HasField('total') else None
+    page = paginator.paginate_rows(rows, total, request)
+    return paginator.get_paginated_response(_as_dicts(page))
+
+
+def _excel_cache_key(*parts):
+    return 'vigilio:xlsx:' + ':'.join(map(str, parts))
+
+
+def _excel_headers(response, filename):
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    patch_cache_control(response, private=True, max_age=EXCEL_CACHE_TIMEOUT)
+    return response
 
-    return VigilioClient(host=grpc_host, secure=secure, credentials_path=credentials_path)
+
+def _cached_excel_response(request, data, filename):
+    """
+    Response for an Excel export found in the cache
+
+    Carries an ETag of the workbook bytes, so a client that already has
+    them gets a 304 without the body.
+    """
+    response = _excel_headers(HttpResponse(data, content_type=XLSX_CONTENT_TYPE), filename)
+    response['ETag'] = f'"{hashlib.sha256(data).hexdigest()[:16]}"'
+    return get_conditional_response(request, etag=response['ETag'], response=response)
+
+
+def _streaming_excel_response(chunks, filename):
+    return _excel_headers(StreamingHttpResponse(chunks, content_type=XLSX_CONTENT_TYPE), filename)
+
+
+def _caching_excel_stream(chunks, cache_key):
+    """
+    Relay Excel chunks, caching the workbook once it has been sent in full
+
+    Stops collecting past EXCEL_CACHE_MAX_BYTES, so big exports keep
+    streaming in chunk-sized memory and are simply not cached.
+    """
+    parts, size = [], 0
+    for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size <= EXCEL_CACHE_MAX_BYTES:
+                parts.append(chunk)
+            else:
+                parts = None
+        yield chunk
+    if parts is not None:
+        cache.set(cache_key, b''.join(parts), EXCEL_CACHE_TIMEOUT)
+
+
+def _invalid_query_response(errors):
+    """400 response for query params rejected by a query serializer"""
+    return Response(
+        {'error': '; '.join(f'{name}: {" ".join(map(str, messages))}'
+                            for name, messages in errors.items())},
+        status=status.HTTP_400_BAD_REQUEST
+    )
+
+
+def _error_response(exc):
+    if isinstance(exc, grpc.RpcError):
+        return Response(
+            {'error': f'gRPC Error: {exc.code()} - {exc.details()}'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+    return Response(
+        {'error': str(exc)},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
+
+
+_CONDITIONAL_GET = ConditionalGetMiddleware(lambda request: None)
+
+
+def _conditional_response(request, response):
+    if getattr(response, 'is_rendered', True):
+        return _CONDITIONAL_GET.process_response(request, response)
+    response.add_post_render_callback(
+        lambda rendered: _CONDITIONAL_GET.process_response(request, rendered))
+    return response
+
+
+def conditional_get(view):
+    """
+    Give a view method's responses an ETag and answer If-None-Match with 304
+
+    Like Django's conditional_page, but also handles responses that
+    cache_page serves already rendered, whose post-render callbacks never
+    run. Put it above cache_page so a cache hit can 304 without an RPC.
+    Works on both plain and async view methods.
+    """
+    if inspect.iscoroutinefunction(view):
+        @functools.wraps(view)
+        async def async_wrapper(self, request, *args, **kwargs):
+            return _conditional_response(request, await view(self, request, *args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(view)
+    def wrapper(self, request, *args, **kwargs):
+        return _conditional_response(request, view(self, request, *args, **kwargs))
+    return wrapper
+
+
+def _private_response(response):
+    # cache_page only sees unrendered responses once they render, and
+    # skips caching any that are already marked private
+    if getattr(response, 'is_rendered', True):
+        patch_cache_control(response, private=True)
+    else:
+        response.add_post_render_callback(
+            lambda rendered: patch_cache_control(rendered, private=True))
+    return response
+
+
+def private_cache_page(timeout):
+    """
+    cache_page for view methods behind IsAuthenticated
+
+    The rendered response is still cached once per URL and shared by all
+    users: the data is not per-user, and DRF checks permissions before the
+    method runs, cache hits included. Only the Cache-Control sent out
+    changes, from cache_page's public max-age to private, so shared proxies
+    can't hand the response to unauthenticated clients. Works on both plain
+    and async view methods.
+    """
+    def decorator(view):
+        cached = method_decorator(cache_page(timeout))(view)
+
+        if inspect.iscoroutinefunction(view):
+            # Real coroutine function: before Python 3.12 adrf would not
+            # recognise method_decorator's marked wrapper as async
+            @functools.wraps(view)
+            async def async_wrapper(self, request, *args, **kwargs):
+                return _private_response(await cached(self, request, *args, **kwargs))
+            return async_wrapper
+
+        @functools.wraps(view)
+        def wrapper(self, request, *args, **kwargs):
+            return _private_response(cached(self, request, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def _outcome(exc):
+    if isinstance(exc, grpc.RpcError):
+        return exc.code().name
+    return 'error'
+
+
+def grpc_error_handler(view):
+    """
+    Turn exceptions raised by a view method into error responses
+
+    gRPC errors become 503 and anything else 500, each with an 'error' key.
+    When prometheus_client is installed, each call's duration is recorded
+    in VIEW_LATENCY. Works on both plain and async view methods.
+    """
+    name = view.__qualname__
+
+    def record(start, outcome):
+        if VIEW_LATENCY is not None:
+            VIEW_LATENCY.labels(name, outcome).observe(time.perf_counter() - start)
+
+    if inspect.iscoroutinefunction(view):
+        @functools.wraps(view)
+        async def async_wrapper(self, request, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                response = await view(self, request, *args, **kwargs)
+            except Exception as e:
+                record(start, _outcome(e))
+                return _error_response(e)
+            record(start, 'ok')
+            return response
+        return async_wrapper
+
+    @functools.wraps(view)
+    def wrapper(self, request, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = view(self, request, *args, **kwargs)
+        except Exception as e:
+            record(start, _outcome(e))
+            return _error_response(e)
+        record(start, 'ok')
+        return response
+    return wrapper
 
 
 class FundTypeViewSet(viewsets.ViewSet):
@@ -42,24 +285,16 @@ class FundTypeViewSet(viewsets.ViewSet):
     """
     http_method_names = ['get']
     permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
 
+    @conditional_get
+    @private_cache_page(FUND_TYPES_CACHE_TIMEOUT)
+    @grpc_error_handler
     def list(self, request):
         """Get all fund types"""
-        try:
-            with get_grpc_client() as client:
-                fund_types = client.get_fund_types()
-                serializer = FundTypeSerializer(fund_types, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        fund_types = client.get_fund_types()
+        return Response(_as_dicts(fund_types))
 
 
 class ShareHolderViewSet(viewsets.ViewSet):
@@ -69,13 +304,18 @@ class ShareHolderViewSet(viewsets.ViewSet):
     list: GET /vigilio/shareholders/?fund_type=<fund_type>
     retrieve: GET /vigilio/shareholders/<id>/?fund=<fund>
     summary: GET /vigilio/shareholders/summary/?date=<date>&fund_type=<fund_type>&search=<search>&ordering=<ordering>
+    summary_multi: GET /vigilio/shareholders/summary_multi/?fund_types=<fund_type>,<fund_type>&date=<date>&search=<search>&ordering=<ordering>
     summary_excel: GET /vigilio/shareholders/summary_excel/?fund_type=<fund_type>&date=<date>
     for_date: GET /vigilio/shareholders/<id>/for_date/?date=<date>&fund_type=<fund_type>
     excel: GET /vigilio/shareholders/<id>/excel/?fund=<fund>
     """
     http_method_names = ['get']
     permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    lookup_value_converter = 'int'
 
+    @conditional_get
+    @grpc_error_handler
     def list(self, request):
         """
         List all shareholders
@@ -83,22 +323,12 @@ class ShareHolderViewSet(viewsets.ViewSet):
         """
         fund_type = request.query_params.get('fund_type', None)
 
-        try:
-            with get_grpc_client() as client:
-                shareholders = client.list_shareholders(fund_type=fund_type)
-                serializer = ShareHolderListSerializer(shareholders, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        shareholders = client.list_shareholders(fund_type=fund_type)
+        return Response(_as_dicts(shareholders))
 
+    @conditional_get
+    @grpc_error_handler
     def retrieve(self, request, pk=None):
         """
         Get detailed shareholder information with chart data
@@ -106,58 +336,59 @@ class ShareHolderViewSet(viewsets.ViewSet):
         """
         fund = request.query_params.get('fund', None)
 
-        try:
-            with get_grpc_client() as client:
-                detail = client.get_shareholder_detail(
-                    shareholder_id=int(pk),
-                    fund=fund
-                )
-                serializer = ShareHolderDetailSerializer(detail)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        detail = client.get_shareholder_detail(
+            shareholder_id=pk,
+            fund=fund
+        )
+        serializer = ShareHolderDetailSerializer(detail)
+        return Response(serializer.data)
 
     @action(detail=False, methods=['get'])
+    @conditional_get
+    @private_cache_page(SUMMARY_CACHE_TIMEOUT)
+    @grpc_error_handler
     def summary(self, request):
         """
         Get shareholders summary with aggregated data
         Query params: date, fund_type, search, ordering (all optional)
         """
-        date = request.query_params.get('date', None)
-        fund_type = request.query_params.get('fund_type', None)
-        search = request.query_params.get('search', None)
-        ordering = request.query_params.get('ordering', None)
-
-        try:
-            with get_grpc_client() as client:
-                summary = client.get_shareholders_summary(
-                    date=date,
-                    fund_type=fund_type,
-                    search=search,
-                    ordering=ordering
-                )
-                serializer = ShareHolderSummarySerializer(summary, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
+        query = ShareHolderSummaryQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+
+        client = get_grpc_client()
+        summary = client.get_shareholders_summary(**query.validated_data, columnar=True)
+        return Response(summary)
+
+    @action(detail=False, methods=['get'], url_path='summary_multi')
+    @conditional_get
+    @private_cache_page(SUMMARY_CACHE_TIMEOUT)
+    @grpc_error_handler
+    def summary_multi(self, request):
+        """
+        Get shareholders summaries for several fund types in one request
+        Query params: fund_types (required, comma-separated), date, search, ordering (optional)
+        """
+        fund_types = [ft for ft in request.query_params.get('fund_types', '').split(',') if ft]
+        if not fund_types:
             return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {'error': 'fund_types query parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
+        query = ShareHolderSummaryQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+        params = dict(query.validated_data)
+        params.pop('fund_type', None)
+
+        client = get_grpc_client()
+        summaries = client.get_shareholders_summaries(fund_types, **params)
+        return Response({fund_type: _as_dicts(rows) for fund_type, rows in summaries.items()})
+
     @action(detail=False, methods=['get'], url_path='summary_excel')
+    @grpc_error_handler
     def summary_excel(self, request):
         """
         Export shareholders summary to Excel
@@ -172,31 +403,22 @@ class ShareHolderViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            with get_grpc_client() as client:
-                excel_data = client.export_shareholders_summary_excel(
-                    fund_type=fund_type,
-                    date=date
-                )
-
-                response = HttpResponse(
-                    excel_data,
-                    content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-                )
-                response['Content-Disposition'] = f'attachment; filename="shareholders_summary_{fund_type}.xlsx"'
-                return response
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        filename = f'shareholders_summary_{fund_type}.xlsx'
+        cache_key = _excel_cache_key('summary', fund_type, date)
+        excel_data = cache.get(cache_key)
+        if excel_data is not None:
+            return _cached_excel_response(request, excel_data, filename)
+
+        client = get_grpc_client()
+        excel_chunks = client.iter_shareholders_summary_excel(
+            fund_type=fund_type,
+            date=date
+        )
+        return _streaming_excel_response(_caching_excel_stream(excel_chunks, cache_key), filename)
 
     @action(detail=True, methods=['get'], url_path='for_date')
+    @conditional_get
+    @grpc_error_handler
     def for_date(self, request, pk=None):
         """
         Get shareholder details for a specific date
@@ -205,27 +427,17 @@ class ShareHolderViewSet(viewsets.ViewSet):
         date = request.query_params.get('date', None)
         fund_type = request.query_params.get('fund_type', None)
 
-        try:
-            with get_grpc_client() as client:
-                shareholder = client.get_shareholder_for_date(
-                    shareholder_id=int(pk),
-                    date=date,
-                    fund_type=fund_type
-                )
-                serializer = ShareHolderForDateSerializer(shareholder)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        shareholder = client.get_shareholder_for_date(
+            shareholder_id=pk,
+            date=date,
+            fund_type=fund_type
+        )
+        serializer = ShareHolderForDateSerializer(shareholder)
+        return Response(serializer.data)
 
     @action(detail=True, methods=['get'])
+    @grpc_error_handler
     def excel(self, request, pk=None):
         """
         Export specific shareholder data to Excel
@@ -233,32 +445,21 @@ class ShareHolderViewSet(viewsets.ViewSet):
         """
         fund = request.query_params.get('fund', None)
 
-        try:
-            with get_grpc_client() as client:
-                excel_data = client.export_shareholder_excel(
-                    shareholder_id=int(pk),
-                    fund=fund
-                )
-
-                response = HttpResponse(
-                    excel_data,
-                    content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-                )
-                response['Content-Disposition'] = f'attachment; filename="shareholder_{pk}.xlsx"'
-                return response
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        filename = f'shareholder_{pk}.xlsx'
+        cache_key = _excel_cache_key('shareholder', pk, fund)
+        excel_data = cache.get(cache_key)
+        if excel_data is not None:
+            return _cached_excel_response(request, excel_data, filename)
+
+        client = get_grpc_client()
+        excel_chunks = client.iter_shareholder_excel(
+            shareholder_id=pk,
+            fund=fund
+        )
+        return _streaming_excel_response(_caching_excel_stream(excel_chunks, cache_key), filename)
 
 
-class CashFlowViewSet(generics.ListAPIView ,generics.RetrieveAPIView ,viewsets.GenericViewSet):
+class CashFlowViewSet(viewsets.GenericViewSet):
     """
     ViewSet for Cash Flows
 
@@ -267,10 +468,14 @@ class CashFlowViewSet(generics.ListAPIView ,generics.RetrieveAPIView ,viewsets.G
     """
     http_method_names = ['get']
     permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    pagination_class = RPCLimitOffsetPagination
+    lookup_value_converter = 'int'
 
     def get_queryset(self):
         return []
 
+    @grpc_error_handler
     def list(self, request):
         """
         List cash flows summary for all funds
@@ -286,26 +491,19 @@ class CashFlowViewSet(generics.ListAPIView ,generics.RetrieveAPIView ,viewsets.G
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            with get_grpc_client() as client:
-                cash_flows = client.list_cash_flows(
-                    start_date=start_date,
-                    end_date=end_date,
-                    institute_kind=institute_kind
-                )
-                serializer = CashFlowSerializer(cash_flows, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        limit, offset = self.paginator.rpc_limit_offset(request)
+        client = get_grpc_client()
+        response = client.list_cash_flows(
+            start_date=start_date,
+            end_date=end_date,
+            institute_kind=institute_kind,
+            limit=limit,
+            offset=offset,
+            raw=True
+        )
+        return _list_response(self, request, response.cash_flows, response)
 
+    @grpc_error_handler
     def retrieve(self, request, pk=None):
         """
         Get detailed cash flow for a specific fund
@@ -322,30 +520,18 @@ class CashFlowViewSet(generics.ListAPIView ,generics.RetrieveAPIView ,viewsets.G
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            with get_grpc_client() as client:
-                cash_flow_detail = client.get_cash_flow_detail(
-                    fund_id=int(pk),
-                    start_date=start_date,
-                    end_date=end_date,
-                    fund_type=fund_type,
-                    institute_kind=institute_kind
-                )
-                serializer = CashFlowDetailSerializer(cash_flow_detail, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        cash_flow_detail = client.get_cash_flow_detail(
+            fund_id=pk,
+            start_date=start_date,
+            end_date=end_date,
+            fund_type=fund_type,
+            institute_kind=institute_kind
+        )
+        return Response(_as_dicts(cash_flow_detail))
 
 
-class TotalReturnViewSet(generics.ListAPIView,viewsets.GenericViewSet):
+class TotalReturnViewSet(viewsets.GenericViewSet):
     """
     ViewSet for Total Returns
 
@@ -353,40 +539,41 @@ class TotalReturnViewSet(generics.ListAPIView,viewsets.GenericViewSet):
     """
     http_method_names = ['get']
     permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    pagination_class = RPCLimitOffsetPagination
+
+    def get_queryset(self):
+        return []
 
+    @grpc_error_handler
     def list(self, request):
         """
         List total returns for all funds
         Query params: fund_type, fund_id, institute_kind, date (all optional)
         """
         fund_type = request.query_params.get('fund_type', None)
-        fund_id = request.query_params.get('fund_id', None)
         institute_kind = request.query_params.get('institute_kind', None)
         date = request.query_params.get('date', None)
 
-        try:
-            with get_grpc_client() as client:
-                returns = client.list_total_returns(
-                    fund_type=fund_type,
-                    fund_id=int(fund_id) if fund_id else None,
-                    institute_kind=institute_kind,
-                    date=date
-                )
-                serializer = TotalReturnSerializer(returns, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-
-
-class EtfReturnViewSet(generics.ListAPIView,viewsets.GenericViewSet):
+        query = FundIdQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+
+        limit, offset = self.paginator.rpc_limit_offset(request)
+        client = get_grpc_client()
+        response = client.list_total_returns(
+            fund_type=fund_type,
+            fund_id=query.validated_data.get('fund_id'),
+            institute_kind=institute_kind,
+            date=date,
+            limit=limit,
+            offset=offset,
+            raw=True
+        )
+        return _list_response(self, request, response.returns, response)
+
+
+class EtfReturnViewSet(viewsets.GenericViewSet):
     """
     ViewSet for ETF Returns
 
@@ -394,153 +581,110 @@ class EtfReturnViewSet(generics.ListAPIView,viewsets.GenericViewSet):
     """
     http_method_names = ['get']
     permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    pagination_class = RPCLimitOffsetPagination
+
+    def get_queryset(self):
+        return []
 
+    @grpc_error_handler
     def list(self, request):
         """
         List ETF returns
         Query params: fund_id, institute_kind, date (all optional)
         """
-        fund_id = request.query_params.get('fund_id', None)
         institute_kind = request.query_params.get('institute_kind', None)
         date = request.query_params.get('date', None)
 
-        try:
-            with get_grpc_client() as client:
-                returns = client.list_etf_returns(
-                    fund_id=int(fund_id) if fund_id else None,
-                    institute_kind=institute_kind,
-                    date=date
-                )
-                serializer = EtfReturnSerializer(returns, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        query = FundIdQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return _invalid_query_response(query.errors)
+
+        limit, offset = self.paginator.rpc_limit_offset(request)
+        client = get_grpc_client()
+        response = client.list_etf_returns(
+            fund_id=query.validated_data.get('fund_id'),
+            institute_kind=institute_kind,
+            date=date,
+            limit=limit,
+            offset=offset,
+            raw=True
+        )
+        return _list_response(self, request, response.returns, response)
 
 
 class FundDetailViewSet(viewsets.GenericViewSet):
     """
     ViewSet for Fund Detail (NAV trends, splits, profits, prices)
 
-    nav_trend: GET /vigilio/funds/<fund_id>/nav_trend/
-    splits: GET /vigilio/funds/<fund_id>/splits/
-    profits: GET /vigilio/funds/<fund_id>/profits/
-    prices: GET /vigilio/funds/<fund_id>/prices/
+    nav_trend: GET /vigilio/watchlist/<fund_id>/nav_trend/
+    splits: GET /vigilio/watchlist/<fund_id>/splits/
+    profits: GET /vigilio/watchlist/<fund_id>/profits/
+    prices: GET /vigilio/watchlist/<fund_id>/prices/
+    bundle: GET /vigilio/watchlist/<fund_id>/bundle/ (all four in one response)
     """
     http_method_names = ['get']
     permission_classes = (permissions.IsAuthenticated,)
+    renderer_classes = (ORJSONRenderer, BrowsableAPIRenderer)
+    lookup_value_converter = 'int'
 
-    @action(detail=False, methods=['get'], url_path='nav_trend')
-    def nav_trend(self, request):
+    def get_queryset(self):
+        return []
+
+    @action(detail=True, methods=['get'], url_path='nav_trend')
+    @grpc_error_handler
+    def nav_trend(self, request, pk=None):
         """
         Get NAV trend data for a specific fund
         """
-        fund_id = request.query_params.get('fund_id', None)
-        if not fund_id:
-            Response(
-                {'error': 'fund_id query parameters are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        try:
-            with get_grpc_client() as client:
-                nav_trend = client.get_nav_trend(fund_id=int(fund_id))
-                serializer = NavTrendSerializer(nav_trend)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        nav_trend = client.get_nav_trend(fund_id=pk)
+        return Response(nav_trend)
 
-    @action(detail=False, methods=['get'])
-    def splits(self, request):
+    @action(detail=True, methods=['get'])
+    @private_cache_page(FUND_DATA_CACHE_TIMEOUT)
+    @grpc_error_handler
+    def splits(self, request, pk=None):
         """
         Get fund splits for a specific fund
         """
-        fund_id = request.query_params.get('fund_id', None)
-        if not fund_id:
-            Response(
-                {'error': 'fund_id query parameters are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        try:
-            with get_grpc_client() as client:
-                splits = client.get_splits(fund_id=int(fund_id))
-                serializer = SplitSerializer(splits, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        splits = client.get_splits(fund_id=pk)
+        return Response(_as_dicts(splits))
 
-    @action(detail=False, methods=['get'])
-    def profits(self, request):
+    @action(detail=True, methods=['get'])
+    @private_cache_page(FUND_DATA_CACHE_TIMEOUT)
+    @grpc_error_handler
+    def profits(self, request, pk=None):
         """
         Get fund profits/dividends for a specific fund
         """
-        fund_id = request.query_params.get('fund_id', None)
-        if not fund_id:
-            Response(
-                {'error': 'fund_id query parameters are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        try:
-            with get_grpc_client() as client:
-                profits = client.get_profits(fund_id=int(fund_id))
-                serializer = ProfitSerializer(profits, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        client = get_grpc_client()
+        profits = client.get_profits(fund_id=pk)
+        return Response(_as_dicts(profits))
 
-    @action(detail=False, methods=['get'])
-    def prices(self, request):
+    @action(detail=True, methods=['get'])
+    @private_cache_page(FUND_DATA_CACHE_TIMEOUT)
+    @grpc_error_handler
+    def prices(self, request, pk=None):
         """
         Get ETF close prices for a specific fund
         """
-        fund_id = request.query_params.get('fund_id', None)
-        if not fund_id:
-            Response(
-                {'error': 'fund_id query parameters are required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        try:
-            with get_grpc_client() as client:
-                prices = client.get_prices(fund_id=int(fund_id))
-                serializer = PriceSerializer(prices, many=True)
-                return Response(serializer.data)
-        except grpc.RpcError as e:
-            return Response(
-                {'error': f'gRPC Error: {e.code()} - {e.details()}'},
-                status=status.HTTP_503_SERVICE_UNAVAILABLE
-            )
-        except Exception as e:
-            return Response(
-                {'error': str(e)},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
\ No newline at end of file
+        client = get_grpc_client()
+        prices = client.get_prices(fund_id=pk)
+        return Response(_as_dicts(prices))
+
+    @action(detail=True, methods=['get'])
+    @grpc_error_handler
+    def bundle(self, request, pk=None):
+        """
+        Get NAV trend, splits, profits and prices for a fund in one request
+        """
+        client = get_grpc_client()
+        bundle = client.get_fund_bundle(fund_id=pk)
+        return Response({
+            'nav_trend': bundle['nav_trend'],
+            'splits': _as_dicts(bundle['splits']),
+            'profits': _as_dicts(bundle['profits']),
+            'prices': _as_dicts(bundle['prices']),
+        })
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rvigilio.proto\x12\x07vigilio\"\xa5\x01\n\x1dShareHolderSummaryListRequest\x12\x11\n\x04\x64\x61te\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tfund_type\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06search\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x15\n\x08ordering\x18\x04 \x01(\tH\x03\x88\x01\x01\x42\x07\n\x05_dateB\x0c\n\n_fund_typeB\t\n\x07_searchB\x0b\n\t_ordering\"Z\n\x16ShareHolderSummaryItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tnum_funds\x18\x03 \x01(\x05\x12\x13\n\x0btotal_value\x18\x05 \x01(\x01\"W\n\x1eShareHolderSummaryListResponse\x12\x35\n\x0cshareholders\x18\x01 \x03(\x0b\x32\x1f.vigilio.ShareHolderSummaryItem\"u\n\x19ShareHolderForDateRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x64\x61te\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tfund_type\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x07\n\x05_dateB\x0c\n\n_fund_type\"\x8c\x01\n\x0f\x46undHistoryItem\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\x12\x0c\n\x04\x66und\x18\x02 \x01(\t\x12\x13\n\x0bshare_count\x18\x03 \x01(\x03\x12\r\n\x05value\x18\x04 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x05 \x01(\t\x12\x11\n\tfund_type\x18\x06 \x01(\t\x12\x15\n\rpct_of_shares\x18\x07 \x01(\x01\"|\n\x1aShareHolderForDateResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x18\n\x10shareholder_name\x18\x02 \x01(\t\x12\x38\n\x16share_holder_histories\x18\x03 \x03(\x0b\x32\x18.vigilio.FundHistoryItem\"P\n\x1fShareHolderSummaryExportRequest\x12\x11\n\tfund_type\x18\x01 \x01(\t\x12\x11\n\x04\x64\x61te\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_date\"H\n ShareHolderSummaryExportResponse\x12\x12\n\nexcel_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"<\n\x19ShareHolderSummaryRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x11\n\tfund_type\x18\x02 \x01(\t\"O\n\x1aShareHolderSummaryResponse\x12\x31\n\x0cshareholders\x18\x01 \x03(\x0b\x32\x1b.vigilio.ShareHolderSummary\"V\n\x12ShareHolderSummary\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tnum_funds\x18\x03 \x01(\x05\x12\x13\n\x0btotal_value\x18\x04 \x01(\x01\"A\n\x1eShareHolderSummaryExcelRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x11\n\tfund_type\x18\x02 \x01(\t\"H\n\x1fShareHolderSummaryExcelResponse\x12\x12\n\nexcel_file\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"-\n\x11ShareHolderByName\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"+\n\x16ShareHolderListRequest\x12\x11\n\tfund_type\x18\x01 \x01(\t\"K\n\x17ShareHolderListResponse\x12\x30\n\x0cshareholders\x18\x01 \x03(\x0b\x32\x1a.vigilio.ShareHolderByName\"\x93\x01\n\x16ShareHolderFundHistory\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\t\x12\x0c\n\x04\x66und\x18\x02 \x01(\t\x12\x11\n\tfund_type\x18\x03 \x01(\t\x12\x13\n\x0bshare_count\x18\x04 \x01(\x03\x12\r\n\x05value\x18\x05 \x01(\x01\x12\x15\n\rpct_of_shares\x18\x06 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x07 \x01(\t\"j\n\x18ShareHolderDetailRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x66und\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x11\n\x04\x64\x61te\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x07\n\x05_fundB\x07\n\x05_date\"v\n\x19ShareHolderDetailResponse\x12\x18\n\x10shareholder_name\x18\x01 \x01(\t\x12?\n\x16share_holder_histories\x18\x02 \x03(\x0b\x32\x1f.vigilio.ShareHolderFundHistory\"1\n\x17ShareHolderExcelRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\"A\n\x18ShareHolderExcelResponse\x12\x12\n\nexcel_file\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"\x8b\x01\n\x17ShareHolderChartRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x0c\n\x04\x66und\x18\x02 \x01(\t\x12\x17\n\nstart_date\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x65nd_date\x18\x04 \x01(\tH\x01\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\x8e\x01\n\x18ShareHolderChartResponse\x12?\n\x16share_holder_histories\x18\x01 \x03(\x0b\x32\x1f.vigilio.ShareHolderFundHistory\x12\x31\n\nchart_data\x18\x02 \x03(\x0b\x32\x1d.vigilio.ShareHolderFundChart\";\n\x14ShareHolderFundChart\x12\r\n\x05\x64\x61tes\x18\x01 \x03(\t\x12\x14\n\x0cshare_counts\x18\x02 \x03(\x03\"Q\n\x1bGetShareHolderDetailRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x66und\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_fund\"\xac\x01\n\x1cGetShareHolderDetailResponse\x12\x18\n\x10shareholder_name\x18\x01 \x01(\t\x12?\n\x16share_holder_histories\x18\x02 \x03(\x0b\x32\x1f.vigilio.ShareHolderFundHistory\x12\x31\n\nchart_data\x18\x03 \x03(\x0b\x32\x1d.vigilio.ShareHolderFundChart\"S\n\x1d\x45xportShareHolderExcelRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x66und\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_fund\"G\n\x1e\x45xportShareHolderExcelResponse\x12\x12\n\nexcel_file\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"\x15\n\x13GetFundTypesRequest\"$\n\x08\x46undType\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"=\n\x14GetFundTypesResponse\x12%\n\nfund_types\x18\x01 \x03(\x0b\x32\x11.vigilio.FundType\"l\n\x14ListCashFlowsRequest\x12\x12\n\nstart_date\x18\x01 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x02 \x01(\t\x12\x1b\n\x0einstitute_kind\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x11\n\x0f_institute_kind\"\xb4\x01\n\x0c\x43\x61shFlowItem\x12\x11\n\tcash_flow\x18\x01 \x01(\x01\x12\x0f\n\x07in_flow\x18\x02 \x01(\x01\x12\x10\n\x08out_flow\x18\x03 \x01(\x01\x12\x0f\n\x07profits\x18\x04 \x01(\x01\x12\x11\n\tfund_name\x18\x05 \x01(\t\x12\x11\n\tfund_type\x18\x06 \x01(\t\x12\x0f\n\x07\x66und_id\x18\x07 \x01(\x05\x12\x0e\n\x06symbol\x18\x08 \x01(\t\x12\x16\n\x0einstitute_kind\x18\t \x01(\t\"B\n\x15ListCashFlowsResponse\x12)\n\ncash_flows\x18\x01 \x03(\x0b\x32\x15.vigilio.CashFlowItem\"\x94\x01\n\x18GetCashFlowDetailRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\x12\x11\n\tfund_type\x18\x04 \x01(\t\x12\x1b\n\x0einstitute_kind\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x11\n\x0f_institute_kind\"\x87\x02\n\x12\x43\x61shFlowDetailItem\x12\x11\n\tcash_flow\x18\x01 \x01(\x01\x12\x0f\n\x07in_flow\x18\x02 \x01(\x01\x12\x10\n\x08out_flow\x18\x03 \x01(\x01\x12\x13\n\x0btotal_units\x18\x04 \x01(\x01\x12\x10\n\x08purchase\x18\x05 \x01(\x01\x12\x12\n\nredemption\x18\x06 \x01(\x01\x12\x14\n\x0cissued_units\x18\x07 \x01(\x01\x12\x15\n\rrevoked_units\x18\x08 \x01(\x01\x12\x11\n\tfund_name\x18\t \x01(\t\x12\x11\n\tfund_type\x18\n \x01(\t\x12\x0f\n\x07\x66und_id\x18\x0b \x01(\x05\x12\x0e\n\x06symbol\x18\x0c \x01(\t\x12\x0c\n\x04\x64\x61te\x18\r \x01(\t\"L\n\x19GetCashFlowDetailResponse\x12/\n\ncash_flows\x18\x01 \x03(\x0b\x32\x1b.vigilio.CashFlowDetailItem\"\xad\x01\n\x17ListTotalReturnsRequest\x12\x16\n\tfund_type\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07\x66und_id\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12\x1b\n\x0einstitute_kind\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x11\n\x04\x64\x61te\x18\x04 \x01(\tH\x03\x88\x01\x01\x42\x0c\n\n_fund_typeB\n\n\x08_fund_idB\x11\n\x0f_institute_kindB\x07\n\x05_date\"\xa9\x04\n\x0fTotalReturnItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x0f\n\x07\x66und_id\x18\x03 \x01(\x05\x12\x11\n\tfund_name\x18\x04 \x01(\t\x12\x11\n\tfund_type\x18\x05 \x01(\t\x12\x16\n\x0einstitute_kind\x18\x06 \x01(\t\x12\x15\n\x08last_nav\x18\x07 \x01(\x01H\x00\x88\x01\x01\x12\x1a\n\rlast_nav_date\x18\x08 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nlast_price\x18\t \x01(\x01H\x02\x88\x01\x01\x12\x1c\n\x0flast_price_date\x18\n \x01(\tH\x03\x88\x01\x01\x12\x12\n\nhas_profit\x18\x0b \x01(\x08\x12\x11\n\thas_split\x18\x0c \x01(\x08\x12\x18\n\x0btotal_units\x18\r \x01(\x01H\x04\x88\x01\x01\x12\x13\n\x06\x62ubble\x18\x0e \x01(\x01H\x05\x88\x01\x01\x12\x13\n\x06thirty\x18\x0f \x01(\x01H\x06\x88\x01\x01\x12\x13\n\x06ninety\x18\x10 \x01(\x01H\x07\x88\x01\x01\x12\x17\n\none_eighty\x18\x11 \x01(\x01H\x08\x88\x01\x01\x12\x18\n\x0bthree_sixty\x18\x12 \x01(\x01H\t\x88\x01\x01\x42\x0b\n\t_last_navB\x10\n\x0e_last_nav_dateB\r\n\x0b_last_priceB\x12\n\x10_last_price_dateB\x0e\n\x0c_total_unitsB\t\n\x07_bubbleB\t\n\x07_thirtyB\t\n\x07_ninetyB\r\n\x0b_one_eightyB\x0e\n\x0c_three_sixty\"E\n\x18ListTotalReturnsResponse\x12)\n\x07returns\x18\x01 \x03(\x0b\x32\x18.vigilio.TotalReturnItem\"\x85\x01\n\x15ListEtfReturnsRequest\x12\x14\n\x07\x66und_id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1b\n\x0einstitute_kind\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04\x64\x61te\x18\x03 \x01(\tH\x02\x88\x01\x01\x42\n\n\x08_fund_idB\x11\n\x0f_institute_kindB\x07\n\x05_date\"\xa7\x04\n\rEtfReturnItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x0f\n\x07\x66und_id\x18\x03 \x01(\x05\x12\x11\n\tfund_name\x18\x04 \x01(\t\x12\x11\n\tfund_type\x18\x05 \x01(\t\x12\x16\n\x0einstitute_kind\x18\x06 \x01(\t\x12\x15\n\x08last_nav\x18\x07 \x01(\x01H\x00\x88\x01\x01\x12\x1a\n\rlast_nav_date\x18\x08 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nlast_price\x18\t \x01(\x01H\x02\x88\x01\x01\x12\x1c\n\x0flast_price_date\x18\n \x01(\tH\x03\x88\x01\x01\x12\x12\n\nhas_profit\x18\x0b \x01(\x08\x12\x11\n\thas_split\x18\x0c \x01(\x08\x12\x18\n\x0btotal_units\x18\r \x01(\x01H\x04\x88\x01\x01\x12\x13\n\x06\x62ubble\x18\x0e \x01(\x01H\x05\x88\x01\x01\x12\x13\n\x06thirty\x18\x0f \x01(\x01H\x06\x88\x01\x01\x12\x13\n\x06ninety\x18\x10 \x01(\x01H\x07\x88\x01\x01\x12\x17\n\none_eighty\x18\x11 \x01(\x01H\x08\x88\x01\x01\x12\x18\n\x0bthree_sixty\x18\x12 \x01(\x01H\t\x88\x01\x01\x42\x0b\n\t_last_navB\x10\n\x0e_last_nav_dateB\r\n\x0b_last_priceB\x12\n\x10_last_price_dateB\x0e\n\x0c_total_unitsB\t\n\x07_bubbleB\t\n\x07_thirtyB\t\n\x07_ninetyB\r\n\x0b_one_eightyB\x0e\n\x0c_three_sixty\"A\n\x16ListEtfReturnsResponse\x12\'\n\x07returns\x18\x01 \x03(\x0b\x32\x16.vigilio.EtfReturnItem\"%\n\x12GetNavTrendRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\"\x97\x02\n\x0bNavDataItem\x12\x15\n\x08purchase\x18\x01 \x01(\x01H\x00\x88\x01\x01\x12\x17\n\nredemption\x18\x02 \x01(\x01H\x01\x88\x01\x01\x12\x18\n\x0bstatistical\x18\x03 \x01(\x01H\x02\x88\x01\x01\x12\x1f\n\x12preferred_purchase\x18\x04 \x01(\x01H\x03\x88\x01\x01\x12!\n\x14preferred_redemption\x18\x05 \x01(\x01H\x04\x88\x01\x01\x12\x13\n\x06\x63ommon\x18\x06 \x01(\x01H\x05\x88\x01\x01\x42\x0b\n\t_purchaseB\r\n\x0b_redemptionB\x0e\n\x0c_statisticalB\x15\n\x13_preferred_purchaseB\x17\n\x15_preferred_redemptionB\t\n\x07_common\"]\n\x0cNavTrendItem\x12\x17\n\x0fnet_asset_value\x18\x01 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12&\n\x08nav_data\x18\x03 \x01(\x0b\x32\x14.vigilio.NavDataItem\"`\n\x11NavTrendChartData\x12\r\n\x05\x64\x61tes\x18\x01 \x03(\t\x12\x14\n\x0cstatisticals\x18\x02 \x03(\x01\x12\x11\n\tpurchases\x18\x03 \x03(\x01\x12\x13\n\x0bredemptions\x18\x04 \x03(\x01\"o\n\x13GetNavTrendResponse\x12(\n\tnav_trend\x18\x01 \x03(\x0b\x32\x15.vigilio.NavTrendItem\x12.\n\nchart_data\x18\x02 \x01(\x0b\x32\x1a.vigilio.NavTrendChartData\"#\n\x10GetSplitsRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\".\n\tSplitItem\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x13\n\x0bunits_ratio\x18\x02 \x01(\x01\"7\n\x11GetSplitsResponse\x12\"\n\x06splits\x18\x01 \x03(\x0b\x32\x12.vigilio.SplitItem\"$\n\x11GetProfitsRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\"*\n\nProfitItem\x12\x0e\n\x06profit\x18\x01 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\":\n\x12GetProfitsResponse\x12$\n\x07profits\x18\x01 \x03(\x0b\x32\x13.vigilio.ProfitItem\"#\n\x10GetPricesRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\"(\n\tPriceItem\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\"7\n\x11GetPricesResponse\x12\"\n\x06prices\x18\x01 \x03(\x0b\x32\x12.vigilio.PriceItem2\xb6\n\n\x0eVigilioService\x12K\n\x0cGetFundTypes\x12\x1c.vigilio.GetFundTypesRequest\x1a\x1d.vigilio.GetFundTypesResponse\x12U\n\x10ListShareHolders\x12\x1f.vigilio.ShareHolderListRequest\x1a .vigilio.ShareHolderListResponse\x12\x66\n\x13ShareHoldersSummary\x12&.vigilio.ShareHolderSummaryListRequest\x1a\'.vigilio.ShareHolderSummaryListResponse\x12`\n\x15GetShareHolderForDate\x12\".vigilio.ShareHolderForDateRequest\x1a#.vigilio.ShareHolderForDateResponse\x12u\n\x1e\x45xportShareHoldersSummaryExcel\x12(.vigilio.ShareHolderSummaryExportRequest\x1a).vigilio.ShareHolderSummaryExportResponse\x12\x63\n\x14GetShareHolderDetail\x12$.vigilio.GetShareHolderDetailRequest\x1a%.vigilio.GetShareHolderDetailResponse\x12i\n\x16\x45xportShareHolderExcel\x12&.vigilio.ExportShareHolderExcelRequest\x1a\'.vigilio.ExportShareHolderExcelResponse\x12N\n\rListCashFlows\x12\x1d.vigilio.ListCashFlowsRequest\x1a\x1e.vigilio.ListCashFlowsResponse\x12Z\n\x11GetCashFlowDetail\x12!.vigilio.GetCashFlowDetailRequest\x1a\".vigilio.GetCashFlowDetailResponse\x12W\n\x10ListTotalReturns\x12 .vigilio.ListTotalReturnsRequest\x1a!.vigilio.ListTotalReturnsResponse\x12Q\n\x0eListEtfReturns\x12\x1e.vigilio.ListEtfReturnsRequest\x1a\x1f.vigilio.ListEtfReturnsResponse\x12H\n\x0bGetNavTrend\x12\x1b.vigilio.GetNavTrendRequest\x1a\x1c.vigilio.GetNavTrendResponse\x12\x42\n\tGetSplits\x12\x19.vigilio.GetSplitsRequest\x1a\x1a.vigilio.GetSplitsResponse\x12\x45\n\nGetProfits\x12\x1a.vigilio.GetProfitsRequest\x1a\x1b.vigilio.GetProfitsResponse\x12\x42\n\tGetPrices\x12\x19.vigilio.GetPricesRequest\x1a\x1a.vigilio.GetPricesResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rvigilio.proto\x12\x07vigilio\"\xe3\x01\n\x1dShareHolderSummaryListRequest\x12\x11\n\x04\x64\x61te\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tfund_type\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06search\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x15\n\x08ordering\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x12\n\x05limit\x18\n \x01(\x05H\x04\x88\x01\x01\x12\x13\n\x06offset\x18\x0b \x01(\x05H\x05\x88\x01\x01\x42\x07\n\x05_dateB\x0c\n\n_fund_typeB\t\n\x07_searchB\x0b\n\t_orderingB\x08\n\x06_limitB\t\n\x07_offset\"Z\n\x16ShareHolderSummaryItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tnum_funds\x18\x03 \x01(\x05\x12\x13\n\x0btotal_value\x18\x05 \x01(\x01\"W\n\x1eShareHolderSummaryListResponse\x12\x35\n\x0cshareholders\x18\x01 \x03(\x0b\x32\x1f.vigilio.ShareHolderSummaryItem\"h\n!ShareHolderSummaryColumnsResponse\x12\x0b\n\x03ids\x18\x01 \x03(\x05\x12\r\n\x05names\x18\x02 \x03(\t\x12\x11\n\tnum_funds\x18\x03 \x03(\x05\x12\x14\n\x0ctotal_values\x18\x04 \x03(\x01\"u\n\x19ShareHolderForDateRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x64\x61te\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tfund_type\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x07\n\x05_dateB\x0c\n\n_fund_type\"\x8c\x01\n\x0f\x46undHistoryItem\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\x12\x0c\n\x04\x66und\x18\x02 \x01(\t\x12\x13\n\x0bshare_count\x18\x03 \x01(\x03\x12\r\n\x05value\x18\x04 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x05 \x01(\t\x12\x11\n\tfund_type\x18\x06 \x01(\t\x12\x15\n\rpct_of_shares\x18\x07 \x01(\x01\"|\n\x1aShareHolderForDateResponse\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x18\n\x10shareholder_name\x18\x02 \x01(\t\x12\x38\n\x16share_holder_histories\x18\x03 \x03(\x0b\x32\x18.vigilio.FundHistoryItem\"P\n\x1fShareHolderSummaryExportRequest\x12\x11\n\tfund_type\x18\x01 \x01(\t\x12\x11\n\x04\x64\x61te\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_date\"H\n ShareHolderSummaryExportResponse\x12\x12\n\nexcel_data\x18\x01 \x01(\x0c\x12\x10\n\x08\x66ilename\x18\x02 \x01(\t\"<\n\x19ShareHolderSummaryRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x11\n\tfund_type\x18\x02 \x01(\t\"O\n\x1aShareHolderSummaryResponse\x12\x31\n\x0cshareholders\x18\x01 \x03(\x0b\x32\x1b.vigilio.ShareHolderSummary\"V\n\x12ShareHolderSummary\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x11\n\tnum_funds\x18\x03 \x01(\x05\x12\x13\n\x0btotal_value\x18\x04 \x01(\x01\"A\n\x1eShareHolderSummaryExcelRequest\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x11\n\tfund_type\x18\x02 \x01(\t\"H\n\x1fShareHolderSummaryExcelResponse\x12\x12\n\nexcel_file\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"-\n\x11ShareHolderByName\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"J\n\x16ShareHolderListRequest\x12\x11\n\tfund_type\x18\x01 \x01(\t\x12\r\n\x05limit\x18\n \x01(\x05\x12\x0e\n\x06offset\x18\x0b \x01(\x05\"K\n\x17ShareHolderListResponse\x12\x30\n\x0cshareholders\x18\x01 \x03(\x0b\x32\x1a.vigilio.ShareHolderByName\"\x93\x01\n\x16ShareHolderFundHistory\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\t\x12\x0c\n\x04\x66und\x18\x02 \x01(\t\x12\x11\n\tfund_type\x18\x03 \x01(\t\x12\x13\n\x0bshare_count\x18\x04 \x01(\x03\x12\r\n\x05value\x18\x05 \x01(\x01\x12\x15\n\rpct_of_shares\x18\x06 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x07 \x01(\t\"j\n\x18ShareHolderDetailRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x66und\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x11\n\x04\x64\x61te\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x07\n\x05_fundB\x07\n\x05_date\"v\n\x19ShareHolderDetailResponse\x12\x18\n\x10shareholder_name\x18\x01 \x01(\t\x12?\n\x16share_holder_histories\x18\x02 \x03(\x0b\x32\x1f.vigilio.ShareHolderFundHistory\"1\n\x17ShareHolderExcelRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\"A\n\x18ShareHolderExcelResponse\x12\x12\n\nexcel_file\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"\x8b\x01\n\x17ShareHolderChartRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x0c\n\x04\x66und\x18\x02 \x01(\t\x12\x17\n\nstart_date\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x65nd_date\x18\x04 \x01(\tH\x01\x88\x01\x01\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\x8e\x01\n\x18ShareHolderChartResponse\x12?\n\x16share_holder_histories\x18\x01 \x03(\x0b\x32\x1f.vigilio.ShareHolderFundHistory\x12\x31\n\nchart_data\x18\x02 \x03(\x0b\x32\x1d.vigilio.ShareHolderFundChart\";\n\x14ShareHolderFundChart\x12\r\n\x05\x64\x61tes\x18\x01 \x03(\t\x12\x14\n\x0cshare_counts\x18\x02 \x03(\x03\"Q\n\x1bGetShareHolderDetailRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x66und\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_fund\"\xac\x01\n\x1cGetShareHolderDetailResponse\x12\x18\n\x10shareholder_name\x18\x01 \x01(\t\x12?\n\x16share_holder_histories\x18\x02 \x03(\x0b\x32\x1f.vigilio.ShareHolderFundHistory\x12\x31\n\nchart_data\x18\x03 \x03(\x0b\x32\x1d.vigilio.ShareHolderFundChart\"3\n\x17ShareHolderDetailHeader\x12\x18\n\x10shareholder_name\x18\x01 \x01(\t\"\xb8\x01\n\x16ShareHolderDetailChunk\x12\x32\n\x06header\x18\x01 \x01(\x0b\x32 .vigilio.ShareHolderDetailHeaderH\x00\x12\x32\n\x07history\x18\x02 \x01(\x0b\x32\x1f.vigilio.ShareHolderFundHistoryH\x00\x12.\n\x05\x63hart\x18\x03 \x01(\x0b\x32\x1d.vigilio.ShareHolderFundChartH\x00\x42\x06\n\x04item\"W\n BatchGetShareHolderDetailRequest\x12\x17\n\x0fshareholder_ids\x18\x01 \x03(\x05\x12\x11\n\x04\x66und\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_fund\"k\n\x1aShareHolderDetailBatchItem\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x35\n\x06\x64\x65tail\x18\x02 \x01(\x0b\x32%.vigilio.GetShareHolderDetailResponse\"S\n\x1d\x45xportShareHolderExcelRequest\x12\x16\n\x0eshareholder_id\x18\x01 \x01(\x05\x12\x11\n\x04\x66und\x18\x02 \x01(\tH\x00\x88\x01\x01\x42\x07\n\x05_fund\"G\n\x1e\x45xportShareHolderExcelResponse\x12\x12\n\nexcel_file\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"K\n ExportShareHolderParquetResponse\x12\x14\n\x0cparquet_file\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\"\xa0\x01\n\x1dGetShareHolderRecordsResponse\x12\x10\n\x08\x66und_ids\x18\x01 \x03(\t\x12\r\n\x05\x66unds\x18\x02 \x03(\t\x12\x12\n\nfund_types\x18\x03 \x03(\t\x12\x14\n\x0cshare_counts\x18\x04 \x03(\x03\x12\x0e\n\x06values\x18\x05 \x03(\x01\x12\x15\n\rpct_of_shares\x18\x06 \x03(\x01\x12\r\n\x05\x64\x61tes\x18\x07 \x03(\t\"M\n\x1b\x45xportShareHolderExcelChunk\x12\r\n\x05\x63hunk\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x0c\n\x04last\x18\x03 \x01(\x08\"\x15\n\x13GetFundTypesRequest\"$\n\x08\x46undType\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\"=\n\x14GetFundTypesResponse\x12%\n\nfund_types\x18\x01 \x03(\x0b\x32\x11.vigilio.FundType\"\xaa\x01\n\x14ListCashFlowsRequest\x12\x12\n\nstart_date\x18\x01 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x02 \x01(\t\x12\x1b\n\x0einstitute_kind\x18\x03 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05limit\x18\n \x01(\x05H\x01\x88\x01\x01\x12\x13\n\x06offset\x18\x0b \x01(\x05H\x02\x88\x01\x01\x42\x11\n\x0f_institute_kindB\x08\n\x06_limitB\t\n\x07_offset\"\xb4\x01\n\x0c\x43\x61shFlowItem\x12\x11\n\tcash_flow\x18\x01 \x01(\x01\x12\x0f\n\x07in_flow\x18\x02 \x01(\x01\x12\x10\n\x08out_flow\x18\x03 \x01(\x01\x12\x0f\n\x07profits\x18\x04 \x01(\x01\x12\x11\n\tfund_name\x18\x05 \x01(\t\x12\x11\n\tfund_type\x18\x06 \x01(\t\x12\x0f\n\x07\x66und_id\x18\x07 \x01(\x05\x12\x0e\n\x06symbol\x18\x08 \x01(\t\x12\x16\n\x0einstitute_kind\x18\t \x01(\t\"`\n\x15ListCashFlowsResponse\x12)\n\ncash_flows\x18\x01 \x03(\x0b\x32\x15.vigilio.CashFlowItem\x12\x12\n\x05total\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x08\n\x06_total\"\x94\x01\n\x18GetCashFlowDetailRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\x12\x11\n\tfund_type\x18\x04 \x01(\t\x12\x1b\n\x0einstitute_kind\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x11\n\x0f_institute_kind\"\x87\x02\n\x12\x43\x61shFlowDetailItem\x12\x11\n\tcash_flow\x18\x01 \x01(\x01\x12\x0f\n\x07in_flow\x18\x02 \x01(\x01\x12\x10\n\x08out_flow\x18\x03 \x01(\x01\x12\x13\n\x0btotal_units\x18\x04 \x01(\x01\x12\x10\n\x08purchase\x18\x05 \x01(\x01\x12\x12\n\nredemption\x18\x06 \x01(\x01\x12\x14\n\x0cissued_units\x18\x07 \x01(\x01\x12\x15\n\rrevoked_units\x18\x08 \x01(\x01\x12\x11\n\tfund_name\x18\t \x01(\t\x12\x11\n\tfund_type\x18\n \x01(\t\x12\x0f\n\x07\x66und_id\x18\x0b \x01(\x05\x12\x0e\n\x06symbol\x18\x0c \x01(\t\x12\x0c\n\x04\x64\x61te\x18\r \x01(\t\"L\n\x19GetCashFlowDetailResponse\x12/\n\ncash_flows\x18\x01 \x03(\x0b\x32\x1b.vigilio.CashFlowDetailItem\"\xeb\x01\n\x17ListTotalReturnsRequest\x12\x16\n\tfund_type\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07\x66und_id\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12\x1b\n\x0einstitute_kind\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x11\n\x04\x64\x61te\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x12\n\x05limit\x18\n \x01(\x05H\x04\x88\x01\x01\x12\x13\n\x06offset\x18\x0b \x01(\x05H\x05\x88\x01\x01\x42\x0c\n\n_fund_typeB\n\n\x08_fund_idB\x11\n\x0f_institute_kindB\x07\n\x05_dateB\x08\n\x06_limitB\t\n\x07_offset\"\xa9\x04\n\x0fTotalReturnItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x0f\n\x07\x66und_id\x18\x03 \x01(\x05\x12\x11\n\tfund_name\x18\x04 \x01(\t\x12\x11\n\tfund_type\x18\x05 \x01(\t\x12\x16\n\x0einstitute_kind\x18\x06 \x01(\t\x12\x15\n\x08last_nav\x18\x07 \x01(\x01H\x00\x88\x01\x01\x12\x1a\n\rlast_nav_date\x18\x08 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nlast_price\x18\t \x01(\x01H\x02\x88\x01\x01\x12\x1c\n\x0flast_price_date\x18\n \x01(\tH\x03\x88\x01\x01\x12\x12\n\nhas_profit\x18\x0b \x01(\x08\x12\x11\n\thas_split\x18\x0c \x01(\x08\x12\x18\n\x0btotal_units\x18\r \x01(\x01H\x04\x88\x01\x01\x12\x13\n\x06\x62ubble\x18\x0e \x01(\x01H\x05\x88\x01\x01\x12\x13\n\x06thirty\x18\x0f \x01(\x01H\x06\x88\x01\x01\x12\x13\n\x06ninety\x18\x10 \x01(\x01H\x07\x88\x01\x01\x12\x17\n\none_eighty\x18\x11 \x01(\x01H\x08\x88\x01\x01\x12\x18\n\x0bthree_sixty\x18\x12 \x01(\x01H\t\x88\x01\x01\x42\x0b\n\t_last_navB\x10\n\x0e_last_nav_dateB\r\n\x0b_last_priceB\x12\n\x10_last_price_dateB\x0e\n\x0c_total_unitsB\t\n\x07_bubbleB\t\n\x07_thirtyB\t\n\x07_ninetyB\r\n\x0b_one_eightyB\x0e\n\x0c_three_sixty\"c\n\x18ListTotalReturnsResponse\x12)\n\x07returns\x18\x01 \x03(\x0b\x32\x18.vigilio.TotalReturnItem\x12\x12\n\x05total\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x08\n\x06_total\"\xc3\x01\n\x15ListEtfReturnsRequest\x12\x14\n\x07\x66und_id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x1b\n\x0einstitute_kind\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04\x64\x61te\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05limit\x18\n \x01(\x05H\x03\x88\x01\x01\x12\x13\n\x06offset\x18\x0b \x01(\x05H\x04\x88\x01\x01\x42\n\n\x08_fund_idB\x11\n\x0f_institute_kindB\x07\n\x05_dateB\x08\n\x06_limitB\t\n\x07_offset\"\xa7\x04\n\rEtfReturnItem\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x0f\n\x07\x66und_id\x18\x03 \x01(\x05\x12\x11\n\tfund_name\x18\x04 \x01(\t\x12\x11\n\tfund_type\x18\x05 \x01(\t\x12\x16\n\x0einstitute_kind\x18\x06 \x01(\t\x12\x15\n\x08last_nav\x18\x07 \x01(\x01H\x00\x88\x01\x01\x12\x1a\n\rlast_nav_date\x18\x08 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nlast_price\x18\t \x01(\x01H\x02\x88\x01\x01\x12\x1c\n\x0flast_price_date\x18\n \x01(\tH\x03\x88\x01\x01\x12\x12\n\nhas_profit\x18\x0b \x01(\x08\x12\x11\n\thas_split\x18\x0c \x01(\x08\x12\x18\n\x0btotal_units\x18\r \x01(\x01H\x04\x88\x01\x01\x12\x13\n\x06\x62ubble\x18\x0e \x01(\x01H\x05\x88\x01\x01\x12\x13\n\x06thirty\x18\x0f \x01(\x01H\x06\x88\x01\x01\x12\x13\n\x06ninety\x18\x10 \x01(\x01H\x07\x88\x01\x01\x12\x17\n\none_eighty\x18\x11 \x01(\x01H\x08\x88\x01\x01\x12\x18\n\x0bthree_sixty\x18\x12 \x01(\x01H\t\x88\x01\x01\x42\x0b\n\t_last_navB\x10\n\x0e_last_nav_dateB\r\n\x0b_last_priceB\x12\n\x10_last_price_dateB\x0e\n\x0c_total_unitsB\t\n\x07_bubbleB\t\n\x07_thirtyB\t\n\x07_ninetyB\r\n\x0b_one_eightyB\x0e\n\x0c_three_sixty\"_\n\x16ListEtfReturnsResponse\x12\'\n\x07returns\x18\x01 \x03(\x0b\x32\x16.vigilio.EtfReturnItem\x12\x12\n\x05total\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x08\n\x06_total\"%\n\x12GetNavTrendRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\"\x97\x02\n\x0bNavDataItem\x12\x15\n\x08purchase\x18\x01 \x01(\x01H\x00\x88\x01\x01\x12\x17\n\nredemption\x18\x02 \x01(\x01H\x01\x88\x01\x01\x12\x18\n\x0bstatistical\x18\x03 \x01(\x01H\x02\x88\x01\x01\x12\x1f\n\x12preferred_purchase\x18\x04 \x01(\x01H\x03\x88\x01\x01\x12!\n\x14preferred_redemption\x18\x05 \x01(\x01H\x04\x88\x01\x01\x12\x13\n\x06\x63ommon\x18\x06 \x01(\x01H\x05\x88\x01\x01\x42\x0b\n\t_purchaseB\r\n\x0b_redemptionB\x0e\n\x0c_statisticalB\x15\n\x13_preferred_purchaseB\x17\n\x15_preferred_redemptionB\t\n\x07_common\"]\n\x0cNavTrendItem\x12\x17\n\x0fnet_asset_value\x18\x01 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12&\n\x08nav_data\x18\x03 \x01(\x0b\x32\x14.vigilio.NavDataItem\"`\n\x11NavTrendChartData\x12\r\n\x05\x64\x61tes\x18\x01 \x03(\t\x12\x14\n\x0cstatisticals\x18\x02 \x03(\x01\x12\x11\n\tpurchases\x18\x03 \x03(\x01\x12\x13\n\x0bredemptions\x18\x04 \x03(\x01\"o\n\x13GetNavTrendResponse\x12(\n\tnav_trend\x18\x01 \x03(\x0b\x32\x15.vigilio.NavTrendItem\x12.\n\nchart_data\x18\x02 \x01(\x0b\x32\x1a.vigilio.NavTrendChartData\"#\n\x10GetSplitsRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\".\n\tSplitItem\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\x13\n\x0bunits_ratio\x18\x02 \x01(\x01\"7\n\x11GetSplitsResponse\x12\"\n\x06splits\x18\x01 \x03(\x0b\x32\x12.vigilio.SplitItem\"$\n\x11GetProfitsRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\"*\n\nProfitItem\x12\x0e\n\x06profit\x18\x01 \x01(\x01\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\":\n\x12GetProfitsResponse\x12$\n\x07profits\x18\x01 \x03(\x0b\x32\x13.vigilio.ProfitItem\"#\n\x10GetPricesRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\"(\n\tPriceItem\x12\x0c\n\x04\x64\x61te\x18\x01 \x01(\t\x12\r\n\x05price\x18\x02 \x01(\x01\"7\n\x11GetPricesResponse\x12\"\n\x06prices\x18\x01 \x03(\x0b\x32\x12.vigilio.PriceItem\"\x7f\n\x14GetFundBundleRequest\x12\x0f\n\x07\x66und_id\x18\x01 \x01(\x05\x12\x16\n\x0eskip_nav_trend\x18\x02 \x01(\x08\x12\x13\n\x0bskip_splits\x18\x03 \x01(\x08\x12\x14\n\x0cskip_profits\x18\x04 \x01(\x08\x12\x13\n\x0bskip_prices\x18\x05 \x01(\x08\"\xb6\x01\n\x15GetFundBundleResponse\x12/\n\tnav_trend\x18\x01 \x01(\x0b\x32\x1c.vigilio.GetNavTrendResponse\x12\"\n\x06splits\x18\x02 \x03(\x0b\x32\x12.vigilio.SplitItem\x12$\n\x07profits\x18\x03 \x03(\x0b\x32\x13.vigilio.ProfitItem\x12\"\n\x06prices\x18\x04 \x03(\x0b\x32\x12.vigilio.PriceItem2\xf0\x14\n\x0eVigilioService\x12K\n\x0cGetFundTypes\x12\x1c.vigilio.GetFundTypesRequest\x1a\x1d.vigilio.GetFundTypesResponse\x12U\n\x10ListShareHolders\x12\x1f.vigilio.ShareHolderListRequest\x1a .vigilio.ShareHolderListResponse\x12\x66\n\x13ShareHoldersSummary\x12&.vigilio.ShareHolderSummaryListRequest\x1a\'.vigilio.ShareHolderSummaryListResponse\x12p\n\x1aShareHoldersSummaryColumns\x12&.vigilio.ShareHolderSummaryListRequest\x1a*.vigilio.ShareHolderSummaryColumnsResponse\x12`\n\x15GetShareHolderForDate\x12\".vigilio.ShareHolderForDateRequest\x1a#.vigilio.ShareHolderForDateResponse\x12u\n\x1e\x45xportShareHoldersSummaryExcel\x12(.vigilio.ShareHolderSummaryExportRequest\x1a).vigilio.ShareHolderSummaryExportResponse\x12\x63\n\x14GetShareHolderDetail\x12$.vigilio.GetShareHolderDetailRequest\x1a%.vigilio.GetShareHolderDetailResponse\x12\x62\n\x17StreamShareHolderDetail\x12$.vigilio.GetShareHolderDetailRequest\x1a\x1f.vigilio.ShareHolderDetailChunk0\x01\x12m\n\x19\x42\x61tchGetShareHolderDetail\x12).vigilio.BatchGetShareHolderDetailRequest\x1a#.vigilio.ShareHolderDetailBatchItem0\x01\x12i\n\x16\x45xportShareHolderExcel\x12&.vigilio.ExportShareHolderExcelRequest\x1a\'.vigilio.ExportShareHolderExcelResponse\x12m\n\x18\x45xportShareHolderParquet\x12&.vigilio.ExportShareHolderExcelRequest\x1a).vigilio.ExportShareHolderParquetResponse\x12g\n\x15GetShareHolderRecords\x12&.vigilio.ExportShareHolderExcelRequest\x1a&.vigilio.GetShareHolderRecordsResponse\x12N\n\rListCashFlows\x12\x1d.vigilio.ListCashFlowsRequest\x1a\x1e.vigilio.ListCashFlowsResponse\x12Z\n\x11GetCashFlowDetail\x12!.vigilio.GetCashFlowDetailRequest\x1a\".vigilio.GetCashFlowDetailResponse\x12W\n\x10ListTotalReturns\x12 .vigilio.ListTotalReturnsRequest\x1a!.vigilio.ListTotalReturnsResponse\x12Q\n\x0eListEtfReturns\x12\x1e.vigilio.ListEtfReturnsRequest\x1a\x1f.vigilio.ListEtfReturnsResponse\x12H\n\x0bGetNavTrend\x12\x1b.vigilio.GetNavTrendRequest\x1a\x1c.vigilio.GetNavTrendResponse\x12\x42\n\tGetSplits\x12\x19.vigilio.GetSplitsRequest\x1a\x1a.vigilio.GetSplitsResponse\x12\x45\n\nGetProfits\x12\x1a.vigilio.GetProfitsRequest\x1a\x1b.vigilio.GetProfitsResponse\x12\x42\n\tGetPrices\x12\x19.vigilio.GetPricesRequest\x1a\x1a.vigilio.GetPricesResponse\x12N\n\rGetFundBundle\x12\x1d.vigilio.GetFundBundleRequest\x1a\x1e.vigilio.GetFundBundleResponse\x12]\n\x16StreamListShareHolders\x12\x1f.vigilio.ShareHolderListRequest\x1a .vigilio.ShareHolderListResponse0\x01\x12n\n\x19StreamShareHoldersSummary\x12&.vigilio.ShareHolderSummaryListRequest\x1a\'.vigilio.ShareHolderSummaryListResponse0\x01\x12V\n\x13StreamListCashFlows\x12\x1d.vigilio.ListCashFlowsRequest\x1a\x1e.vigilio.ListCashFlowsResponse0\x01\x12_\n\x16StreamListTotalReturns\x12 .vigilio.ListTotalReturnsRequest\x1a!.vigilio.ListTotalReturnsResponse0\x01\x12Y\n\x14StreamListEtfReturns\x12\x1e.vigilio.ListEtfReturnsRequest\x1a\x1f.vigilio.ListEtfReturnsResponse0\x01\x12x\n$StreamExportShareHoldersSummaryExcel\x12(.vigilio.ShareHolderSummaryExportRequest\x1a$.vigilio.ExportShareHolderExcelChunk0\x01\x12n\n\x1cStreamExportShareHolderExcel\x12&.vigilio.ExportShareHolderExcelRequest\x1a$.vigilio.ExportShareHolderExcelChunk0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -32,119 +32,139 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'vigilio_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_SHAREHOLDERSUMMARYLISTREQUEST']._serialized_start=27
-  _globals['_SHAREHOLDERSUMMARYLISTREQUEST']._serialized_end=192
-  _globals['_SHAREHOLDERSUMMARYITEM']._serialized_start=194
-  _globals['_SHAREHOLDERSUMMARYITEM']._serialized_end=284
-  _globals['_SHAREHOLDERSUMMARYLISTRESPONSE']._serialized_start=286
-  _globals['_SHAREHOLDERSUMMARYLISTRESPONSE']._serialized_end=373
-  _globals['_SHAREHOLDERFORDATEREQUEST']._serialized_start=375
-  _globals['_SHAREHOLDERFORDATEREQUEST']._serialized_end=492
-  _globals['_FUNDHISTORYITEM']._serialized_start=495
-  _globals['_FUNDHISTORYITEM']._serialized_end=635
-  _globals['_SHAREHOLDERFORDATERESPONSE']._serialized_start=637
-  _globals['_SHAREHOLDERFORDATERESPONSE']._serialized_end=761
-  _globals['_SHAREHOLDERSUMMARYEXPORTREQUEST']._serialized_start=763
-  _globals['_SHAREHOLDERSUMMARYEXPORTREQUEST']._serialized_end=843
-  _globals['_SHAREHOLDERSUMMARYEXPORTRESPONSE']._serialized_start=845
-  _globals['_SHAREHOLDERSUMMARYEXPORTRESPONSE']._serialized_end=917
-  _globals['_SHAREHOLDERSUMMARYREQUEST']._serialized_start=919
-  _globals['_SHAREHOLDERSUMMARYREQUEST']._serialized_end=979
-  _globals['_SHAREHOLDERSUMMARYRESPONSE']._serialized_start=981
-  _globals['_SHAREHOLDERSUMMARYRESPONSE']._serialized_end=1060
-  _globals['_SHAREHOLDERSUMMARY']._serialized_start=1062
-  _globals['_SHAREHOLDERSUMMARY']._serialized_end=1148
-  _globals['_SHAREHOLDERSUMMARYEXCELREQUEST']._serialized_start=1150
-  _globals['_SHAREHOLDERSUMMARYEXCELREQUEST']._serialized_end=1215
-  _globals['_SHAREHOLDERSUMMARYEXCELRESPONSE']._serialized_start=1217
-  _globals['_SHAREHOLDERSUMMARYEXCELRESPONSE']._serialized_end=1289
-  _globals['_SHAREHOLDERBYNAME']._serialized_start=1291
-  _globals['_SHAREHOLDERBYNAME']._serialized_end=1336
-  _globals['_SHAREHOLDERLISTREQUEST']._serialized_start=1338
-  _globals['_SHAREHOLDERLISTREQUEST']._serialized_end=1381
-  _globals['_SHAREHOLDERLISTRESPONSE']._serialized_start=1383
-  _globals['_SHAREHOLDERLISTRESPONSE']._serialized_end=1458
-  _globals['_SHAREHOLDERFUNDHISTORY']._serialized_start=1461
-  _globals['_SHAREHOLDERFUNDHISTORY']._serialized_end=1608
-  _globals['_SHAREHOLDERDETAILREQUEST']._serialized_start=1610
-  _globals['_SHAREHOLDERDETAILREQUEST']._serialized_end=1716
-  _globals['_SHAREHOLDERDETAILRESPONSE']._serialized_start=1718
-  _globals['_SHAREHOLDERDETAILRESPONSE']._serialized_end=1836
-  _globals['_SHAREHOLDEREXCELREQUEST']._serialized_start=1838
-  _globals['_SHAREHOLDEREXCELREQUEST']._serialized_end=1887
-  _globals['_SHAREHOLDEREXCELRESPONSE']._serialized_start=1889
-  _globals['_SHAREHOLDEREXCELRESPONSE']._serialized_end=1954
-  _globals['_SHAREHOLDERCHARTREQUEST']._serialized_start=1957
-  _globals['_SHAREHOLDERCHARTREQUEST']._serialized_end=2096
-  _globals['_SHAREHOLDERCHARTRESPONSE']._serialized_start=2099
-  _globals['_SHAREHOLDERCHARTRESPONSE']._serialized_end=2241
-  _globals['_SHAREHOLDERFUNDCHART']._serialized_start=2243
-  _globals['_SHAREHOLDERFUNDCHART']._serialized_end=2302
-  _globals['_GETSHAREHOLDERDETAILREQUEST']._serialized_start=2304
-  _globals['_GETSHAREHOLDERDETAILREQUEST']._serialized_end=2385
-  _globals['_GETSHAREHOLDERDETAILRESPONSE']._serialized_start=2388
-  _globals['_GETSHAREHOLDERDETAILRESPONSE']._serialized_end=2560
-  _globals['_EXPORTSHAREHOLDEREXCELREQUEST']._serialized_start=2562
-  _globals['_EXPORTSHAREHOLDEREXCELREQUEST']._serialized_end=2645
-  _globals['_EXPORTSHAREHOLDEREXCELRESPONSE']._serialized_start=2647
-  _globals['_EXPORTSHAREHOLDEREXCELRESPONSE']._serialized_end=2718
-  _globals['_GETFUNDTYPESREQUEST']._serialized_start=2720
-  _globals['_GETFUNDTYPESREQUEST']._serialized_end=2741
-  _globals['_FUNDTYPE']._serialized_start=2743
-  _globals['_FUNDTYPE']._serialized_end=2779
-  _globals['_GETFUNDTYPESRESPONSE']._serialized_start=2781
-  _globals['_GETFUNDTYPESRESPONSE']._serialized_end=2842
-  _globals['_LISTCASHFLOWSREQUEST']._serialized_start=2844
-  _globals['_LISTCASHFLOWSREQUEST']._serialized_end=2952
-  _globals['_CASHFLOWITEM']._serialized_start=2955
-  _globals['_CASHFLOWITEM']._serialized_end=3135
-  _globals['_LISTCASHFLOWSRESPONSE']._serialized_start=3137
-  _globals['_LISTCASHFLOWSRESPONSE']._serialized_end=3203
-  _globals['_GETCASHFLOWDETAILREQUEST']._serialized_start=3206
-  _globals['_GETCASHFLOWDETAILREQUEST']._serialized_end=3354
-  _globals['_CASHFLOWDETAILITEM']._serialized_start=3357
-  _globals['_CASHFLOWDETAILITEM']._serialized_end=3620
-  _globals['_GETCASHFLOWDETAILRESPONSE']._serialized_start=3622
-  _globals['_GETCASHFLOWDETAILRESPONSE']._serialized_end=3698
-  _globals['_LISTTOTALRETURNSREQUEST']._serialized_start=3701
-  _globals['_LISTTOTALRETURNSREQUEST']._serialized_end=3874
-  _globals['_TOTALRETURNITEM']._serialized_start=3877
-  _globals['_TOTALRETURNITEM']._serialized_end=4430
-  _globals['_LISTTOTALRETURNSRESPONSE']._serialized_start=4432
-  _globals['_LISTTOTALRETURNSRESPONSE']._serialized_end=4501
-  _globals['_LISTETFRETURNSREQUEST']._serialized_start=4504
-  _globals['_LISTETFRETURNSREQUEST']._serialized_end=4637
-  _globals['_ETFRETURNITEM']._serialized_start=4640
-  _globals['_ETFRETURNITEM']._serialized_end=5191
-  _globals['_LISTETFRETURNSRESPONSE']._serialized_start=5193
-  _globals['_LISTETFRETURNSRESPONSE']._serialized_end=5258
-  _globals['_GETNAVTRENDREQUEST']._serialized_start=5260
-  _globals['_GETNAVTRENDREQUEST']._serialized_end=5297
-  _globals['_NAVDATAITEM']._serialized_start=5300
-  _globals['_NAVDATAITEM']._serialized_end=5579
-  _globals['_NAVTRENDITEM']._serialized_start=5581
-  _globals['_NAVTRENDITEM']._serialized_end=5674
-  _globals['_NAVTRENDCHARTDATA']._serialized_start=5676
-  _globals['_NAVTRENDCHARTDATA']._serialized_end=5772
-  _globals['_GETNAVTRENDRESPONSE']._serialized_start=5774
-  _globals['_GETNAVTRENDRESPONSE']._serialized_end=5885
-  _globals['_GETSPLITSREQUEST']._serialized_start=5887
-  _globals['_GETSPLITSREQUEST']._serialized_end=5922
-  _globals['_SPLITITEM']._serialized_start=5924
-  _globals['_SPLITITEM']._serialized_end=5970
-  _globals['_GETSPLITSRESPONSE']._serialized_start=5972
-  _globals['_GETSPLITSRESPONSE']._serialized_end=6027
-  _globals['_GETPROFITSREQUEST']._serialized_start=6029
-  _globals['_GETPROFITSREQUEST']._serialized_end=6065
-  _globals['_PROFITITEM']._serialized_start=6067
-  _globals['_PROFITITEM']._serialized_end=6109
-  _globals['_GETPROFITSRESPONSE']._serialized_start=6111
-  _globals['_GETPROFITSRESPONSE']._serialized_end=6169
-  _globals['_GETPRICESREQUEST']._serialized_start=6171
-  _globals['_GETPRICESREQUEST']._serialized_end=6206
-  _globals['_PRICEITEM']._serialized_start=6208
-  _globals['_PRICEITEM']._serialized_end=6248
-  _globals['_GETPRICESRESPONSE']._serialized_start=6250
-  _globals['_GETPRICESRESPONSE']._serialized_end=6305
-  _globals['_VIGILIOSERVICE']._serialized_start=6308
-  _globals['_VIGILIOSERVICE']._serialized_end=7642
+  _globals['_SHAREHOLDERSUMMARYLISTREQUEST']._serialized_end=254
+  _globals['_SHAREHOLDERSUMMARYITEM']._serialized_start=256
+  _globals['_SHAREHOLDERSUMMARYITEM']._serialized_end=346
+  _globals['_SHAREHOLDERSUMMARYLISTRESPONSE']._serialized_start=348
+  _globals['_SHAREHOLDERSUMMARYLISTRESPONSE']._serialized_end=435
+  _globals['_SHAREHOLDERSUMMARYCOLUMNSRESPONSE']._serialized_start=437
+  _globals['_SHAREHOLDERSUMMARYCOLUMNSRESPONSE']._serialized_end=541
+  _globals['_SHAREHOLDERFORDATEREQUEST']._serialized_start=543
+  _globals['_SHAREHOLDERFORDATEREQUEST']._serialized_end=660
+  _globals['_FUNDHISTORYITEM']._serialized_start=663
+  _globals['_FUNDHISTORYITEM']._serialized_end=803
+  _globals['_SHAREHOLDERFORDATERESPONSE']._serialized_start=805
+  _globals['_SHAREHOLDERFORDATERESPONSE']._serialized_end=929
+  _globals['_SHAREHOLDERSUMMARYEXPORTREQUEST']._serialized_start=931
+  _globals['_SHAREHOLDERSUMMARYEXPORTREQUEST']._serialized_end=1011
+  _globals['_SHAREHOLDERSUMMARYEXPORTRESPONSE']._serialized_start=1013
+  _globals['_SHAREHOLDERSUMMARYEXPORTRESPONSE']._serialized_end=1085
+  _globals['_SHAREHOLDERSUMMARYREQUEST']._serialized_start=1087
+  _globals['_SHAREHOLDERSUMMARYREQUEST']._serialized_end=1147
+  _globals['_SHAREHOLDERSUMMARYRESPONSE']._serialized_start=1149
+  _globals['_SHAREHOLDERSUMMARYRESPONSE']._serialized_end=1228
+  _globals['_SHAREHOLDERSUMMARY']._serialized_start=1230
+  _globals['_SHAREHOLDERSUMMARY']._serialized_end=1316
+  _globals['_SHAREHOLDERSUMMARYEXCELREQUEST']._serialized_start=1318
+  _globals['_SHAREHOLDERSUMMARYEXCELREQUEST']._serialized_end=1383
+  _globals['_SHAREHOLDERSUMMARYEXCELRESPONSE']._serialized_start=1385
+  _globals['_SHAREHOLDERSUMMARYEXCELRESPONSE']._serialized_end=1457
+  _globals['_SHAREHOLDERBYNAME']._serialized_start=1459
+  _globals['_SHAREHOLDERBYNAME']._serialized_end=1504
+  _globals['_SHAREHOLDERLISTREQUEST']._serialized_start=1506
+  _globals['_SHAREHOLDERLISTREQUEST']._serialized_end=1580
+  _globals['_SHAREHOLDERLISTRESPONSE']._serialized_start=1582
+  _globals['_SHAREHOLDERLISTRESPONSE']._serialized_end=1657
+  _globals['_SHAREHOLDERFUNDHISTORY']._serialized_start=1660
+  _globals['_SHAREHOLDERFUNDHISTORY']._serialized_end=1807
+  _globals['_SHAREHOLDERDETAILREQUEST']._serialized_start=1809
+  _globals['_SHAREHOLDERDETAILREQUEST']._serialized_end=1915
+  _globals['_SHAREHOLDERDETAILRESPONSE']._serialized_start=1917
+  _globals['_SHAREHOLDERDETAILRESPONSE']._serialized_end=2035
+  _globals['_SHAREHOLDEREXCELREQUEST']._serialized_start=2037
+  _globals['_SHAREHOLDEREXCELREQUEST']._serialized_end=2086
+  _globals['_SHAREHOLDEREXCELRESPONSE']._serialized_start=2088
+  _globals['_SHAREHOLDEREXCELRESPONSE']._serialized_end=2153
+  _globals['_SHAREHOLDERCHARTREQUEST']._serialized_start=2156
+  _globals['_SHAREHOLDERCHARTREQUEST']._serialized_end=2295
+  _globals['_SHAREHOLDERCHARTRESPONSE']._serialized_start=2298
+  _globals['_SHAREHOLDERCHARTRESPONSE']._serialized_end=2440
+  _globals['_SHAREHOLDERFUNDCHART']._serialized_start=2442
+  _globals['_SHAREHOLDERFUNDCHART']._serialized_end=2501
+  _globals['_GETSHAREHOLDERDETAILREQUEST']._serialized_start=2503
+  _globals['_GETSHAREHOLDERDETAILREQUEST']._serialized_end=2584
+  _globals['_GETSHAREHOLDERDETAILRESPONSE']._serialized_start=2587
+  _globals['_GETSHAREHOLDERDETAILRESPONSE']._serialized_end=2759
+  _globals['_SHAREHOLDERDETAILHEADER']._serialized_start=2761
+  _globals['_SHAREHOLDERDETAILHEADER']._serialized_end=2812
+  _globals['_SHAREHOLDERDETAILCHUNK']._serialized_start=2815
+  _globals['_SHAREHOLDERDETAILCHUNK']._serialized_end=2999
+  _globals['_BATCHGETSHAREHOLDERDETAILREQUEST']._serialized_start=3001
+  _globals['_BATCHGETSHAREHOLDERDETAILREQUEST']._serialized_end=3088
+  _globals['_SHAREHOLDERDETAILBATCHITEM']._serialized_start=3090
+  _globals['_SHAREHOLDERDETAILBATCHITEM']._serialized_end=3197
+  _globals['_EXPORTSHAREHOLDEREXCELREQUEST']._serialized_start=3199
+  _globals['_EXPORTSHAREHOLDEREXCELREQUEST']._serialized_end=3282
+  _globals['_EXPORTSHAREHOLDEREXCELRESPONSE']._serialized_start=3284
+  _globals['_EXPORTSHAREHOLDEREXCELRESPONSE']._serialized_end=3355
+  _globals['_EXPORTSHAREHOLDERPARQUETRESPONSE']._serialized_start=3357
+  _globals['_EXPORTSHAREHOLDERPARQUETRESPONSE']._serialized_end=3432
+  _globals['_GETSHAREHOLDERRECORDSRESPONSE']._serialized_start=3435
+  _globals['_GETSHAREHOLDERRECORDSRESPONSE']._serialized_end=3595
+  _globals['_EXPORTSHAREHOLDEREXCELCHUNK']._serialized_start=3597
+  _globals['_EXPORTSHAREHOLDEREXCELCHUNK']._serialized_end=3674
+  _globals['_GETFUNDTYPESREQUEST']._serialized_start=3676
+  _globals['_GETFUNDTYPESREQUEST']._serialized_end=3697
+  _globals['_FUNDTYPE']._serialized_start=3699
+  _globals['_FUNDTYPE']._serialized_end=3735
+  _globals['_GETFUNDTYPESRESPONSE']._serialized_start=3737
+  _globals['_GETFUNDTYPESRESPONSE']._serialized_end=3798
+  _globals['_LISTCASHFLOWSREQUEST']._serialized_start=3801
+  _globals['_LISTCASHFLOWSREQUEST']._serialized_end=3971
+  _globals['_CASHFLOWITEM']._serialized_start=3974
+  _globals['_CASHFLOWITEM']._serialized_end=4154
+  _globals['_LISTCASHFLOWSRESPONSE']._serialized_start=4156
+  _globals['_LISTCASHFLOWSRESPONSE']._serialized_end=4252
+  _globals['_GETCASHFLOWDETAILREQUEST']._serialized_start=4255
+  _globals['_GETCASHFLOWDETAILREQUEST']._serialized_end=4403
+  _globals['_CASHFLOWDETAILITEM']._serialized_start=4406
+  _globals['_CASHFLOWDETAILITEM']._serialized_end=4669
+  _globals['_GETCASHFLOWDETAILRESPONSE']._serialized_start=4671
+  _globals['_GETCASHFLOWDETAILRESPONSE']._serialized_end=4747
+  _globals['_LISTTOTALRETURNSREQUEST']._serialized_start=4750
+  _globals['_LISTTOTALRETURNSREQUEST']._serialized_end=4985
+  _globals['_TOTALRETURNITEM']._serialized_start=4988
+  _globals['_TOTALRETURNITEM']._serialized_end=5541
+  _globals['_LISTTOTALRETURNSRESPONSE']._serialized_start=5543
+  _globals['_LISTTOTALRETURNSRESPONSE']._serialized_end=5642
+  _globals['_LISTETFRETURNSREQUEST']._serialized_start=5645
+  _globals['_LISTETFRETURNSREQUEST']._serialized_end=5840
+  _globals['_ETFRETURNITEM']._serialized_start=5843
+  _globals['_ETFRETURNITEM']._serialized_end=6394
+  _globals['_LISTETFRETURNSRESPONSE']._serialized_start=6396
+  _globals['_LISTETFRETURNSRESPONSE']._serialized_end=6491
+  _globals['_GETNAVTRENDREQUEST']._serialized_start=6493
+  _globals['_GETNAVTRENDREQUEST']._serialized_end=6530
+  _globals['_NAVDATAITEM']._serialized_start=6533
+  _globals['_NAVDATAITEM']._serialized_end=6812
+  _globals['_NAVTRENDITEM']._serialized_start=6814
+  _globals['_NAVTRENDITEM']._serialized_end=6907
+  _globals['_NAVTRENDCHARTDATA']._serialized_start=6909
+  _globals['_NAVTRENDCHARTDATA']._serialized_end=7005
+  _globals['_GETNAVTRENDRESPONSE']._serialized_start=7007
+  _globals['_GETNAVTRENDRESPONSE']._serialized_end=7118
+  _globals['_GETSPLITSREQUEST']._serialized_start=7120
+  _globals['_GETSPLITSREQUEST']._serialized_end=7155
+  _globals['_SPLITITEM']._serialized_start=7157
+  _globals['_SPLITITEM']._serialized_end=7203
+  _globals['_GETSPLITSRESPONSE']._serialized_start=7205
+  _globals['_GETSPLITSRESPONSE']._serialized_end=7260
+  _globals['_GETPROFITSREQUEST']._serialized_start=7262
+  _globals['_GETPROFITSREQUEST']._serialized_end=7298
+  _globals['_PROFITITEM']._serialized_start=7300
+  _globals['_PROFITITEM']._serialized_end=7342
+  _globals['_GETPROFITSRESPONSE']._serialized_start=7344
+  _globals['_GETPROFITSRESPONSE']._serialized_end=7402
+  _globals['_GETPRICESREQUEST']._serialized_start=7404
+  _globals['_GETPRICESREQUEST']._serialized_end=7439
+  _globals['_PRICEITEM']._serialized_start=7441
+  _globals['_PRICEITEM']._serialized_end=7481
+  _globals['_GETPRICESRESPONSE']._serialized_start=7483
+  _globals['_GETPRICESRESPONSE']._serialized_end=7538
+  _globals['_GETFUNDBUNDLEREQUEST']._serialized_start=7540
+  _globals['_GETFUNDBUNDLEREQUEST']._serialized_end=7667
+  _globals['_GETFUNDBUNDLERESPONSE']._serialized_start=7670
+  _globals['_GETFUNDBUNDLERESPONSE']._serialized_end=7852
+  _globals['_VIGILIOSERVICE']._serialized_start=7855
+  _globals['_VIGILIOSERVICE']._serialized_end=10527
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,729 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ShareHolderSummaryListRequest(_message.Message):
+    __slots__ = ("date", "fund_type", "search", "ordering", "limit", "offset")
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_FIELD_NUMBER: _ClassVar[int]
+    ORDERING_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    date: str
+    fund_type: str
+    search: str
+    ordering: str
+    limit: int
+    offset: int
+    def __init__(self, date: _Optional[str] = ..., fund_type: _Optional[str] = ..., search: _Optional[str] = ..., ordering: _Optional[str] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+
+class ShareHolderSummaryItem(_message.Message):
+    __slots__ = ("id", "name", "num_funds", "total_value")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    NUM_FUNDS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_VALUE_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    name: str
+    num_funds: int
+    total_value: float
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., num_funds: _Optional[int] = ..., total_value: _Optional[float] = ...) -> None: ...
+
+class ShareHolderSummaryListResponse(_message.Message):
+    __slots__ = ("shareholders",)
+    SHAREHOLDERS_FIELD_NUMBER: _ClassVar[int]
+    shareholders: _containers.RepeatedCompositeFieldContainer[ShareHolderSummaryItem]
+    def __init__(self, shareholders: _Optional[_Iterable[_Union[ShareHolderSummaryItem, _Mapping]]] = ...) -> None: ...
+
+class ShareHolderSummaryColumnsResponse(_message.Message):
+    __slots__ = ("ids", "names", "num_funds", "total_values")
+    IDS_FIELD_NUMBER: _ClassVar[int]
+    NAMES_FIELD_NUMBER: _ClassVar[int]
+    NUM_FUNDS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_VALUES_FIELD_NUMBER: _ClassVar[int]
+    ids: _containers.RepeatedScalarFieldContainer[int]
+    names: _containers.RepeatedScalarFieldContainer[str]
+    num_funds: _containers.RepeatedScalarFieldContainer[int]
+    total_values: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(self, ids: _Optional[_Iterable[int]] = ..., names: _Optional[_Iterable[str]] = ..., num_funds: _Optional[_Iterable[int]] = ..., total_values: _Optional[_Iterable[float]] = ...) -> None: ...
+
+class ShareHolderForDateRequest(_message.Message):
+    __slots__ = ("shareholder_id", "date", "fund_type")
+    SHAREHOLDER_ID_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    shareholder_id: int
+    date: str
+    fund_type: str
+    def __init__(self, shareholder_id: _Optional[int] = ..., date: _Optional[str] = ..., fund_type: _Optional[str] = ...) -> None: ...
+
+class FundHistoryItem(_message.Message):
+    __slots__ = ("fund_id", "fund", "share_count", "value", "date", "fund_type", "pct_of_shares")
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_FIELD_NUMBER: _ClassVar[int]
+    SHARE_COUNT_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    PCT_OF_SHARES_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    fund: str
+    share_count: int
+    value: float
+    date: str
+    fund_type: str
+    pct_of_shares: float
+    def __init__(self, fund_id: _Optional[int] = ..., fund: _Optional[str] = ..., share_count: _Optional[int] = ..., value: _Optional[float] = ..., date: _Optional[str] = ..., fund_type: _Optional[str] = ..., pct_of_shares: _Optional[float] = ...) -> None: ...
+
+class ShareHolderForDateResponse(_message.Message):
+    __slots__ = ("id", "shareholder_name", "share_holder_histories")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    SHAREHOLDER_NAME_FIELD_NUMBER: _ClassVar[int]
+    SHARE_HOLDER_HISTORIES_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    shareholder_name: str
+    share_holder_histories: _containers.RepeatedCompositeFieldContainer[FundHistoryItem]
+    def __init__(self, id: _Optional[int] = ..., shareholder_name: _Optional[str] = ..., share_holder_histories: _Optional[_Iterable[_Union[FundHistoryItem, _Mapping]]] = ...) -> None: ...
+
+class ShareHolderSummaryExportRequest(_message.Message):
+    __slots__ = ("fund_type", "date")
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    fund_type: str
+    date: str
+    def __init__(self, fund_type: _Optional[str] = ..., date: _Optional[str] = ...) -> None: ...
+
+class ShareHolderSummaryExportResponse(_message.Message):
+    __slots__ = ("excel_data", "filename")
+    EXCEL_DATA_FIELD_NUMBER: _ClassVar[int]
+    FILENAME_FIELD_NUMBER: _ClassVar[int]
+    excel_data: bytes
+    filename: str
+    def __init__(self, excel_data: _Optional[bytes] = ..., filename: _Optional[str] = ...) -> None: ...
+
+class ShareHolderSummaryRequest(_message.Message):
+    __slots__ = ("date", "fund_type")
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    date: str
+    fund_type: str
+    def __init__(self, date: _Optional[str] = ..., fund_type: _Optional[str] = ...) -> None: ...
+
+class ShareHolderSummaryResponse(_message.Message):
+    __slots__ = ("shareholders",)
+    SHAREHOLDERS_FIELD_NUMBER: _ClassVar[int]
+    shareholders: _containers.RepeatedCompositeFieldContainer[ShareHolderSummary]
+    def __init__(self, shareholders: _Optional[_Iterable[_Union[ShareHolderSummary, _Mapping]]] = ...) -> None: ...
+
+class ShareHolderSummary(_message.Message):
+    __slots__ = ("id", "name", "num_funds", "total_value")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    NUM_FUNDS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_VALUE_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    name: str
+    num_funds: int
+    total_value: float
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., num_funds: _Optional[int] = ..., total_value: _Optional[float] = ...) -> None: ...
+
+class ShareHolderSummaryExcelRequest(_message.Message):
+    __slots__ = ("date", "fund_type")
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    date: str
+    fund_type: str
+    def __init__(self, date: _Optional[str] = ..., fund_type: _Optional[str] = ...) -> None: ...
+
+class ShareHolderSummaryExcelResponse(_message.Message):
+    __slots__ = ("excel_file", "file_name")
+    EXCEL_FILE_FIELD_NUMBER: _ClassVar[int]
+    FILE_NAME_FIELD_NUMBER: _ClassVar[int]
+    excel_file: bytes
+    file_name: str
+    def __init__(self, excel_file: _Optional[bytes] = ..., file_name: _Optional[str] = ...) -> None: ...
+
+class ShareHolderByName(_message.Message):
+    __slots__ = ("id", "name")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    name: str
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ...) -> None: ...
+
+class ShareHolderListRequest(_message.Message):
+    __slots__ = ("fund_type", "limit", "offset")
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    fund_type: str
+    limit: int
+    offset: int
+    def __init__(self, fund_type: _Optional[str] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+
+class ShareHolderListResponse(_message.Message):
+    __slots__ = ("shareholders",)
+    SHAREHOLDERS_FIELD_NUMBER: _ClassVar[int]
+    shareholders: _containers.RepeatedCompositeFieldContainer[ShareHolderByName]
+    def __init__(self, shareholders: _Optional[_Iterable[_Union[ShareHolderByName, _Mapping]]] = ...) -> None: ...
+
+class ShareHolderFundHistory(_message.Message):
+    __slots__ = ("fund_id", "fund", "fund_type", "share_count", "value", "pct_of_shares", "date")
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    SHARE_COUNT_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    PCT_OF_SHARES_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    fund_id: str
+    fund: str
+    fund_type: str
+    share_count: int
+    value: float
+    pct_of_shares: float
+    date: str
+    def __init__(self, fund_id: _Optional[str] = ..., fund: _Optional[str] = ..., fund_type: _Optional[str] = ..., share_count: _Optional[int] = ..., value: _Optional[float] = ..., pct_of_shares: _Optional[float] = ..., date: _Optional[str] = ...) -> None: ...
+
+class ShareHolderDetailRequest(_message.Message):
+    __slots__ = ("shareholder_id", "fund", "date")
+    SHAREHOLDER_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    shareholder_id: int
+    fund: str
+    date: str
+    def __init__(self, shareholder_id: _Optional[int] = ..., fund: _Optional[str] = ..., date: _Optional[str] = ...) -> None: ...
+
+class ShareHolderDetailResponse(_message.Message):
+    __slots__ = ("shareholder_name", "share_holder_histories")
+    SHAREHOLDER_NAME_FIELD_NUMBER: _ClassVar[int]
+    SHARE_HOLDER_HISTORIES_FIELD_NUMBER: _ClassVar[int]
+    shareholder_name: str
+    share_holder_histories: _containers.RepeatedCompositeFieldContainer[ShareHolderFundHistory]
+    def __init__(self, shareholder_name: _Optional[str] = ..., share_holder_histories: _Optional[_Iterable[_Union[ShareHolderFundHistory, _Mapping]]] = ...) -> None: ...
+
+class ShareHolderExcelRequest(_message.Message):
+    __slots__ = ("shareholder_id",)
+    SHAREHOLDER_ID_FIELD_NUMBER: _ClassVar[int]
+    shareholder_id: int
+    def __init__(self, shareholder_id: _Optional[int] = ...) -> None: ...
+
+class ShareHolderExcelResponse(_message.Message):
+    __slots__ = ("excel_file", "file_name")
+    EXCEL_FILE_FIELD_NUMBER: _ClassVar[int]
+    FILE_NAME_FIELD_NUMBER: _ClassVar[int]
+    excel_file: bytes
+    file_name: str
+    def __init__(self, excel_file: _Optional[bytes] = ..., file_name: _Optional[str] = ...) -> None: ...
+
+class ShareHolderChartRequest(_message.Message):
+    __slots__ = ("shareholder_id", "fund", "start_date", "end_date")
+    SHAREHOLDER_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_FIELD_NUMBER: _ClassVar[int]
+    START_DATE_FIELD_NUMBER: _ClassVar[int]
+    END_DATE_FIELD_NUMBER: _ClassVar[int]
+    shareholder_id: int
+    fund: str
+    start_date: str
+    end_date: str
+    def __init__(self, shareholder_id: _Optional[int] = ..., fund: _Optional[str] = ..., start_date: _Optional[str] = ..., end_date: _Optional[str] = ...) -> None: ...
+
+class ShareHolderChartResponse(_message.Message):
+    __slots__ = ("share_holder_histories", "chart_data")
+    SHARE_HOLDER_HISTORIES_FIELD_NUMBER: _ClassVar[int]
+    CHART_DATA_FIELD_NUMBER: _ClassVar[int]
+    share_holder_histories: _containers.RepeatedCompositeFieldContainer[ShareHolderFundHistory]
+    chart_data: _containers.RepeatedCompositeFieldContainer[ShareHolderFundChart]
+    def __init__(self, share_holder_histories: _Optional[_Iterable[_Union[ShareHolderFundHistory, _Mapping]]] = ..., chart_data: _Optional[_Iterable[_Union[ShareHolderFundChart, _Mapping]]] = ...) -> None: ...
+
+class ShareHolderFundChart(_message.Message):
+    __slots__ = ("dates", "share_counts")
+    DATES_FIELD_NUMBER: _ClassVar[int]
+    SHARE_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    dates: _containers.RepeatedScalarFieldContainer[str]
+    share_counts: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, dates: _Optional[_Iterable[str]] = ..., share_counts: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class GetShareHolderDetailRequest(_message.Message):
+    __slots__ = ("shareholder_id", "fund")
+    SHAREHOLDER_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_FIELD_NUMBER: _ClassVar[int]
+    shareholder_id: int
+    fund: str
+    def __init__(self, shareholder_id: _Optional[int] = ..., fund: _Optional[str] = ...) -> None: ...
+
+class GetShareHolderDetailResponse(_message.Message):
+    __slots__ = ("shareholder_name", "share_holder_histories", "chart_data")
+    SHAREHOLDER_NAME_FIELD_NUMBER: _ClassVar[int]
+    SHARE_HOLDER_HISTORIES_FIELD_NUMBER: _ClassVar[int]
+    CHART_DATA_FIELD_NUMBER: _ClassVar[int]
+    shareholder_name: str
+    share_holder_histories: _containers.RepeatedCompositeFieldContainer[ShareHolderFundHistory]
+    chart_data: _containers.RepeatedCompositeFieldContainer[ShareHolderFundChart]
+    def __init__(self, shareholder_name: _Optional[str] = ..., share_holder_histories: _Optional[_Iterable[_Union[ShareHolderFundHistory, _Mapping]]] = ..., chart_data: _Optional[_Iterable[_Union[ShareHolderFundChart, _Mapping]]] = ...) -> None: ...
+
+class ShareHolderDetailHeader(_message.Message):
+    __slots__ = ("shareholder_name",)
+    SHAREHOLDER_NAME_FIELD_NUMBER: _ClassVar[int]
+    shareholder_name: str
+    def __init__(self, shareholder_name: _Optional[str] = ...) -> None: ...
+
+class ShareHolderDetailChunk(_message.Message):
+    __slots__ = ("header", "history", "chart")
+    HEADER_FIELD_NUMBER: _ClassVar[int]
+    HISTORY_FIELD_NUMBER: _ClassVar[int]
+    CHART_FIELD_NUMBER: _ClassVar[int]
+    header: ShareHolderDetailHeader
+    history: ShareHolderFundHistory
+    chart: ShareHolderFundChart
+    def __init__(self, header: _Optional[_Union[ShareHolderDetailHeader, _Mapping]] = ..., history: _Optional[_Union[ShareHolderFundHistory, _Mapping]] = ..., chart: _Optional[_Union[ShareHolderFundChart, _Mapping]] = ...) -> None: ...
+
+class BatchGetShareHolderDetailRequest(_message.Message):
+    __slots__ = ("shareholder_ids", "fund")
+    SHAREHOLDER_IDS_FIELD_NUMBER: _ClassVar[int]
+    FUND_FIELD_NUMBER: _ClassVar[int]
+    shareholder_ids: _containers.RepeatedScalarFieldContainer[int]
+    fund: str
+    def __init__(self, shareholder_ids: _Optional[_Iterable[int]] = ..., fund: _Optional[str] = ...) -> None: ...
+
+class ShareHolderDetailBatchItem(_message.Message):
+    __slots__ = ("shareholder_id", "detail")
+    SHAREHOLDER_ID_FIELD_NUMBER: _ClassVar[int]
+    DETAIL_FIELD_NUMBER: _ClassVar[int]
+    shareholder_id: int
+    detail: GetShareHolderDetailResponse
+    def __init__(self, shareholder_id: _Optional[int] = ..., detail: _Optional[_Union[GetShareHolderDetailResponse, _Mapping]] = ...) -> None: ...
+
+class ExportShareHolderExcelRequest(_message.Message):
+    __slots__ = ("shareholder_id", "fund")
+    SHAREHOLDER_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_FIELD_NUMBER: _ClassVar[int]
+    shareholder_id: int
+    fund: str
+    def __init__(self, shareholder_id: _Optional[int] = ..., fund: _Optional[str] = ...) -> None: ...
+
+class ExportShareHolderExcelResponse(_message.Message):
+    __slots__ = ("excel_file", "file_name")
+    EXCEL_FILE_FIELD_NUMBER: _ClassVar[int]
+    FILE_NAME_FIELD_NUMBER: _ClassVar[int]
+    excel_file: bytes
+    file_name: str
+    def __init__(self, excel_file: _Optional[bytes] = ..., file_name: _Optional[str] = ...) -> None: ...
+
+class ExportShareHolderParquetResponse(_message.Message):
+    __slots__ = ("parquet_file", "file_name")
+    PARQUET_FILE_FIELD_NUMBER: _ClassVar[int]
+    FILE_NAME_FIELD_NUMBER: _ClassVar[int]
+    parquet_file: bytes
+    file_name: str
+    def __init__(self, parquet_file: _Optional[bytes] = ..., file_name: _Optional[str] = ...) -> None: ...
+
+class GetShareHolderRecordsResponse(_message.Message):
+    __slots__ = ("fund_ids", "funds", "fund_types", "share_counts", "values", "pct_of_shares", "dates")
+    FUND_IDS_FIELD_NUMBER: _ClassVar[int]
+    FUNDS_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPES_FIELD_NUMBER: _ClassVar[int]
+    SHARE_COUNTS_FIELD_NUMBER: _ClassVar[int]
+    VALUES_FIELD_NUMBER: _ClassVar[int]
+    PCT_OF_SHARES_FIELD_NUMBER: _ClassVar[int]
+    DATES_FIELD_NUMBER: _ClassVar[int]
+    fund_ids: _containers.RepeatedScalarFieldContainer[str]
+    funds: _containers.RepeatedScalarFieldContainer[str]
+    fund_types: _containers.RepeatedScalarFieldContainer[str]
+    share_counts: _containers.RepeatedScalarFieldContainer[int]
+    values: _containers.RepeatedScalarFieldContainer[float]
+    pct_of_shares: _containers.RepeatedScalarFieldContainer[float]
+    dates: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, fund_ids: _Optional[_Iterable[str]] = ..., funds: _Optional[_Iterable[str]] = ..., fund_types: _Optional[_Iterable[str]] = ..., share_counts: _Optional[_Iterable[int]] = ..., values: _Optional[_Iterable[float]] = ..., pct_of_shares: _Optional[_Iterable[float]] = ..., dates: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class ExportShareHolderExcelChunk(_message.Message):
+    __slots__ = ("chunk", "file_name", "last")
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    FILE_NAME_FIELD_NUMBER: _ClassVar[int]
+    LAST_FIELD_NUMBER: _ClassVar[int]
+    chunk: bytes
+    file_name: str
+    last: bool
+    def __init__(self, chunk: _Optional[bytes] = ..., file_name: _Optional[str] = ..., last: bool = ...) -> None: ...
+
+class GetFundTypesRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class FundType(_message.Message):
+    __slots__ = ("id", "name")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    name: str
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ...) -> None: ...
+
+class GetFundTypesResponse(_message.Message):
+    __slots__ = ("fund_types",)
+    FUND_TYPES_FIELD_NUMBER: _ClassVar[int]
+    fund_types: _containers.RepeatedCompositeFieldContainer[FundType]
+    def __init__(self, fund_types: _Optional[_Iterable[_Union[FundType, _Mapping]]] = ...) -> None: ...
+
+class ListCashFlowsRequest(_message.Message):
+    __slots__ = ("start_date", "end_date", "institute_kind", "limit", "offset")
+    START_DATE_FIELD_NUMBER: _ClassVar[int]
+    END_DATE_FIELD_NUMBER: _ClassVar[int]
+    INSTITUTE_KIND_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    start_date: str
+    end_date: str
+    institute_kind: str
+    limit: int
+    offset: int
+    def __init__(self, start_date: _Optional[str] = ..., end_date: _Optional[str] = ..., institute_kind: _Optional[str] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+
+class CashFlowItem(_message.Message):
+    __slots__ = ("cash_flow", "in_flow", "out_flow", "profits", "fund_name", "fund_type", "fund_id", "symbol", "institute_kind")
+    CASH_FLOW_FIELD_NUMBER: _ClassVar[int]
+    IN_FLOW_FIELD_NUMBER: _ClassVar[int]
+    OUT_FLOW_FIELD_NUMBER: _ClassVar[int]
+    PROFITS_FIELD_NUMBER: _ClassVar[int]
+    FUND_NAME_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    SYMBOL_FIELD_NUMBER: _ClassVar[int]
+    INSTITUTE_KIND_FIELD_NUMBER: _ClassVar[int]
+    cash_flow: float
+    in_flow: float
+    out_flow: float
+    profits: float
+    fund_name: str
+    fund_type: str
+    fund_id: int
+    symbol: str
+    institute_kind: str
+    def __init__(self, cash_flow: _Optional[float] = ..., in_flow: _Optional[float] = ..., out_flow: _Optional[float] = ..., profits: _Optional[float] = ..., fund_name: _Optional[str] = ..., fund_type: _Optional[str] = ..., fund_id: _Optional[int] = ..., symbol: _Optional[str] = ..., institute_kind: _Optional[str] = ...) -> None: ...
+
+class ListCashFlowsResponse(_message.Message):
+    __slots__ = ("cash_flows", "total")
+    CASH_FLOWS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FIELD_NUMBER: _ClassVar[int]
+    cash_flows: _containers.RepeatedCompositeFieldContainer[CashFlowItem]
+    total: int
+    def __init__(self, cash_flows: _Optional[_Iterable[_Union[CashFlowItem, _Mapping]]] = ..., total: _Optional[int] = ...) -> None: ...
+
+class GetCashFlowDetailRequest(_message.Message):
+    __slots__ = ("fund_id", "start_date", "end_date", "fund_type", "institute_kind")
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    START_DATE_FIELD_NUMBER: _ClassVar[int]
+    END_DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    INSTITUTE_KIND_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    start_date: str
+    end_date: str
+    fund_type: str
+    institute_kind: str
+    def __init__(self, fund_id: _Optional[int] = ..., start_date: _Optional[str] = ..., end_date: _Optional[str] = ..., fund_type: _Optional[str] = ..., institute_kind: _Optional[str] = ...) -> None: ...
+
+class CashFlowDetailItem(_message.Message):
+    __slots__ = ("cash_flow", "in_flow", "out_flow", "total_units", "purchase", "redemption", "issued_units", "revoked_units", "fund_name", "fund_type", "fund_id", "symbol", "date")
+    CASH_FLOW_FIELD_NUMBER: _ClassVar[int]
+    IN_FLOW_FIELD_NUMBER: _ClassVar[int]
+    OUT_FLOW_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_UNITS_FIELD_NUMBER: _ClassVar[int]
+    PURCHASE_FIELD_NUMBER: _ClassVar[int]
+    REDEMPTION_FIELD_NUMBER: _ClassVar[int]
+    ISSUED_UNITS_FIELD_NUMBER: _ClassVar[int]
+    REVOKED_UNITS_FIELD_NUMBER: _ClassVar[int]
+    FUND_NAME_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    SYMBOL_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    cash_flow: float
+    in_flow: float
+    out_flow: float
+    total_units: float
+    purchase: float
+    redemption: float
+    issued_units: float
+    revoked_units: float
+    fund_name: str
+    fund_type: str
+    fund_id: int
+    symbol: str
+    date: str
+    def __init__(self, cash_flow: _Optional[float] = ..., in_flow: _Optional[float] = ..., out_flow: _Optional[float] = ..., total_units: _Optional[float] = ..., purchase: _Optional[float] = ..., redemption: _Optional[float] = ..., issued_units: _Optional[float] = ..., revoked_units: _Optional[float] = ..., fund_name: _Optional[str] = ..., fund_type: _Optional[str] = ..., fund_id: _Optional[int] = ..., symbol: _Optional[str] = ..., date: _Optional[str] = ...) -> None: ...
+
+class GetCashFlowDetailResponse(_message.Message):
+    __slots__ = ("cash_flows",)
+    CASH_FLOWS_FIELD_NUMBER: _ClassVar[int]
+    cash_flows: _containers.RepeatedCompositeFieldContainer[CashFlowDetailItem]
+    def __init__(self, cash_flows: _Optional[_Iterable[_Union[CashFlowDetailItem, _Mapping]]] = ...) -> None: ...
+
+class ListTotalReturnsRequest(_message.Message):
+    __slots__ = ("fund_type", "fund_id", "institute_kind", "date", "limit", "offset")
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    INSTITUTE_KIND_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    fund_type: str
+    fund_id: int
+    institute_kind: str
+    date: str
+    limit: int
+    offset: int
+    def __init__(self, fund_type: _Optional[str] = ..., fund_id: _Optional[int] = ..., institute_kind: _Optional[str] = ..., date: _Optional[str] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+
+class TotalReturnItem(_message.Message):
+    __slots__ = ("id", "date", "fund_id", "fund_name", "fund_type", "institute_kind", "last_nav", "last_nav_date", "last_price", "last_price_date", "has_profit", "has_split", "total_units", "bubble", "thirty", "ninety", "one_eighty", "three_sixty")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_NAME_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    INSTITUTE_KIND_FIELD_NUMBER: _ClassVar[int]
+    LAST_NAV_FIELD_NUMBER: _ClassVar[int]
+    LAST_NAV_DATE_FIELD_NUMBER: _ClassVar[int]
+    LAST_PRICE_FIELD_NUMBER: _ClassVar[int]
+    LAST_PRICE_DATE_FIELD_NUMBER: _ClassVar[int]
+    HAS_PROFIT_FIELD_NUMBER: _ClassVar[int]
+    HAS_SPLIT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_UNITS_FIELD_NUMBER: _ClassVar[int]
+    BUBBLE_FIELD_NUMBER: _ClassVar[int]
+    THIRTY_FIELD_NUMBER: _ClassVar[int]
+    NINETY_FIELD_NUMBER: _ClassVar[int]
+    ONE_EIGHTY_FIELD_NUMBER: _ClassVar[int]
+    THREE_SIXTY_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    date: str
+    fund_id: int
+    fund_name: str
+    fund_type: str
+    institute_kind: str
+    last_nav: float
+    last_nav_date: str
+    last_price: float
+    last_price_date: str
+    has_profit: bool
+    has_split: bool
+    total_units: float
+    bubble: float
+    thirty: float
+    ninety: float
+    one_eighty: float
+    three_sixty: float
+    def __init__(self, id: _Optional[int] = ..., date: _Optional[str] = ..., fund_id: _Optional[int] = ..., fund_name: _Optional[str] = ..., fund_type: _Optional[str] = ..., institute_kind: _Optional[str] = ..., last_nav: _Optional[float] = ..., last_nav_date: _Optional[str] = ..., last_price: _Optional[float] = ..., last_price_date: _Optional[str] = ..., has_profit: bool = ..., has_split: bool = ..., total_units: _Optional[float] = ..., bubble: _Optional[float] = ..., thirty: _Optional[float] = ..., ninety: _Optional[float] = ..., one_eighty: _Optional[float] = ..., three_sixty: _Optional[float] = ...) -> None: ...
+
+class ListTotalReturnsResponse(_message.Message):
+    __slots__ = ("returns", "total")
+    RETURNS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FIELD_NUMBER: _ClassVar[int]
+    returns: _containers.RepeatedCompositeFieldContainer[TotalReturnItem]
+    total: int
+    def __init__(self, returns: _Optional[_Iterable[_Union[TotalReturnItem, _Mapping]]] = ..., total: _Optional[int] = ...) -> None: ...
+
+class ListEtfReturnsRequest(_message.Message):
+    __slots__ = ("fund_id", "institute_kind", "date", "limit", "offset")
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    INSTITUTE_KIND_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    LIMIT_FIELD_NUMBER: _ClassVar[int]
+    OFFSET_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    institute_kind: str
+    date: str
+    limit: int
+    offset: int
+    def __init__(self, fund_id: _Optional[int] = ..., institute_kind: _Optional[str] = ..., date: _Optional[str] = ..., limit: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+
+class EtfReturnItem(_message.Message):
+    __slots__ = ("id", "date", "fund_id", "fund_name", "fund_type", "institute_kind", "last_nav", "last_nav_date", "last_price", "last_price_date", "has_profit", "has_split", "total_units", "bubble", "thirty", "ninety", "one_eighty", "three_sixty")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    FUND_NAME_FIELD_NUMBER: _ClassVar[int]
+    FUND_TYPE_FIELD_NUMBER: _ClassVar[int]
+    INSTITUTE_KIND_FIELD_NUMBER: _ClassVar[int]
+    LAST_NAV_FIELD_NUMBER: _ClassVar[int]
+    LAST_NAV_DATE_FIELD_NUMBER: _ClassVar[int]
+    LAST_PRICE_FIELD_NUMBER: _ClassVar[int]
+    LAST_PRICE_DATE_FIELD_NUMBER: _ClassVar[int]
+    HAS_PROFIT_FIELD_NUMBER: _ClassVar[int]
+    HAS_SPLIT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_UNITS_FIELD_NUMBER: _ClassVar[int]
+    BUBBLE_FIELD_NUMBER: _ClassVar[int]
+    THIRTY_FIELD_NUMBER: _ClassVar[int]
+    NINETY_FIELD_NUMBER: _ClassVar[int]
+    ONE_EIGHTY_FIELD_NUMBER: _ClassVar[int]
+    THREE_SIXTY_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    date: str
+    fund_id: int
+    fund_name: str
+    fund_type: str
+    institute_kind: str
+    last_nav: float
+    last_nav_date: str
+    last_price: float
+    last_price_date: str
+    has_profit: bool
+    has_split: bool
+    total_units: float
+    bubble: float
+    thirty: float
+    ninety: float
+    one_eighty: float
+    three_sixty: float
+    def __init__(self, id: _Optional[int] = ..., date: _Optional[str] = ..., fund_id: _Optional[int] = ..., fund_name: _Optional[str] = ..., fund_type: _Optional[str] = ..., institute_kind: _Optional[str] = ..., last_nav: _Optional[float] = ..., last_nav_date: _Optional[str] = ..., last_price: _Optional[float] = ..., last_price_date: _Optional[str] = ..., has_profit: bool = ..., has_split: bool = ..., total_units: _Optional[float] = ..., bubble: _Optional[float] = ..., thirty: _Optional[float] = ..., ninety: _Optional[float] = ..., one_eighty: _Optional[float] = ..., three_sixty: _Optional[float] = ...) -> None: ...
+
+class ListEtfReturnsResponse(_message.Message):
+    __slots__ = ("returns", "total")
+    RETURNS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_FIELD_NUMBER: _ClassVar[int]
+    returns: _containers.RepeatedCompositeFieldContainer[EtfReturnItem]
+    total: int
+    def __init__(self, returns: _Optional[_Iterable[_Union[EtfReturnItem, _Mapping]]] = ..., total: _Optional[int] = ...) -> None: ...
+
+class GetNavTrendRequest(_message.Message):
+    __slots__ = ("fund_id",)
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    def __init__(self, fund_id: _Optional[int] = ...) -> None: ...
+
+class NavDataItem(_message.Message):
+    __slots__ = ("purchase", "redemption", "statistical", "preferred_purchase", "preferred_redemption", "common")
+    PURCHASE_FIELD_NUMBER: _ClassVar[int]
+    REDEMPTION_FIELD_NUMBER: _ClassVar[int]
+    STATISTICAL_FIELD_NUMBER: _ClassVar[int]
+    PREFERRED_PURCHASE_FIELD_NUMBER: _ClassVar[int]
+    PREFERRED_REDEMPTION_FIELD_NUMBER: _ClassVar[int]
+    COMMON_FIELD_NUMBER: _ClassVar[int]
+    purchase: float
+    redemption: float
+    statistical: float
+    preferred_purchase: float
+    preferred_redemption: float
+    common: float
+    def __init__(self, purchase: _Optional[float] = ..., redemption: _Optional[float] = ..., statistical: _Optional[float] = ..., preferred_purchase: _Optional[float] = ..., preferred_redemption: _Optional[float] = ..., common: _Optional[float] = ...) -> None: ...
+
+class NavTrendItem(_message.Message):
+    __slots__ = ("net_asset_value", "date", "nav_data")
+    NET_ASSET_VALUE_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    NAV_DATA_FIELD_NUMBER: _ClassVar[int]
+    net_asset_value: float
+    date: str
+    nav_data: NavDataItem
+    def __init__(self, net_asset_value: _Optional[float] = ..., date: _Optional[str] = ..., nav_data: _Optional[_Union[NavDataItem, _Mapping]] = ...) -> None: ...
+
+class NavTrendChartData(_message.Message):
+    __slots__ = ("dates", "statisticals", "purchases", "redemptions")
+    DATES_FIELD_NUMBER: _ClassVar[int]
+    STATISTICALS_FIELD_NUMBER: _ClassVar[int]
+    PURCHASES_FIELD_NUMBER: _ClassVar[int]
+    REDEMPTIONS_FIELD_NUMBER: _ClassVar[int]
+    dates: _containers.RepeatedScalarFieldContainer[str]
+    statisticals: _containers.RepeatedScalarFieldContainer[float]
+    purchases: _containers.RepeatedScalarFieldContainer[float]
+    redemptions: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(self, dates: _Optional[_Iterable[str]] = ..., statisticals: _Optional[_Iterable[float]] = ..., purchases: _Optional[_Iterable[float]] = ..., redemptions: _Optional[_Iterable[float]] = ...) -> None: ...
+
+class GetNavTrendResponse(_message.Message):
+    __slots__ = ("nav_trend", "chart_data")
+    NAV_TREND_FIELD_NUMBER: _ClassVar[int]
+    CHART_DATA_FIELD_NUMBER: _ClassVar[int]
+    nav_trend: _containers.RepeatedCompositeFieldContainer[NavTrendItem]
+    chart_data: NavTrendChartData
+    def __init__(self, nav_trend: _Optional[_Iterable[_Union[NavTrendItem, _Mapping]]] = ..., chart_data: _Optional[_Union[NavTrendChartData, _Mapping]] = ...) -> None: ...
+
+class GetSplitsRequest(_message.Message):
+    __slots__ = ("fund_id",)
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    def __init__(self, fund_id: _Optional[int] = ...) -> None: ...
+
+class SplitItem(_message.Message):
+    __slots__ = ("date", "units_ratio")
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    UNITS_RATIO_FIELD_NUMBER: _ClassVar[int]
+    date: str
+    units_ratio: float
+    def __init__(self, date: _Optional[str] = ..., units_ratio: _Optional[float] = ...) -> None: ...
+
+class GetSplitsResponse(_message.Message):
+    __slots__ = ("splits",)
+    SPLITS_FIELD_NUMBER: _ClassVar[int]
+    splits: _containers.RepeatedCompositeFieldContainer[SplitItem]
+    def __init__(self, splits: _Optional[_Iterable[_Union[SplitItem, _Mapping]]] = ...) -> None: ...
+
+class GetProfitsRequest(_message.Message):
+    __slots__ = ("fund_id",)
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    def __init__(self, fund_id: _Optional[int] = ...) -> None: ...
+
+class ProfitItem(_message.Message):
+    __slots__ = ("profit", "date")
+    PROFIT_FIELD_NUMBER: _ClassVar[int]
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    profit: float
+    date: str
+    def __init__(self, profit: _Optional[float] = ..., date: _Optional[str] = ...) -> None: ...
+
+class GetProfitsResponse(_message.Message):
+    __slots__ = ("profits",)
+    PROFITS_FIELD_NUMBER: _ClassVar[int]
+    profits: _containers.RepeatedCompositeFieldContainer[ProfitItem]
+    def __init__(self, profits: _Optional[_Iterable[_Union[ProfitItem, _Mapping]]] = ...) -> None: ...
+
+class GetPricesRequest(_message.Message):
+    __slots__ = ("fund_id",)
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    def __init__(self, fund_id: _Optional[int] = ...) -> None: ...
+
+class PriceItem(_message.Message):
+    __slots__ = ("date", "price")
+    DATE_FIELD_NUMBER: _ClassVar[int]
+    PRICE_FIELD_NUMBER: _ClassVar[int]
+    date: str
+    price: float
+    def __init__(self, date: _Optional[str] = ..., price: _Optional[float] = ...) -> None: ...
+
+class GetPricesResponse(_message.Message):
+    __slots__ = ("prices",)
+    PRICES_FIELD_NUMBER: _ClassVar[int]
+    prices: _containers.RepeatedCompositeFieldContainer[PriceItem]
+    def __init__(self, prices: _Optional[_Iterable[_Union[PriceItem, _Mapping]]] = ...) -> None: ...
+
+class GetFundBundleRequest(_message.Message):
+    __slots__ = ("fund_id", "skip_nav_trend", "skip_splits", "skip_profits", "skip_prices")
+    FUND_ID_FIELD_NUMBER: _ClassVar[int]
+    SKIP_NAV_TREND_FIELD_NUMBER: _ClassVar[int]
+    SKIP_SPLITS_FIELD_NUMBER: _ClassVar[int]
+    SKIP_PROFITS_FIELD_NUMBER: _ClassVar[int]
+    SKIP_PRICES_FIELD_NUMBER: _ClassVar[int]
+    fund_id: int
+    skip_nav_trend: bool
+    skip_splits: bool
+    skip_profits: bool
+    skip_prices: bool
+    def __init__(self, fund_id: _Optional[int] = ..., skip_nav_trend: bool = ..., skip_splits: bool = ..., skip_profits: bool = ..., skip_prices: bool = ...) -> None: ...
+
+class GetFundBundleResponse(_message.Message):
+    __slots__ = ("nav_trend", "splits", "profits", "prices")
+    NAV_TREND_FIELD_NUMBER: _ClassVar[int]
+    SPLITS_FIELD_NUMBER: _ClassVar[int]
+    PROFITS_FIELD_NUMBER: _ClassVar[int]
+    PRICES_FIELD_NUMBER: _ClassVar[int]
+    nav_trend: GetNavTrendResponse
+    splits: _containers.RepeatedCompositeFieldContainer[SplitItem]
+    profits: _containers.RepeatedCompositeFieldContainer[ProfitItem]
+    prices: _containers.RepeatedCompositeFieldContainer[PriceItem]
+    def __init__(self, nav_trend: _Optional[_Union[GetNavTrendResponse, _Mapping]] = ..., splits: _Optional[_Iterable[_Union[SplitItem, _Mapping]]] = ..., profits: _Optional[_Iterable[_Union[ProfitItem, _Mapping]]] = ..., prices: _Optional[_Iterable[_Union[PriceItem, _Mapping]]] = ...) -> None: ...
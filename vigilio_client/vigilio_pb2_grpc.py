@@ -49,6 +49,11 @@ class VigilioServiceStub(object):
                 request_serializer=vigilio__pb2.ShareHolderSummaryListRequest.SerializeToString,
                 response_deserializer=vigilio__pb2.ShareHolderSummaryListResponse.FromString,
                 _registered_method=True)
+        self.ShareHoldersSummaryColumns = channel.unary_unary(
+                '/vigilio.VigilioService/ShareHoldersSummaryColumns',
+                request_serializer=vigilio__pb2.ShareHolderSummaryListRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ShareHolderSummaryColumnsResponse.FromString,
+                _registered_method=True)
         self.GetShareHolderForDate = channel.unary_unary(
                 '/vigilio.VigilioService/GetShareHolderForDate',
                 request_serializer=vigilio__pb2.ShareHolderForDateRequest.SerializeToString,
@@ -64,11 +69,31 @@ class VigilioServiceStub(object):
                 request_serializer=vigilio__pb2.GetShareHolderDetailRequest.SerializeToString,
                 response_deserializer=vigilio__pb2.GetShareHolderDetailResponse.FromString,
                 _registered_method=True)
+        self.StreamShareHolderDetail = channel.unary_stream(
+                '/vigilio.VigilioService/StreamShareHolderDetail',
+                request_serializer=vigilio__pb2.GetShareHolderDetailRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ShareHolderDetailChunk.FromString,
+                _registered_method=True)
+        self.BatchGetShareHolderDetail = channel.unary_stream(
+                '/vigilio.VigilioService/BatchGetShareHolderDetail',
+                request_serializer=vigilio__pb2.BatchGetShareHolderDetailRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ShareHolderDetailBatchItem.FromString,
+                _registered_method=True)
         self.ExportShareHolderExcel = channel.unary_unary(
                 '/vigilio.VigilioService/ExportShareHolderExcel',
                 request_serializer=vigilio__pb2.ExportShareHolderExcelRequest.SerializeToString,
                 response_deserializer=vigilio__pb2.ExportShareHolderExcelResponse.FromString,
                 _registered_method=True)
+        self.ExportShareHolderParquet = channel.unary_unary(
+                '/vigilio.VigilioService/ExportShareHolderParquet',
+                request_serializer=vigilio__pb2.ExportShareHolderExcelRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ExportShareHolderParquetResponse.FromString,
+                _registered_method=True)
+        self.GetShareHolderRecords = channel.unary_unary(
+                '/vigilio.VigilioService/GetShareHolderRecords',
+                request_serializer=vigilio__pb2.ExportShareHolderExcelRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.GetShareHolderRecordsResponse.FromString,
+                _registered_method=True)
         self.ListCashFlows = channel.unary_unary(
                 '/vigilio.VigilioService/ListCashFlows',
                 request_serializer=vigilio__pb2.ListCashFlowsRequest.SerializeToString,
@@ -109,6 +134,46 @@ class VigilioServiceStub(object):
                 request_serializer=vigilio__pb2.GetPricesRequest.SerializeToString,
                 response_deserializer=vigilio__pb2.GetPricesResponse.FromString,
                 _registered_method=True)
+        self.GetFundBundle = channel.unary_unary(
+                '/vigilio.VigilioService/GetFundBundle',
+                request_serializer=vigilio__pb2.GetFundBundleRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.GetFundBundleResponse.FromString,
+                _registered_method=True)
+        self.StreamListShareHolders = channel.unary_stream(
+                '/vigilio.VigilioService/StreamListShareHolders',
+                request_serializer=vigilio__pb2.ShareHolderListRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ShareHolderListResponse.FromString,
+                _registered_method=True)
+        self.StreamShareHoldersSummary = channel.unary_stream(
+                '/vigilio.VigilioService/StreamShareHoldersSummary',
+                request_serializer=vigilio__pb2.ShareHolderSummaryListRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ShareHolderSummaryListResponse.FromString,
+                _registered_method=True)
+        self.StreamListCashFlows = channel.unary_stream(
+                '/vigilio.VigilioService/StreamListCashFlows',
+                request_serializer=vigilio__pb2.ListCashFlowsRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ListCashFlowsResponse.FromString,
+                _registered_method=True)
+        self.StreamListTotalReturns = channel.unary_stream(
+                '/vigilio.VigilioService/StreamListTotalReturns',
+                request_serializer=vigilio__pb2.ListTotalReturnsRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ListTotalReturnsResponse.FromString,
+                _registered_method=True)
+        self.StreamListEtfReturns = channel.unary_stream(
+                '/vigilio.VigilioService/StreamListEtfReturns',
+                request_serializer=vigilio__pb2.ListEtfReturnsRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ListEtfReturnsResponse.FromString,
+                _registered_method=True)
+        self.StreamExportShareHoldersSummaryExcel = channel.unary_stream(
+                '/vigilio.VigilioService/StreamExportShareHoldersSummaryExcel',
+                request_serializer=vigilio__pb2.ShareHolderSummaryExportRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ExportShareHolderExcelChunk.FromString,
+                _registered_method=True)
+        self.StreamExportShareHolderExcel = channel.unary_stream(
+                '/vigilio.VigilioService/StreamExportShareHolderExcel',
+                request_serializer=vigilio__pb2.ExportShareHolderExcelRequest.SerializeToString,
+                response_deserializer=vigilio__pb2.ExportShareHolderExcelChunk.FromString,
+                _registered_method=True)
 
 
 class VigilioServiceServicer(object):
@@ -132,6 +197,12 @@ class VigilioServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ShareHoldersSummaryColumns(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetShareHolderForDate(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -150,12 +221,36 @@ class VigilioServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamShareHolderDetail(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGetShareHolderDetail(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ExportShareHolderExcel(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ExportShareHolderParquet(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetShareHolderRecords(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def ListCashFlows(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -204,6 +299,56 @@ class VigilioServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetFundBundle(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamListShareHolders(self, request, context):
+        """Server-streaming variants of the large list RPCs; each message carries one batch of rows
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamShareHoldersSummary(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamListCashFlows(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamListTotalReturns(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamListEtfReturns(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamExportShareHoldersSummaryExcel(self, request, context):
+        """Server-streaming Excel exports, written to disk chunk by chunk
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamExportShareHolderExcel(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_VigilioServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -222,6 +367,11 @@ def add_VigilioServiceServicer_to_server(servicer, server):
                     request_deserializer=vigilio__pb2.ShareHolderSummaryListRequest.FromString,
                     response_serializer=vigilio__pb2.ShareHolderSummaryListResponse.SerializeToString,
             ),
+            'ShareHoldersSummaryColumns': grpc.unary_unary_rpc_method_handler(
+                    servicer.ShareHoldersSummaryColumns,
+                    request_deserializer=vigilio__pb2.ShareHolderSummaryListRequest.FromString,
+                    response_serializer=vigilio__pb2.ShareHolderSummaryColumnsResponse.SerializeToString,
+            ),
             'GetShareHolderForDate': grpc.unary_unary_rpc_method_handler(
                     servicer.GetShareHolderForDate,
                     request_deserializer=vigilio__pb2.ShareHolderForDateRequest.FromString,
@@ -237,11 +387,31 @@ def add_VigilioServiceServicer_to_server(servicer, server):
                     request_deserializer=vigilio__pb2.GetShareHolderDetailRequest.FromString,
                     response_serializer=vigilio__pb2.GetShareHolderDetailResponse.SerializeToString,
             ),
+            'StreamShareHolderDetail': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamShareHolderDetail,
+                    request_deserializer=vigilio__pb2.GetShareHolderDetailRequest.FromString,
+                    response_serializer=vigilio__pb2.ShareHolderDetailChunk.SerializeToString,
+            ),
+            'BatchGetShareHolderDetail': grpc.unary_stream_rpc_method_handler(
+                    servicer.BatchGetShareHolderDetail,
+                    request_deserializer=vigilio__pb2.BatchGetShareHolderDetailRequest.FromString,
+                    response_serializer=vigilio__pb2.ShareHolderDetailBatchItem.SerializeToString,
+            ),
             'ExportShareHolderExcel': grpc.unary_unary_rpc_method_handler(
                     servicer.ExportShareHolderExcel,
                     request_deserializer=vigilio__pb2.ExportShareHolderExcelRequest.FromString,
                     response_serializer=vigilio__pb2.ExportShareHolderExcelResponse.SerializeToString,
             ),
+            'ExportShareHolderParquet': grpc.unary_unary_rpc_method_handler(
+                    servicer.ExportShareHolderParquet,
+                    request_deserializer=vigilio__pb2.ExportShareHolderExcelRequest.FromString,
+                    response_serializer=vigilio__pb2.ExportShareHolderParquetResponse.SerializeToString,
+            ),
+            'GetShareHolderRecords': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetShareHolderRecords,
+                    request_deserializer=vigilio__pb2.ExportShareHolderExcelRequest.FromString,
+                    response_serializer=vigilio__pb2.GetShareHolderRecordsResponse.SerializeToString,
+            ),
             'ListCashFlows': grpc.unary_unary_rpc_method_handler(
                     servicer.ListCashFlows,
                     request_deserializer=vigilio__pb2.ListCashFlowsRequest.FromString,
@@ -282,6 +452,46 @@ def add_VigilioServiceServicer_to_server(servicer, server):
                     request_deserializer=vigilio__pb2.GetPricesRequest.FromString,
                     response_serializer=vigilio__pb2.GetPricesResponse.SerializeToString,
             ),
+            'GetFundBundle': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFundBundle,
+                    request_deserializer=vigilio__pb2.GetFundBundleRequest.FromString,
+                    response_serializer=vigilio__pb2.GetFundBundleResponse.SerializeToString,
+            ),
+            'StreamListShareHolders': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamListShareHolders,
+                    request_deserializer=vigilio__pb2.ShareHolderListRequest.FromString,
+                    response_serializer=vigilio__pb2.ShareHolderListResponse.SerializeToString,
+            ),
+            'StreamShareHoldersSummary': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamShareHoldersSummary,
+                    request_deserializer=vigilio__pb2.ShareHolderSummaryListRequest.FromString,
+                    response_serializer=vigilio__pb2.ShareHolderSummaryListResponse.SerializeToString,
+            ),
+            'StreamListCashFlows': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamListCashFlows,
+                    request_deserializer=vigilio__pb2.ListCashFlowsRequest.FromString,
+                    response_serializer=vigilio__pb2.ListCashFlowsResponse.SerializeToString,
+            ),
+            'StreamListTotalReturns': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamListTotalReturns,
+                    request_deserializer=vigilio__pb2.ListTotalReturnsRequest.FromString,
+                    response_serializer=vigilio__pb2.ListTotalReturnsResponse.SerializeToString,
+            ),
+            'StreamListEtfReturns': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamListEtfReturns,
+                    request_deserializer=vigilio__pb2.ListEtfReturnsRequest.FromString,
+                    response_serializer=vigilio__pb2.ListEtfReturnsResponse.SerializeToString,
+            ),
+            'StreamExportShareHoldersSummaryExcel': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamExportShareHoldersSummaryExcel,
+                    request_deserializer=vigilio__pb2.ShareHolderSummaryExportRequest.FromString,
+                    response_serializer=vigilio__pb2.ExportShareHolderExcelChunk.SerializeToString,
+            ),
+            'StreamExportShareHolderExcel': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamExportShareHolderExcel,
+                    request_deserializer=vigilio__pb2.ExportShareHolderExcelRequest.FromString,
+                    response_serializer=vigilio__pb2.ExportShareHolderExcelChunk.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'vigilio.VigilioService', rpc_method_handlers)
@@ -374,6 +584,33 @@ class VigilioService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ShareHoldersSummaryColumns(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/vigilio.VigilioService/ShareHoldersSummaryColumns',
+            vigilio__pb2.ShareHolderSummaryListRequest.SerializeToString,
+            vigilio__pb2.ShareHolderSummaryColumnsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetShareHolderForDate(request,
             target,
@@ -455,6 +692,60 @@ class VigilioService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def StreamShareHolderDetail(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamShareHolderDetail',
+            vigilio__pb2.GetShareHolderDetailRequest.SerializeToString,
+            vigilio__pb2.ShareHolderDetailChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchGetShareHolderDetail(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/BatchGetShareHolderDetail',
+            vigilio__pb2.BatchGetShareHolderDetailRequest.SerializeToString,
+            vigilio__pb2.ShareHolderDetailBatchItem.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ExportShareHolderExcel(request,
             target,
@@ -482,6 +773,60 @@ class VigilioService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ExportShareHolderParquet(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/vigilio.VigilioService/ExportShareHolderParquet',
+            vigilio__pb2.ExportShareHolderExcelRequest.SerializeToString,
+            vigilio__pb2.ExportShareHolderParquetResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetShareHolderRecords(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/vigilio.VigilioService/GetShareHolderRecords',
+            vigilio__pb2.ExportShareHolderExcelRequest.SerializeToString,
+            vigilio__pb2.GetShareHolderRecordsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def ListCashFlows(request,
             target,
@@ -697,3 +1042,219 @@ class VigilioService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetFundBundle(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/vigilio.VigilioService/GetFundBundle',
+            vigilio__pb2.GetFundBundleRequest.SerializeToString,
+            vigilio__pb2.GetFundBundleResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamListShareHolders(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamListShareHolders',
+            vigilio__pb2.ShareHolderListRequest.SerializeToString,
+            vigilio__pb2.ShareHolderListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamShareHoldersSummary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamShareHoldersSummary',
+            vigilio__pb2.ShareHolderSummaryListRequest.SerializeToString,
+            vigilio__pb2.ShareHolderSummaryListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamListCashFlows(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamListCashFlows',
+            vigilio__pb2.ListCashFlowsRequest.SerializeToString,
+            vigilio__pb2.ListCashFlowsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamListTotalReturns(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamListTotalReturns',
+            vigilio__pb2.ListTotalReturnsRequest.SerializeToString,
+            vigilio__pb2.ListTotalReturnsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamListEtfReturns(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamListEtfReturns',
+            vigilio__pb2.ListEtfReturnsRequest.SerializeToString,
+            vigilio__pb2.ListEtfReturnsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamExportShareHoldersSummaryExcel(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamExportShareHoldersSummaryExcel',
+            vigilio__pb2.ShareHolderSummaryExportRequest.SerializeToString,
+            vigilio__pb2.ExportShareHolderExcelChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamExportShareHolderExcel(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/vigilio.VigilioService/StreamExportShareHolderExcel',
+            vigilio__pb2.ExportShareHolderExcelRequest.SerializeToString,
+            vigilio__pb2.ExportShareHolderExcelChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)